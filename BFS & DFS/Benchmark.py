@@ -0,0 +1,108 @@
+'''
+Benchmark of the node pool behind Queue and Stack (see LinkedList): runs BFS
+over square grids of several sizes, and a bare queue churn (pushes and pops
+around a steady frontier), once allocating a new node per push and once
+reusing popped nodes, and reports for each the throughput and the time the
+garbage collector paused the program.
+
+Usage:
+    python Benchmark.py [--sizes 100 300 600] [--repeats 3] [--prop-blocked 0.2]
+'''
+
+from __future__ import annotations
+from Maze import Maze, NODE_POOL_SIZE
+from Queue import Queue
+import argparse
+import gc
+import random
+import time
+
+################################################################################
+class GcPauses:
+    ''' context manager timing every garbage collection run while it is active,
+        through gc.callbacks
+    '''
+    __slots__ = ('collections', 'total_seconds', 'max_seconds', '_began')
+
+    def __init__(self) -> None:
+        self.collections:   int   = 0
+        self.total_seconds: float = 0.0
+        self.max_seconds:   float = 0.0
+        self._began:        float = 0.0
+
+    def _callback(self, phase: str, info: dict[str, int]) -> None:
+        if phase == "start":
+            self._began = time.perf_counter()
+        else:
+            pause = time.perf_counter() - self._began
+            self.collections += 1
+            self.total_seconds += pause
+            self.max_seconds = max(self.max_seconds, pause)
+
+    def __enter__(self) -> GcPauses:
+        gc.collect()   # start every measurement from the same clean heap
+        gc.callbacks.append(self._callback)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        gc.callbacks.remove(self._callback)
+
+def timeBfs(size: int, prop_blocked: float, pool_size: int, repeats: int) -> tuple[float, GcPauses]:
+    ''' function to time BFS on a size x size maze (the same layout for
+        every pool_size)
+    Returns:
+        a tuple (best seconds per search, GC pauses over all the searches)
+    '''
+    random.seed(size)
+    maze = Maze(size, size, prop_blocked = prop_blocked)
+    best = float('inf')
+    with GcPauses() as pauses:
+        for _ in range(repeats):
+            began = time.perf_counter()
+            maze.bfs(pool_size)
+            best = min(best, time.perf_counter() - began)
+    return best, pauses
+
+def timeChurn(operations: int, frontier: int, pool_size: int) -> tuple[float, GcPauses]:
+    ''' function to time a queue holding a steady frontier of items while
+        operations items pass through it (a push and a pop each)
+    Returns:
+        a tuple (seconds, GC pauses)
+    '''
+    queue = Queue[int](pool_size)
+    for item in range(frontier):
+        queue.push(item)
+    with GcPauses() as pauses:
+        began = time.perf_counter()
+        for item in range(operations):
+            queue.push(item)
+            queue.pop()
+        seconds = time.perf_counter() - began
+    return seconds, pauses
+
+def report(label: str, seconds: float, pauses: GcPauses, work: str) -> None:
+    print(f"{label:<28} {work:>14} {pauses.collections:>6} collections, " +
+          f"GC total {pauses.total_seconds * 1000:7.2f} ms, max {pauses.max_seconds * 1000:6.2f} ms")
+
+###################
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "Benchmark Queue/Stack node pooling")
+    parser.add_argument("--sizes", type = int, nargs = "+", default = [100, 300, 600],
+                        help = "grid side lengths for BFS")
+    parser.add_argument("--repeats", type = int, default = 3, help = "BFS runs per grid")
+    parser.add_argument("--prop-blocked", type = float, default = 0.2)
+    parser.add_argument("--churn", type = int, default = 1_000_000,
+                        help = "items passed through the queue in the churn test")
+    args = parser.parse_args()
+
+    for pool_size in (0, NODE_POOL_SIZE):
+        mode = f"pool {pool_size}" if pool_size else "no pool"
+        for size in args.sizes:
+            seconds, pauses = timeBfs(size, args.prop_blocked, pool_size, args.repeats)
+            report(f"bfs {size}x{size}, {mode}", seconds, pauses,
+                   f"{size * size / seconds / 1e6:.2f} Mcells/s")
+        seconds, pauses = timeChurn(args.churn, 1000, pool_size)
+        report(f"queue churn, {mode}", seconds, pauses, f"{args.churn / seconds / 1e6:.2f} Mops/s")
+
+if __name__ == "__main__":
+    main()
@@ -13,11 +13,43 @@ class Node[T]:
         self.prev: Node[T] = None
 
 class LinkedList[T]:
-    ''' class to implement a doubly-linked linked list '''
-    def __init__(self) -> None:
+    ''' class to implement a doubly-linked linked list; optionally, removed
+        Nodes are kept on a free list and reused by later appends instead of
+        being left for the garbage collector, so a list that grows and shrinks
+        over and over (like a BFS queue) allocates only as many Nodes as it
+        ever holds at once '''
+    def __init__(self, pool_size: int = 0) -> None:
+        ''' initializes an empty linked list
+        Parameters:
+            pool_size: the most removed Nodes to keep for reuse (0, the
+                       default, keeps none)
+        '''
         self._head: Node[T] = None
         self._tail: Node[T] = None
         self._size: int     = 0
+        self._free: Node[T] = None   # removed Nodes kept for reuse, linked by .next
+        self._num_free:  int = 0
+        self._pool_size: int = pool_size
+
+    def _newNode(self, item: T) -> Node[T]:
+        ''' returns a Node holding the given item, reusing a free one if any '''
+        node = self._free
+        if node is None:
+            return Node(item)
+        self._free = node.next
+        self._num_free -= 1
+        node.data = item
+        node.next = None
+        return node
+
+    def _recycle(self, node: Node[T]) -> None:
+        ''' puts a removed Node on the free list, unless the list is full;
+            its data is dropped so the pool keeps no items alive '''
+        if self._num_free < self._pool_size:
+            node.data = node.prev = None
+            node.next = self._free
+            self._free = node
+            self._num_free += 1
 
     def __len__(self) -> int:
         ''' returns the number of elements in the linked list
@@ -36,7 +68,7 @@ class LinkedList[T]:
         if self._size > 0 and not isinstance(item, type(self._head.data)):
             raise TypeError("LinkedList requires consistent types")
         else:
-            new_node = Node(item)
+            new_node = self._newNode(item)
             new_node.next = self._head
             if self._head is not None:
                 self._head.prev = new_node
@@ -57,7 +89,7 @@ class LinkedList[T]:
         if self._size > 0 and not isinstance(item, type(self._tail.data)):
             raise TypeError("LinkedList requires consistent types")
         else:
-            new_node = Node(item)
+            new_node = self._newNode(item)
             if self._tail is not None:
                 self._tail.next = new_node
                 new_node.prev = self._tail
@@ -78,7 +110,8 @@ class LinkedList[T]:
         if self._size == 0:
             raise EmptyError("Cannot popLeft from an empty list")
 
-        value = self._head.data
+        node = self._head
+        value = node.data
 
         if self._head == self._tail:
             self._head = self._tail = None
@@ -86,6 +119,7 @@ class LinkedList[T]:
             self._head = self._head.next
             self._head.prev = None
         self._size -= 1
+        self._recycle(node)
         return value
     
 
@@ -100,7 +134,8 @@ class LinkedList[T]:
         if self._size == 0:
             raise EmptyError("Cannot popRight from an empty list")
 
-        value = self._tail.data
+        node = self._tail
+        value = node.data
 
         if self._head == self._tail:
             self._head = self._tail = None
@@ -108,6 +143,7 @@ class LinkedList[T]:
             self._tail = self._tail.prev
             self._tail.next = None  
         self._size -= 1
+        self._recycle(node)
         return value
 
     def __str__(self):
@@ -186,5 +222,18 @@ def main():
     print("popRight:", l.popRight())
     print("List after popRight x4:", l)
 
+    print("Testing a pooled list")
+    pooled = LinkedList[int](pool_size = 2)
+    for i in range(4):
+        pooled.appendRight(i)
+    first = pooled._head
+    print("PopLeft:", pooled.popLeft(), "| free Nodes:", pooled._num_free, "(Expected: 1)")
+    pooled.appendRight(4)
+    print("Reused the popped Node?", pooled._tail is first, "(Expected: True)")
+    while len(pooled) > 0:
+        pooled.popRight()
+    print("Free Nodes after emptying:", pooled._num_free, "(Expected: 2, the pool size)")
+    print("After reuse:", pooled, "(Expected: head-><-tail)")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -38,6 +38,11 @@ class SearchOrder(Enum):
     NESW   = 2
     RANDOM = 3
 
+# how many popped nodes a search's stack or queue keeps for reuse by later
+# pushes (see LinkedList), so a search allocates about as many nodes as its
+# frontier ever holds rather than one per push
+NODE_POOL_SIZE = 1024
+
 ################################################################################
 class Cell:
     ''' class that allows us to use Cell as a data type -- an ordered triple 
@@ -276,8 +281,11 @@ class Maze:
 
         return neighbors
 
-    def dfs(self) -> Cell | None:
+    def dfs(self, pool_size: int = NODE_POOL_SIZE) -> Cell | None:
         ''' method to perform DFS (using a stack) to implement maze searching
+        Parameters:
+            pool_size: the most popped nodes the stack keeps for reuse (0 to
+                       allocate a new node for every push)
         Returns:
             a Cell object corresponding to the Maze goal, or None if no goal
             can be found
@@ -285,7 +293,7 @@ class Maze:
         start = self.getStart()
         goal = self.getGoal()
 
-        stack = Stack()
+        stack = Stack(pool_size)
         explored = set()
 
         stack.push(start)
@@ -306,8 +314,11 @@ class Maze:
 
         return None
 
-    def bfs(self) -> Cell | None:
+    def bfs(self, pool_size: int = NODE_POOL_SIZE) -> Cell | None:
         ''' method to perform BFS (using a queue) to implement maze searching
+        Parameters:
+            pool_size: the most popped nodes the queue keeps for reuse (0 to
+                       allocate a new node for every push)
         Returns:
             a Cell object corresponding to the Maze goal, or None if no goal
             can be found
@@ -315,7 +326,7 @@ class Maze:
         start = self.getStart()
         goal = self.getGoal()
 
-        queue = Queue()
+        queue = Queue(pool_size)
         explored = set()
 
         queue.push(start)
@@ -6,9 +6,13 @@ from typing import TypeVar, Generic
 T = TypeVar('T')
 
 class Queue(Generic[T]):
-    def __init__ (self):
-        ''' Initializes an empty queue using a linked list'''
-        self._data = LinkedList[T]()
+    def __init__ (self, pool_size: int = 0):
+        ''' Initializes an empty queue using a linked list
+        Parameters:
+            pool_size: the most popped nodes the linked list keeps for reuse
+                       by later pushes (see LinkedList)
+        '''
+        self._data = LinkedList[T](pool_size)
     
     def __len__ (self) -> int:
         '''returns the number of items in the queue
@@ -29,12 +33,10 @@ class Queue(Generic[T]):
         Parameters:
             item: the item to be inserted
         Raises:
-            TypeError if the given item is not of the same type as the existing items
+            TypeError if the given item is not of the same type as the existing
+                items (checked by the linked list)
         '''
-        if self._data._size > 0 and not isinstance(item, type(self.top())):
-            raise TypeError("Queue requires consistent types")
-        else:
-            self._data.appendRight(item)
+        self._data.appendRight(item)
 
     def pop(self) -> T:
         '''removes and returns item at the front of the queue
@@ -65,21 +67,6 @@ class Queue(Generic[T]):
         '''
         return str(self._data)
 
-class Node:
-    def __init__(self, data):
-        '''initializes a Node with the given data
-        Parameters:
-            data: The data to be stored in the Node.
-        '''
-        self.data = data
-        self.next = None
-
-    def __str__(self):    
-        '''returns a string representation of the node's data
-        Returns:
-            str: a string representation of the data contained in the node'''
-        return str(self.data)
-    
 def main():
     q = Queue[int]()
     print(f"Empty?    {q.isEmpty()}")
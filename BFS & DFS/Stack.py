@@ -6,8 +6,8 @@ from typing import TypeVar, Generic
 T = TypeVar('T')
 
 class Stack(Generic[T]):
-    def __init__(self) -> None:
-        self._list = LinkedList[T]()
+    def __init__(self, pool_size: int = 0) -> None:
+        self._list = LinkedList[T](pool_size)
 
     def __len__(self) -> int:
         return self._list.__len__()
@@ -26,7 +26,7 @@ class Stack(Generic[T]):
     def top(self) -> T:
         if self.isEmpty():
             raise EmptyError("Cannot peek at an empty stack")
-        return self._list.top()
+        return self._list.back()
     
     def __str__(self):
         return str(self._list)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+from array import array
+from typing import Callable
+from Position import Position
+from SearchScratch import SearchScratch
+
+################################################################################
+class SearchCancelled(Exception):
+    ''' raised from inside a search whose cancelled check (see BatchSolver.solve)
+        has returned True, abandoning the search part way '''
+
+# how many cells a cancellable search expands between calls to its check
+CANCEL_CHECK_INTERVAL = 4096
+
+################################################################################
+class BatchSolver:
+    ''' class answering shortest-path (BFS) queries over a fixed CSR
+        adjacency, reusing the same scratch arrays (see SearchScratch) for
+        every query; Maze.batchSolver returns one for a Maze's current layout,
+        and num_cols, offsets, and neighbors are what a process pool passes
+        to initBatchWorker to build one in each worker
+    '''
+    __slots__ = ('num_cols', 'offsets', 'neighbors', '_scratch')
+
+    def __init__(self, num_cols: int, offsets: array, neighbors: array):
+        self.num_cols:  int   = num_cols
+        self.offsets:   array = offsets
+        self.neighbors: array = neighbors
+        self._scratch:  SearchScratch = SearchScratch(len(offsets) - 1)
+
+    def solve(self, start: int, goal: int,
+                    cancelled: Callable[[], bool] | None = None) -> list[Position] | None:
+        ''' finds a shortest path between two open cells
+        Parameters:
+            start:     flat index of the start cell
+            goal:      flat index of the goal cell
+            cancelled: if given, called every CANCEL_CHECK_INTERVAL expansions;
+                       the search is abandoned once it returns True
+        Returns:
+            a list of Position objects from start to goal (inclusive), or None
+            if the goal cannot be reached
+        Raises:
+            SearchCancelled if cancelled returned True
+        '''
+        scratch = self._scratch
+        generation = scratch.begin()
+        stamp, parent, queue = scratch.stamp, scratch.parent, scratch.buffer
+        offsets, neighbors = self.offsets, self.neighbors
+
+        stamp[start] = generation
+        parent[start] = -1
+        queue[0] = start
+        head, tail = 0, 1
+        found = start == goal
+        while head < tail and not found:
+            if cancelled is not None and head % CANCEL_CHECK_INTERVAL == 0 and cancelled():
+                raise SearchCancelled(f"search from {start} to {goal} cancelled")
+            current = queue[head]
+            head += 1
+            for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+                if stamp[neighbor] != generation:
+                    stamp[neighbor] = generation
+                    parent[neighbor] = current
+                    if neighbor == goal:
+                        found = True
+                        break
+                    queue[tail] = neighbor
+                    tail += 1
+        if not found:
+            return None
+        return [Position(*divmod(index, self.num_cols)) for index in scratch.path(goal)]
+
+# each pool worker builds its own BatchSolver once, in initBatchWorker
+_batch_worker: BatchSolver = None
+
+def initBatchWorker(num_cols: int, offsets: array, neighbors: array) -> None:
+    ''' pool initializer building the worker's BatchSolver (see solveBatch) '''
+    global _batch_worker
+    _batch_worker = BatchSolver(num_cols, offsets, neighbors)
+
+def solveBatch(pairs: list[tuple[int, int]]) -> list[list[Position] | None]:
+    ''' answers (start, goal) flat-index pairs with the BatchSolver that
+        initBatchWorker built in this worker process '''
+    return [_batch_worker.solve(start, goal) for start, goal in pairs]
+
+###################
+def main() -> None:
+    # 2x3, with (0,1) blocked:
+    #   | |░| |
+    #   | | | |
+    # in CSR form: the neighbors of cell i are neighbors[offsets[i]:offsets[i + 1]]
+    offsets   = array('i', [0, 1, 1, 2, 4, 6, 8])
+    neighbors = array('i', [3, 5, 0, 4, 3, 5, 2, 4])
+    solver = BatchSolver(3, offsets, neighbors)
+    path = solver.solve(0, 2)
+    print(f"Path from (0,0) to (0,2): {' '.join(map(str, path))}")
+    print("Expected:                 (0,0) (1,0) (1,1) (1,2) (0,2)")
+    print(f"Path from (0,0) to the blocked (0,1): {solver.solve(0, 1)} (Expected: None)")
+    try:
+        solver.solve(0, 2, cancelled = lambda: True)
+    except SearchCancelled:
+        print("Search told to cancel: SearchCancelled (Expected: SearchCancelled)")
+
+    initBatchWorker(solver.num_cols, solver.offsets, solver.neighbors)
+    print(f"Batch path lengths: {[len(path) for path in solveBatch([(0, 2), (3, 5)])]} (Expected: [5, 3])")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,387 @@
+'''
+Benchmark harness for the Maze search methods: sweeps grid sizes, blocked
+proportions, search orders, and search methods (and, for aStar, numbers of ALT
+landmarks, to show how many fewer cells it explores; for hpaStar, cluster
+sizes; for bfsParallel, numbers of worker processes), running every trial in a
+fresh process (so its peak RSS is its own), and writes the results, together
+with a description of the machine, as JSON (and optionally CSV); a second mode
+compares two result files and flags regressions.
+
+Usage:
+    python Benchmark.py run results.json [--csv results.csv] [--max-exponent 8] [--landmarks 0 8] \
+        [--cluster-sizes 16] [--processes 1 4] ...
+    python Benchmark.py compare baseline.json results.json [--threshold 0.10]
+'''
+
+from __future__ import annotations
+from Maze import Maze, Cell, SearchOrder, np
+import argparse
+import csv
+import datetime
+import json
+import math
+import multiprocessing
+import os
+import platform
+import queue
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+# search methods benchmarked by default, by Maze method name
+ALGORITHMS = ["dfs", "bfs", "aStar", "dfsIndexed", "bfsIndexed", "aStarIndexed", "dial",
+              "bidirectionalBfs", "bidirectionalAStar", "jps", "replan", "hpaStar",
+              "bfsParallel", "shortestDistance", "distanceField"] + \
+             (["bfsVectorized"] if np is not None else [])
+
+# a trial's configuration is matched across result files on these fields
+# (landmarks, cluster_size, and processes are 0 for the methods that do not take them)
+CONFIG_FIELDS  = ["algorithm", "rows", "cols", "prop_blocked", "search_order", "compact",
+                  "landmarks", "cluster_size", "processes", "seed"]
+METRIC_FIELDS  = ["status", "build_seconds", "cache_seconds", "landmark_seconds", "search_seconds",
+                  "peak_rss_kib", "cells_pushed", "cells_explored", "path_length"]
+
+# grids of more cells than this are always built compact: a Cell object per
+# cell would need gigabytes long before the search itself matters
+COMPACT_ABOVE = 10 ** 6
+
+################################################################################
+def peakRssKiB() -> int:
+    ''' returns the peak resident set size of the calling process so far, in
+        KiB (ru_maxrss is in KiB on Linux but in bytes on macOS), or -1 where
+        the resource module is unavailable (e.g., Windows)
+    '''
+    try:
+        import resource
+    except ImportError:
+        return -1
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+def machineMetadata() -> dict[str, object]:
+    ''' describes the machine, interpreter, and code a benchmark ran on, so
+        result files from different runs can be told apart
+    Returns:
+        a dict of JSON-serializable fields
+    '''
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output = True, text = True,
+                                cwd = os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "timestamp":      datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "hostname":       platform.node(),
+        "platform":       platform.platform(),
+        "machine":        platform.machine(),
+        "processor":      platform.processor(),
+        "cpu_count":      os.cpu_count(),
+        "python":         platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "numpy":          None if np is None else np.__version__,
+        "git_commit":     commit or None,
+    }
+
+def gridShape(exponent: int) -> tuple[int, int]:
+    ''' returns the (rows, cols) of the square-ish grid with about
+        10 ** exponent cells '''
+    rows = math.isqrt(10 ** exponent)
+    return rows, -(-10 ** exponent // rows)   # ceiling division
+
+def pathLength(maze: Maze, goal: Cell) -> int:
+    ''' returns the number of cells (start and goal included) on the path a
+        search found, following parents back from the goal to the start '''
+    start = maze.getStart()._position
+    length, cell = 1, goal
+    while cell._position != start:
+        cell = cell._parent
+        length += 1
+    return length
+
+def searchOutcome(maze: Maze, algorithm: str, result: object) -> tuple[bool, int, int, int]:
+    ''' reads what a search method returned, whatever its kind
+    Parameters:
+        maze:      the Maze searched
+        algorithm: the name of the method run
+        result:    what it returned: a goal Cell (or None) for the path
+                   searches, a number of moves (or None) for shortestDistance,
+                   and a DistanceField for distanceField
+    Returns:
+        a tuple (found, path_length, cells_pushed, cells_explored); the
+        distance-only methods leave the Maze's counters alone, so
+        shortestDistance reports 0 cells, and distanceField the number of
+        cells its search reached (pushed and explored alike)
+    '''
+    if algorithm == "shortestDistance":
+        return result is not None, 0 if result is None else result + 1, 0, 0
+    if algorithm == "distanceField":
+        moves = result.distanceFrom(maze.getStart()._position)
+        reached = sum(distance != result.unreached for distance in result.distances)
+        return moves is not None, 0 if moves is None else moves + 1, reached, reached
+    found = result is not None
+    return (found, pathLength(maze, result) if found else 0,
+            maze._num_cells_pushed, maze._num_cells_explored)
+
+################################################################################
+def runTrial(config: dict[str, object]) -> dict[str, object]:
+    ''' builds one maze and runs one search method on it, timing both; the
+        caches every search shares (the adjacency and the component labels),
+        and the method's own (shortestDistance's bit-packed mask, and
+        hpaStar's abstract graph, built by a first query), are built in
+        between and timed on their own, so no method's search is charged for
+        them
+    Parameters:
+        config: a dict with the CONFIG_FIELDS of the trial
+    Returns:
+        the config updated with the METRIC_FIELDS of the trial
+    '''
+    random.seed(config["seed"])
+    build_start = time.perf_counter()
+    maze = Maze(config["rows"], config["cols"], prop_blocked = config["prop_blocked"],
+                search_order = SearchOrder[config["search_order"]], compact = config["compact"])
+    build_seconds = time.perf_counter() - build_start
+
+    algorithm = config["algorithm"]
+    arguments = {}
+    if algorithm == "hpaStar":
+        arguments["cluster_size"] = config["cluster_size"]
+    elif algorithm == "bfsParallel":
+        arguments["processes"] = config["processes"]
+
+    cache_start = time.perf_counter()
+    maze._getAdjacency()
+    maze._getComponents()
+    if algorithm == "shortestDistance":
+        maze._getBits()
+    elif algorithm == "hpaStar":
+        maze.hpaStar(**arguments)
+    cache_seconds = time.perf_counter() - cache_start
+
+    landmark_start = time.perf_counter()
+    if config["landmarks"]:
+        maze.useLandmarks(config["landmarks"])
+    landmark_seconds = time.perf_counter() - landmark_start
+
+    search_start = time.perf_counter()
+    result = getattr(maze, algorithm)(**arguments)
+    search_seconds = time.perf_counter() - search_start
+
+    found, path_length, pushed, explored = searchOutcome(maze, algorithm, result)
+    return config | {
+        "status":         "ok" if found else "no path",
+        "build_seconds":  build_seconds,
+        "cache_seconds":  cache_seconds,
+        "landmark_seconds": landmark_seconds,
+        "search_seconds": search_seconds,
+        "peak_rss_kib":   peakRssKiB(),
+        "cells_pushed":   pushed,
+        "cells_explored": explored,
+        "path_length":    path_length,
+    }
+
+def _trialWorker(config: dict[str, object], results: multiprocessing.Queue) -> None:
+    try:
+        results.put(runTrial(config))
+    except Exception as error:   # report rather than lose the whole sweep
+        results.put(config | {"status": f"error: {type(error).__name__}: {error}"})
+
+def runIsolated(config: dict[str, object], timeout: float | None) -> dict[str, object]:
+    ''' runs one trial in a fresh (spawned) process, so neither its peak RSS
+        nor its garbage is shared with any other trial
+    Parameters:
+        config:  a dict with the CONFIG_FIELDS of the trial
+        timeout: seconds after which to give up on the trial (None to wait)
+    Returns:
+        the trial's result (see runTrial), with status "timeout" if it was
+        stopped or "crashed" if the process died (e.g., out of memory)
+    '''
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target = _trialWorker, args = (config, results))
+    process.start()
+    process.join(timeout)   # a result is small enough not to block the exit
+    if process.is_alive():
+        process.kill()
+        process.join()
+        return config | {"status": "timeout"}
+    try:
+        return results.get(timeout = 5)
+    except queue.Empty:     # died without reporting, e.g. out of memory
+        return config | {"status": "crashed"}
+
+def sweep(algorithms: list[str], exponents: list[int], densities: list[float],
+          orders: list[str], repeats: int, seed: int, timeout: float | None,
+          landmark_counts: list[int], cluster_sizes: list[int],
+          process_counts: list[int]) -> list[dict[str, object]]:
+    ''' runs every combination of the given parameters, printing one line per
+        trial as it finishes; trials with the same size, density, and repeat
+        share a seed, so every method and order searches the same mazes (the
+        RANDOM order only fixes its shuffles once the maze is built); aStar
+        runs once per landmark count (0 for the Manhattan heuristic alone),
+        hpaStar once per cluster size, bfsParallel once per number of
+        processes, and the other methods once
+    Returns:
+        a list of trial results (see runTrial)
+    '''
+    results = []
+    for exponent in exponents:
+        rows, cols = gridShape(exponent)
+        for density in densities:
+            for repeat in range(repeats):
+                for order in orders:
+                    for algorithm in algorithms:
+                        # the swept parameter of this method, if it takes one
+                        field, values, suffix = {
+                            "aStar":       ("landmarks",    landmark_counts, " +{} landmarks"),
+                            "hpaStar":     ("cluster_size", cluster_sizes,   " cluster {}"),
+                            "bfsParallel": ("processes",    process_counts,  " x{} processes"),
+                        }.get(algorithm, (None, [0], ""))
+                        for value in values:
+                            config = {"algorithm": algorithm, "rows": rows, "cols": cols,
+                                      "prop_blocked": density, "search_order": order,
+                                      "compact": rows * cols > COMPACT_ABOVE,
+                                      "landmarks": 0, "cluster_size": 0, "processes": 0,
+                                      "seed": seed + 1000 * exponent + repeat}
+                            if field is not None:
+                                config[field] = value
+                            result = runIsolated(config, timeout)
+                            results.append(result)
+                            label = algorithm + (suffix.format(value) if value else "")
+                            print(f"{rows}x{cols} p={density} {order:6} {label:26} " +
+                                  f"{result['status']:8} " +
+                                  (f"{result['search_seconds']:.4f}s " +
+                                   f"explored={result['cells_explored']} " +
+                                   f"path={result['path_length']} " +
+                                   f"rss={result['peak_rss_kib']}KiB"
+                                   if "search_seconds" in result else ""), flush = True)
+    return results
+
+################################################################################
+def writeResults(results: list[dict[str, object]], metadata: dict[str, object],
+                 json_path: str, csv_path: str | None = None) -> None:
+    ''' saves a sweep's results: as JSON, with the machine metadata, and
+        optionally as CSV (one row per trial, metadata columns repeated on
+        each row so the file stands alone)
+    '''
+    with open(json_path, "w") as file:
+        json.dump({"metadata": metadata, "results": results}, file, indent = 2)
+    if csv_path is not None:
+        meta_fields = ["timestamp", "platform", "python", "git_commit"]
+        with open(csv_path, "w", newline = "") as file:
+            writer = csv.DictWriter(file, fieldnames = CONFIG_FIELDS + METRIC_FIELDS + meta_fields)
+            writer.writeheader()
+            for result in results:
+                writer.writerow({field: result.get(field) for field in CONFIG_FIELDS + METRIC_FIELDS} |
+                                {field: metadata.get(field) for field in meta_fields})
+
+def compareResults(baseline: list[dict[str, object]], current: list[dict[str, object]],
+                   threshold: float = 0.10) -> list[str]:
+    ''' compares two sweeps trial by trial (matched on CONFIG_FIELDS), then
+        compares median search times per configuration across seeds
+    Parameters:
+        baseline:  results of the reference run
+        current:   results of the run to check
+        threshold: relative slowdown of the median search time that counts
+                   as a regression (0.10 is 10% slower)
+    Returns:
+        a list of human-readable regressions: slower median times, more
+        cells pushed or explored, longer paths, or trials that used to
+        succeed and no longer do (empty if there are none)
+    '''
+    def key(result: dict[str, object], fields: list[str]) -> tuple:
+        # files written before a field was added match as its default, 0
+        return tuple(result.get(field, 0) for field in fields)
+
+    regressions = []
+    before = {key(result, CONFIG_FIELDS): result for result in baseline}
+    for result in current:
+        old = before.get(key(result, CONFIG_FIELDS))
+        if old is None:
+            continue
+        name = " ".join(f"{field}={result[field]}" for field in CONFIG_FIELDS)
+        if old["status"] != result["status"]:
+            regressions.append(f"{name}: status {old['status']} -> {result['status']}")
+            continue
+        for metric in ["cells_pushed", "cells_explored", "path_length"]:
+            if metric in result and result[metric] > old[metric]:
+                regressions.append(f"{name}: {metric} {old[metric]} -> {result[metric]}")
+
+    # times are noisy, so compare the median over each configuration's seeds
+    group_fields = [field for field in CONFIG_FIELDS if field != "seed"]
+    def medians(results: list[dict[str, object]]) -> dict[tuple, float]:
+        groups: dict[tuple, list[float]] = {}
+        for result in results:
+            if "search_seconds" in result:
+                groups.setdefault(key(result, group_fields), []).append(result["search_seconds"])
+        return {group: statistics.median(times) for group, times in groups.items()}
+
+    old_medians = medians(baseline)
+    for group, new_time in medians(current).items():
+        old_time = old_medians.get(group)
+        if old_time and new_time > old_time * (1 + threshold):
+            name = " ".join(f"{field}={value}" for field, value in zip(group_fields, group))
+            regressions.append(f"{name}: median search time {old_time:.4f}s -> {new_time:.4f}s " +
+                               f"({new_time / old_time - 1:+.0%})")
+    return regressions
+
+################################################################################
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "Benchmark the Maze search methods")
+    commands = parser.add_subparsers(dest = "command", required = True)
+
+    run = commands.add_parser("run", help = "run a benchmark sweep")
+    run.add_argument("output", help = "JSON file to write the results to")
+    run.add_argument("--csv", help = "also write the results to this CSV file")
+    run.add_argument("--algorithms", nargs = "+", default = ALGORITHMS, choices = ALGORITHMS)
+    run.add_argument("--min-exponent", type = int, default = 2,
+                     help = "smallest grid has about 10**this many cells (default 2)")
+    run.add_argument("--max-exponent", type = int, default = 6,
+                     help = "largest grid has about 10**this many cells (default 6, up to 8)")
+    run.add_argument("--densities", nargs = "+", type = float, default = [0.0, 0.2, 0.35],
+                     help = "prop_blocked values to sweep")
+    run.add_argument("--orders", nargs = "+", default = [order.name for order in SearchOrder],
+                     choices = [order.name for order in SearchOrder])
+    run.add_argument("--repeats", type = int, default = 3, help = "seeds per configuration")
+    run.add_argument("--seed", type = int, default = 8675309, help = "base seed")
+    run.add_argument("--timeout", type = float, default = 600,
+                     help = "seconds before a single trial is abandoned")
+    run.add_argument("--landmarks", nargs = "+", type = int, default = [0, 8],
+                     help = "ALT landmark counts to run aStar with (0: Manhattan only)")
+    run.add_argument("--cluster-sizes", nargs = "+", type = int, default = [16],
+                     help = "cluster sizes to run hpaStar with")
+    run.add_argument("--processes", nargs = "+", type = int, default = [1, 4],
+                     help = "worker processes to run bfsParallel with (1: in the trial's own process)")
+
+    compare = commands.add_parser("compare", help = "flag regressions between two result files")
+    compare.add_argument("baseline", help = "JSON results of the reference run")
+    compare.add_argument("current",  help = "JSON results of the run to check")
+    compare.add_argument("--threshold", type = float, default = 0.10,
+                         help = "relative slowdown counted as a regression (default 0.10)")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        metadata = machineMetadata()
+        print(" ".join(f"{field}={value}" for field, value in metadata.items()))
+        results = sweep(args.algorithms, list(range(args.min_exponent, args.max_exponent + 1)),
+                        args.densities, args.orders, args.repeats, args.seed, args.timeout,
+                        args.landmarks, args.cluster_sizes, args.processes)
+        writeResults(results, metadata, args.output, args.csv)
+        print(f"Wrote {len(results)} results to {args.output}" +
+              (f" and {args.csv}" if args.csv else ""))
+    else:
+        with open(args.baseline) as file: baseline = json.load(file)
+        with open(args.current)  as file: current  = json.load(file)
+        for label, data in [("baseline", baseline), ("current", current)]:
+            meta = data["metadata"]
+            print(f"{label}: {meta['timestamp']} {meta['platform']} Python {meta['python']} " +
+                  f"commit {meta['git_commit']}")
+        regressions = compareResults(baseline["results"], current["results"], args.threshold)
+        for regression in regressions:
+            print("REGRESSION", regression)
+        print(f"{len(regressions)} regression(s) found")
+        sys.exit(1 if regressions else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+################################################################################
+class BitGrid:
+    ''' the open cells of a Maze as bits of one (big) int: row r occupies bits
+        r * stride up to r * stride + cols - 1, where stride is cols rounded up
+        to whole 64-bit words -- the same row-aligned layout as a maze file's
+        mask, so it can be read from one in a single step; shifting the int
+        by 1 or by stride moves every cell one step west/east or north/south
+        at once, so a whole BFS level is a few shifts, ANDs, and ORs, which
+        CPython runs a machine word at a time, and the grid costs one bit per
+        cell rather than a byte or an object
+    '''
+    __slots__ = ('rows', 'cols', 'stride', 'open', 'not_west_edge', 'not_east_edge')
+
+    def __init__(self, rows: int, cols: int, blocked: int):
+        '''
+        Parameters:
+            rows, cols: the grid's dimensions
+            blocked:    an int with the bit of every blocked cell set, in the
+                        layout above (padding bits are ignored)
+        '''
+        self.rows:   int = rows
+        self.cols:   int = cols
+        self.stride: int = (cols + 63) // 64 * 64
+        self.open:          int = self._everyRow((1 << cols) - 1) & ~blocked
+        self.not_west_edge: int = self._everyRow((1 << cols) - 2)
+        self.not_east_edge: int = self._everyRow((1 << (cols - 1)) - 1)
+
+    def _everyRow(self, row_bits: int) -> int:
+        ''' returns an int with the same bits set in every row '''
+        return int.from_bytes(row_bits.to_bytes(self.stride // 8, "little") * self.rows, "little")
+
+    @staticmethod
+    def fromFlags(rows: int, cols: int, flags: bytes) -> BitGrid:
+        ''' builds a BitGrid from one byte per cell, indexed by row * cols +
+            col, that is 1 if the cell is blocked and 0 otherwise '''
+        row_bytes = (cols + 63) // 64 * 8
+        digits = flags.translate(b"0" + b"1" * 255)
+        packed = b"".join(int(digits[start:start + cols][::-1], 2).to_bytes(row_bytes, "little")
+                          for start in range(0, rows * cols, cols))
+        return BitGrid(rows, cols, int.from_bytes(packed, "little"))
+
+    def bitOf(self, index: int) -> int:
+        ''' returns the bit position of the cell at a flat index '''
+        return index // self.cols * self.stride + index % self.cols
+
+    def expand(self, cells: int) -> int:
+        ''' returns the open cells one move from any of the given cells '''
+        stride = self.stride
+        return (((cells & self.not_east_edge) << 1) | ((cells & self.not_west_edge) >> 1) |
+                (cells << stride) | (cells >> stride)) & self.open
+
+    def reachable(self, root: int) -> int:
+        ''' returns the bits of every cell reachable from the cell at a flat
+            index (none if that cell is blocked), one BFS level per step '''
+        reached = frontier = (1 << self.bitOf(root)) & self.open
+        while frontier:
+            frontier = self.expand(frontier) & ~reached
+            reached |= frontier
+        return reached
+
+    def distance(self, source: int, target: int) -> int | None:
+        ''' returns the number of moves on a shortest path between the cells
+            at two flat indices, or None if there is none '''
+        target_bit = 1 << self.bitOf(target)
+        if not target_bit & self.open:
+            return None
+        reached = frontier = (1 << self.bitOf(source)) & self.open
+        moves = 0
+        while frontier:
+            if frontier & target_bit:
+                return moves
+            frontier = self.expand(frontier) & ~reached
+            reached |= frontier
+            moves += 1
+        return None
+
+###################
+def main() -> None:
+    # 3x4, with a wall down column 1 except at row 2:
+    #   | |░| | |
+    #   | |░| | |
+    #   | | | | |
+    flags = bytes([0, 1, 0, 0,
+                   0, 1, 0, 0,
+                   0, 0, 0, 0])
+    grid = BitGrid.fromFlags(3, 4, flags)
+    print(f"Stride: {grid.stride} (Expected: 64)")
+    print(f"Open cells: {grid.open.bit_count()} (Expected: 10)")
+    print(f"Reachable from (0,0): {grid.reachable(0).bit_count()} (Expected: 10)")
+    print(f"Distance (0,0) to (0,2): {grid.distance(0, 2)} (Expected: 6, around the wall)")
+    print(f"Distance (0,0) to (0,1): {grid.distance(0, 1)} (Expected: None, a blocked cell)")
+    print(f"Bit of (2,3): {grid.bitOf(11)} (Expected: 131)")
+
+if __name__ == "__main__":
+    main()
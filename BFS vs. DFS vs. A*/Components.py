@@ -0,0 +1,180 @@
+from __future__ import annotations
+from array import array
+from typing import Callable, Sequence
+
+def labelComponents(offsets: Sequence[int], neighbors: Sequence[int],
+                    blocked: bytes) -> array:
+    ''' function to label every open cell with the id (0, 1, 2, ...) of its
+        connected component, by flood filling from each still-unlabeled open cell
+    Parameters:
+        offsets, neighbors: the grid's adjacency in CSR form (see
+                            Maze._getAdjacency): the open neighbors of cell i
+                            are neighbors[offsets[i]:offsets[i + 1]]
+        blocked:            one byte per cell, nonzero if the cell is blocked
+    Returns:
+        an array('i') of component ids, with -1 for blocked cells
+    '''
+    labels = array('i', [-1]) * len(blocked)
+    next_label = 0
+    for root in range(len(labels)):
+        if labels[root] >= 0 or blocked[root]:
+            continue
+        labels[root] = next_label
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+                if labels[neighbor] < 0:
+                    labels[neighbor] = next_label
+                    stack.append(neighbor)
+        next_label += 1
+    return labels
+
+################################################################################
+class Components:
+    ''' connected-component labels for the open cells of a Maze, kept up to
+        date as single cells are blocked or unblocked: unblocking a cell merges
+        its neighbors' components (union-find over the labels), while blocking
+        one may split its component, which is checked by flooding outward from
+        its open neighbors in turn -- pieces that run out of cells before
+        meeting the others are the split-off parts, and only they are relabeled
+    '''
+    __slots__ = ('_labels', '_merged', '_next_label')
+
+    def __init__(self, labels: Sequence[int]):
+        self._labels:     Sequence[int]  = labels   # per cell; -1 if blocked
+        self._merged:     dict[int, int] = {}       # label -> label it was merged into
+        self._next_label: int            = -1       # found when first needed
+
+    def _find(self, label: int) -> int:
+        ''' returns the label that a given label has (transitively) been merged
+            into, compressing the chain of merges along the way '''
+        root = label
+        while root in self._merged:
+            root = self._merged[root]
+        while label != root:
+            self._merged[label], label = root, self._merged[label]
+        return root
+
+    def _makeWritable(self) -> None:
+        ''' copies the labels before their first update (labels loaded from a
+            LayoutCache are read-only) and finds the first unused label '''
+        if self._next_label < 0:
+            self._labels = array('i', self._labels)
+            self._next_label = max(self._labels, default = -1) + 1
+
+    def _newLabel(self) -> int:
+        self._next_label += 1
+        return self._next_label - 1
+
+    def connected(self, first: int, second: int) -> bool:
+        ''' indicates whether two cells (flat indices) are open and connected '''
+        first, second = self._labels[first], self._labels[second]
+        return first >= 0 and second >= 0 and self._find(first) == self._find(second)
+
+    def unblock(self, index: int, neighbors: list[int]) -> None:
+        ''' updates the labels for a cell that has just been unblocked
+        Parameters:
+            index:     flat index of the cell
+            neighbors: flat indices of the cell's open neighbors
+        '''
+        self._makeWritable()
+        roots = {self._find(self._labels[neighbor]) for neighbor in neighbors}
+        label = roots.pop() if roots else self._newLabel()
+        for root in roots:
+            self._merged[root] = label
+        self._labels[index] = label
+
+    def block(self, index: int, neighbors: list[int],
+                    openNeighbors: Callable[[int], list[int]]) -> None:
+        ''' updates the labels for a cell that has just been blocked
+        Parameters:
+            index:         flat index of the cell
+            neighbors:     flat indices of the cell's open neighbors
+            openNeighbors: function giving the open neighbors of any cell
+        '''
+        self._makeWritable()
+        self._labels[index] = -1
+        if len(neighbors) < 2:
+            return   # an end of a corridor cannot disconnect anything
+
+        # one flood per neighbor, grown a cell at a time in turn; floods that
+        # touch are merged into one group (group[i] is flood i's group root)
+        count  = len(neighbors)
+        owner  = {neighbor: i for i, neighbor in enumerate(neighbors)}
+        queues = [[neighbor] for neighbor in neighbors]
+        heads  = [0] * count
+        group  = list(range(count))
+        done   = [False] * count
+        active = count
+
+        def root(i: int) -> int:
+            while group[i] != i:
+                i = group[i]
+            return i
+
+        while active > 1:
+            for i in range(count):
+                if heads[i] == len(queues[i]) or done[root(i)]:
+                    continue
+                current = queues[i][heads[i]]
+                heads[i] += 1
+                for neighbor in openNeighbors(current):
+                    j = owner.get(neighbor)
+                    if j is None:
+                        owner[neighbor] = i
+                        queues[i].append(neighbor)
+                    elif root(i) != root(j):
+                        group[root(j)] = root(i)
+                        active -= 1
+
+            # a group whose floods have all run dry is a separate component
+            for g in {root(i) for i in range(count)}:
+                if active > 1 and not done[g] and \
+                   all(heads[i] == len(queues[i]) for i in range(count) if root(i) == g):
+                    label = self._newLabel()
+                    for i in range(count):
+                        if root(i) == g:
+                            for cell in queues[i]:
+                                self._labels[cell] = label
+                    done[g] = True
+                    active -= 1
+
+###################
+def main() -> None:
+    # 3x3, with column 1 blocked but for the middle cell:
+    #   | |░| |
+    #   | | | |
+    #   | |░| |
+    rows, cols = 3, 3
+    blocked = bytearray([0, 1, 0,
+                         0, 0, 0,
+                         0, 1, 0])
+
+    def openNeighbors(index: int) -> list[int]:
+        row, col = divmod(index, cols)
+        return [neighbor for neighbor, in_bounds in
+                ((index - cols, row > 0), (index + cols, row < rows - 1),
+                 (index - 1, col > 0),    (index + 1, col < cols - 1))
+                if in_bounds and not blocked[neighbor]]
+
+    offsets, neighbors = array('i', [0]), array('i')
+    for index in range(rows * cols):
+        neighbors.extend([] if blocked[index] else openNeighbors(index))
+        offsets.append(len(neighbors))
+
+    components = Components(labelComponents(offsets, neighbors, blocked))
+    print(f"Labels: {components._labels.tolist()}")
+    print("Expected: [0, -1, 0, 0, 0, 0, 0, -1, 0]")
+    print(f"(0,0) and (0,2) connected? {components.connected(0, 2)} (Expected: True)")
+
+    blocked[4] = 1   # block the middle cell: the two sides split apart
+    components.block(4, openNeighbors(4), openNeighbors)
+    print(f"After blocking (1,1), connected? {components.connected(0, 2)} (Expected: False)")
+    blocked[4] = 0   # and unblock it again: they merge back
+    components.unblock(4, openNeighbors(4))
+    print(f"After unblocking (1,1), connected? {components.connected(0, 2)} (Expected: True)")
+    print(f"(0,0) and (0,1) connected? {components.connected(0, 1)} (Expected: False, (0,1) is blocked)")
+
+if __name__ == "__main__":
+    main()
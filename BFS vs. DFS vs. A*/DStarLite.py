@@ -0,0 +1,190 @@
+from __future__ import annotations
+from typing import Callable
+from PriorityQueue import IndexedPriorityQueue, HeapEntry
+
+################################################################################
+class DStarLite:
+    ''' incremental planner for a grid in the style of D* Lite (Koenig &
+        Likhachev): it searches backward from the goal, keeping for each cell
+        g (its settled distance to the goal) and rhs (the best distance its
+        neighbors' g values offer); a cell is queued only while the two
+        disagree, so after cells are blocked or unblocked -- or the start
+        moves -- only the part of the search tree the change affects is
+        reprocessed; g and rhs are kept in dicts, so memory also grows only
+        with the cells the searches actually touch
+    '''
+    __slots__ = ('_rows', '_cols', '_isBlocked', '_goal', '_last_start', '_km', '_g', '_rhs',
+                 '_queue', '_handles', '_changed')
+
+    def __init__(self, rows: int, cols: int, isBlocked: Callable[[int], bool],
+                       start: int, goal: int):
+        ''' initializer method for a DStarLite object; nothing is searched
+            until the first replan
+        Parameters:
+            rows, cols: the grid's dimensions
+            isBlocked:  function telling whether the cell at a flat index
+                        (row * cols + col) is blocked, read afresh on every
+                        replan, so it must reflect the current layout
+            start:      flat index of the start cell
+            goal:       flat index of the goal cell (fixed for the planner's life)
+        '''
+        self._rows:       int   = rows
+        self._cols:       int   = cols
+        self._isBlocked:  Callable[[int], bool] = isBlocked
+        self._goal:       int   = goal
+        self._last_start: int   = start
+        self._km:         float = 0     # total heuristic drift as the start moves
+        self._g:          dict[int, float] = {}
+        self._rhs:        dict[int, float] = {self._goal: 0}
+        self._queue   = IndexedPriorityQueue[tuple[float, float], int]()
+        self._handles: dict[int, HeapEntry] = {}
+        self._changed: list[int] = []   # cells blocked/unblocked since last replan
+        self._handles[self._goal] = self._queue.insert(self._key(self._goal), self._goal)
+
+    def _heuristic(self, index: int) -> int:
+        ''' Manhattan distance from the (current) start to a cell '''
+        cols = self._cols
+        row, col = divmod(index, cols)
+        start_row, start_col = divmod(self._last_start, cols)
+        return abs(row - start_row) + abs(col - start_col)
+
+    def _key(self, index: int) -> tuple[float, float]:
+        best = min(self._g.get(index, float('inf')), self._rhs.get(index, float('inf')))
+        return (best + self._heuristic(index) + self._km, best)
+
+    def _neighbors(self, index: int) -> list[int]:
+        ''' all in-grid neighbors of a cell, open or not: a move costs 1
+            between two open cells and is impossible (infinite) otherwise '''
+        rows, cols = self._rows, self._cols
+        row, col = divmod(index, cols)
+        return [neighbor for neighbor, in_bounds in
+                ((index - cols, row > 0), (index + cols, row < rows - 1),
+                 (index - 1, col > 0),    (index + 1, col < cols - 1)) if in_bounds]
+
+    def _bestRhs(self, index: int) -> float:
+        ''' the cheapest distance to the goal offered by a cell's neighbors '''
+        if self._isBlocked(index):
+            return float('inf')
+        g = self._g
+        return min((1 + g.get(neighbor, float('inf')) for neighbor in self._neighbors(index)
+                    if not self._isBlocked(neighbor)), default = float('inf'))
+
+    def _updateCell(self, index: int) -> None:
+        ''' (re)queues a cell if its g and rhs disagree, or dequeues it if not '''
+        handle = self._handles.get(index)
+        queued = handle is not None and self._queue.contains(handle)
+        if self._g.get(index, float('inf')) != self._rhs.get(index, float('inf')):
+            if queued:
+                self._queue.update(handle, self._key(index))
+            else:
+                self._handles[index] = self._queue.insert(self._key(index), index)
+        elif queued:
+            self._queue.remove(handle)
+
+    def cellChanged(self, index: int) -> None:
+        ''' records that a cell has just been blocked or unblocked '''
+        self._changed.append(index)
+
+    def replan(self, start: int) -> int:
+        ''' brings the search tree up to date with any layout changes and the
+            current start
+        Parameters:
+            start: flat index of the start cell, which may have moved since
+                   the last replan
+        Returns:
+            the number of cells expanded (taken off the queue) doing so
+        '''
+        if start != self._last_start:
+            # keys already queued stay valid lower bounds once km absorbs the move
+            self._km += self._heuristic(start)
+            self._last_start = start
+
+        # a cell changing state changes the cost of every move into or out of
+        # it, so recompute rhs for it and its neighbors
+        for index in self._changed:
+            for cell in [index] + self._neighbors(index):
+                if cell != self._goal:
+                    self._rhs[cell] = self._bestRhs(cell)
+                    self._updateCell(cell)
+        self._changed.clear()
+
+        g, rhs, queue = self._g, self._rhs, self._queue
+        infinity = float('inf')
+        expanded = 0
+        while not queue.isEmpty() and (queue.min().key < self._key(start) or
+                                       rhs.get(start, infinity) != g.get(start, infinity)):
+            entry = queue.min()
+            index, old_key = entry.value, entry.key
+            new_key = self._key(index)
+            expanded += 1
+            if old_key < new_key:
+                queue.update(entry, new_key)
+            elif g.get(index, infinity) > rhs.get(index, infinity):
+                g[index] = rhs[index]
+                queue.remove(entry)
+                if not self._isBlocked(index):
+                    for neighbor in self._neighbors(index):
+                        if neighbor != self._goal and not self._isBlocked(neighbor) and \
+                           g[index] + 1 < rhs.get(neighbor, infinity):
+                            rhs[neighbor] = g[index] + 1
+                            self._updateCell(neighbor)
+            else:
+                old_g = g.get(index, infinity)
+                g[index] = infinity
+                for cell in [index] + self._neighbors(index):
+                    if cell != self._goal and (cell == index or rhs.get(cell, infinity) == old_g + 1):
+                        rhs[cell] = self._bestRhs(cell)
+                    self._updateCell(cell)
+        return expanded
+
+    def path(self) -> list[int] | None:
+        ''' follows the settled g values from the start down to the goal
+        Returns:
+            flat indices of the cells from the start to the goal, or None if
+            the goal cannot be reached
+        '''
+        index = self._last_start
+        if self._g.get(index, float('inf')) == float('inf'):
+            return None
+        path = [index]
+        while index != self._goal:
+            index = min((neighbor for neighbor in self._neighbors(index)
+                         if not self._isBlocked(neighbor)),
+                        key = lambda neighbor: self._g.get(neighbor, float('inf')))
+            path.append(index)
+        return path
+
+###################
+def main() -> None:
+    # 4x4, open but for a wall across row 2 with a gap at column 3:
+    #   |S| | | |
+    #   | | | | |
+    #   |░|░|░| |
+    #   |G| | | |
+    rows, cols = 4, 4
+    blocked = bytearray(rows * cols)
+    for col in range(3):
+        blocked[2 * cols + col] = 1
+    planner = DStarLite(rows, cols, blocked.__getitem__, start = 0, goal = 12)
+
+    expanded = planner.replan(0)
+    path = planner.path()
+    print(f"First plan: {len(path) - 1} moves (Expected: 9, through the gap), expanded {expanded} cells")
+
+    blocked[2 * cols + 1] = 0   # open a second gap, at column 1
+    planner.cellChanged(2 * cols + 1)
+    expanded = planner.replan(0)
+    print(f"After opening (2,1): {len(planner.path()) - 1} moves (Expected: 5), " +
+          f"expanded {expanded} cells (only those the change affects)")
+
+    expanded = planner.replan(1)   # the start moves one step east
+    print(f"From (0,1): {len(planner.path()) - 1} moves (Expected: 4), expanded {expanded} cells")
+
+    for index in (2 * cols + 1, 2 * cols + 3):   # close both gaps
+        blocked[index] = 1
+        planner.cellChanged(index)
+    planner.replan(1)
+    print(f"With the wall closed: {planner.path()} (Expected: None)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+from __future__ import annotations
+from array import array
+from typing import Sequence
+from Position import Position, DIRECTION_MOVEMENTS
+from PriorityQueue import BucketQueue
+from Landmarks import compactDistances
+
+# a DistanceField's direction codes: 0 for no step, else 1 + an index into this
+STEP_DIRECTIONS = "NSWE"
+
+################################################################################
+class DistanceField:
+    ''' class representing every cell's distance to one goal, with the
+        direction of a first step toward it, so any number of agents can be
+        routed to the goal by O(1) lookups; returned by Maze.distanceField,
+        which finds both in one search outward from the goal; distances and
+        directions are arrays indexed by row * cols + col (compact unsigned
+        arrays that NumPy can view without copying, via np.frombuffer):
+            distances:  total move cost to the goal, uint16 where every
+                        distance fits and uint32 otherwise, with the type's
+                        maximum (unreached) for cells that cannot reach it
+            directions: one byte per cell, 0 where there is no step to take
+                        (the goal itself, and cells that cannot reach it),
+                        otherwise 1 + the index in STEP_DIRECTIONS of the step
+    '''
+    __slots__ = ('goal', 'distances', 'directions', 'unreached', '_rows', '_cols')
+
+    def __init__(self, rows: int, cols: int, goal: Position,
+                       distances: array, directions: array):
+        self.goal:       Position = goal
+        self.distances:  array    = distances
+        self.directions: array    = directions
+        self.unreached:  int      = 2 ** (8 * distances.itemsize) - 1
+        self._rows:      int      = rows
+        self._cols:      int      = cols
+
+    def _index(self, position: Position) -> int:
+        if not (0 <= position.row < self._rows and 0 <= position.col < self._cols):
+            raise ValueError("invalid (row,col) given for cell")
+        return position.row * self._cols + position.col
+
+    def distanceFrom(self, position: Position) -> int | None:
+        ''' returns the cost of a cheapest path from a cell to the goal, or
+            None if there is none
+        Raises:
+            ValueError if the row/col of position is out of range
+        '''
+        distance = self.distances[self._index(position)]
+        return None if distance == self.unreached else distance
+
+    def nextStep(self, position: Position) -> Position | None:
+        ''' returns the cell to move to from a cell on a cheapest path to
+            the goal, or None from the goal itself or a cell that cannot reach it
+        Raises:
+            ValueError if the row/col of position is out of range
+        '''
+        code = self.directions[self._index(position)]
+        if code == 0:
+            return None
+        row_change, col_change = DIRECTION_MOVEMENTS[STEP_DIRECTIONS[code - 1]]
+        return Position(position.row + row_change, position.col + col_change)
+
+    def pathFrom(self, position: Position) -> list[Position] | None:
+        ''' returns the Positions along a cheapest path from a cell to the
+            goal (both inclusive), or None if there is none
+        Raises:
+            ValueError if the row/col of position is out of range
+        '''
+        if self.distanceFrom(position) is None:
+            return None
+        path = [position]
+        while (step := self.nextStep(path[-1])) is not None:
+            path.append(step)
+        return path
+
+    @staticmethod
+    def build(rows: int, cols: int, offsets: Sequence[int], neighbors: Sequence[int],
+              terrain: Sequence[int] | None, root: int, root_open: bool) -> DistanceField:
+        ''' builds the DistanceField to one goal in a single search outward
+            from it -- a BFS, or with terrain costs a Dial search over a
+            BucketQueue
+        Parameters:
+            rows, cols:         the grid's dimensions
+            offsets, neighbors: the grid's adjacency in CSR form (see
+                                Maze._getAdjacency)
+            terrain:            each cell's cost to move into, or None if
+                                every move costs 1
+            root:               flat index of the goal
+            root_open:          whether the goal is open (if not, no cell
+                                can reach it)
+        '''
+        distance = array('i', [-1]) * (rows * cols)
+        direction = array('B', bytes(rows * cols))
+        # a cell's direction code, by its next step's index minus its own
+        # (N and S last, so they win when a single column makes -1 == -cols)
+        step_code = {-1: 3, 1: 4, -cols: 1, cols: 2}
+
+        if root_open:
+            distance[root] = 0
+            if terrain is None:
+                queue = [root]
+                for current in queue:
+                    for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+                        if distance[neighbor] < 0:
+                            distance[neighbor] = distance[current] + 1
+                            direction[neighbor] = step_code[current - neighbor]
+                            queue.append(neighbor)
+            else:
+                buckets = BucketQueue[int](max(terrain))
+                buckets.insert(0, root)
+                while not buckets.isEmpty():
+                    entry = buckets.removeMin()
+                    current = entry.value
+                    if entry.key != distance[current]:
+                        continue   # outdated entry: the cell was queued again, cheaper
+                    # a move from a neighbor into this cell costs this cell's terrain
+                    new_distance = entry.key + terrain[current]
+                    for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+                        if distance[neighbor] < 0 or new_distance < distance[neighbor]:
+                            distance[neighbor] = new_distance
+                            direction[neighbor] = step_code[current - neighbor]
+                            buckets.insert(new_distance, neighbor)
+
+        return DistanceField(rows, cols, Position(*divmod(root, cols)),
+                             compactDistances(distance), direction)
+
+###################
+def main() -> None:
+    # 3x3, with the middle cell blocked, and the goal at (0,0):
+    #   |G| | |
+    #   | |░| |
+    #   | | | |
+    rows, cols = 3, 3
+    blocked = [0, 0, 0, 0, 1, 0, 0, 0, 0]
+    offsets, neighbors = array('i', [0]), array('i')
+    for index in range(rows * cols):
+        row, col = divmod(index, cols)
+        if not blocked[index]:
+            neighbors.extend(neighbor for neighbor, in_bounds in
+                             ((index - cols, row > 0), (index + cols, row < rows - 1),
+                              (index - 1, col > 0),    (index + 1, col < cols - 1))
+                             if in_bounds and not blocked[neighbor])
+        offsets.append(len(neighbors))
+
+    field = DistanceField.build(rows, cols, offsets, neighbors, None, 0, True)
+    print(f"Distance from (2,2): {field.distanceFrom(Position(2, 2))} (Expected: 4)")
+    print(f"Path from (2,2): {' '.join(map(str, field.pathFrom(Position(2, 2))))}")
+    print("Expected:        (2,2) (2,1) (2,0) (1,0) (0,0)")
+    print(f"From the blocked (1,1): {field.distanceFrom(Position(1, 1))} (Expected: None)")
+
+    terrain = [1, 9, 1, 1, 1, 1, 1, 1, 1]   # (0,1) is a swamp
+    field = DistanceField.build(rows, cols, offsets, neighbors, terrain, 0, True)
+    print(f"With (0,1) costing 9, next step from (0,2): {field.nextStep(Position(0, 2))} " +
+          f"(Expected: (1,2), the long way round), cost {field.distanceFrom(Position(0, 2))} (Expected: 6)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+from __future__ import annotations
+from heapq import heappush, heappop
+from typing import Callable
+
+################################################################################
+class Hierarchy:
+    ''' abstract graph over a grid for hierarchical pathfinding (HPA*, Botea,
+        Müller & Schaeffer): the grid is cut into square clusters, and along
+        each edge two clusters share, every run of open cell pairs gets a
+        transition (one pair in the middle of a short run, one at each end of
+        a run of 6 or more); the two cells of a transition are nodes of the
+        abstract graph, joined by a move of cost 1, and the nodes of each
+        cluster are joined to each other by their distances within it; a
+        query links the start and goal to their clusters' nodes, runs A* over
+        this much smaller graph, and refines each abstract edge back into
+        cells by a search confined to one cluster; paths found this way need
+        not be shortest, since they must pass through transitions; a changed
+        cell only marks its cluster, and the next query rebuilds the
+        transitions along that cluster's edges and the intra-cluster
+        distances of it and its neighbors
+    '''
+    __slots__ = ('_rows', '_cols', '_isBlocked', 'cluster_size', '_across', '_down',
+                 '_transitions', '_partners', '_intra', '_dirty', 'expanded')
+
+    def __init__(self, rows: int, cols: int, isBlocked: Callable[[int], bool], cluster_size: int):
+        ''' initializer method for a Hierarchy object; the graph is built by
+            the first findPath
+        Parameters:
+            rows, cols:   the grid's dimensions
+            isBlocked:    function telling whether the cell at a flat index
+                          (row * cols + col) is blocked, reflecting the
+                          current layout (report changes with cellChanged)
+            cluster_size: cells along each side of a cluster
+        '''
+        self._rows:        int  = rows
+        self._cols:        int  = cols
+        self._isBlocked:   Callable[[int], bool] = isBlocked
+        self.cluster_size: int  = cluster_size
+        self._across: int  = -(-cols // cluster_size)   # ceiling division
+        self._down:   int  = -(-rows // cluster_size)
+        # (cluster, True/False) -> transitions along its east/south edge, as
+        # (cell inside the cluster, cell beyond it) pairs
+        self._transitions: dict[tuple[int, bool], list[tuple[int, int]]] = {}
+        self._partners: dict[int, list[int]] = {}   # node -> nodes across an edge
+        # cluster -> node -> [(other node in the cluster, distance between them)]
+        self._intra: dict[int, dict[int, list[tuple[int, int]]]] = {}
+        self._dirty: set[int] = set(range(self._across * self._down))
+        self.expanded: int = 0   # abstract nodes and cells expanded by the last query
+
+    def _clusterOf(self, index: int) -> int:
+        row, col = divmod(index, self._cols)
+        return row // self.cluster_size * self._across + col // self.cluster_size
+
+    def _bounds(self, cluster: int) -> tuple[int, int, int, int]:
+        ''' returns the (top, left, bottom, right) rows/cols of a cluster, inclusive '''
+        top, left = cluster // self._across * self.cluster_size, cluster % self._across * self.cluster_size
+        return (top, left, min(top + self.cluster_size, self._rows) - 1,
+                           min(left + self.cluster_size, self._cols) - 1)
+
+    def cellChanged(self, index: int) -> None:
+        ''' records that a cell has just been blocked or unblocked '''
+        self._dirty.add(self._clusterOf(index))
+
+    def _findTransitions(self, cluster: int, east: bool) -> list[tuple[int, int]]:
+        ''' returns the transitions along a cluster's east or south edge '''
+        cols = self._cols
+        top, left, bottom, right = self._bounds(cluster)
+        if east:
+            if right == cols - 1:
+                return []
+            pairs = [(row * cols + right, row * cols + right + 1) for row in range(top, bottom + 1)]
+        else:
+            if bottom == self._rows - 1:
+                return []
+            pairs = [(bottom * cols + col, bottom * cols + cols + col) for col in range(left, right + 1)]
+
+        is_blocked = self._isBlocked
+        transitions, run = [], []
+        for pair in pairs + [None]:
+            if pair is not None and not is_blocked(pair[0]) and not is_blocked(pair[1]):
+                run.append(pair)
+            elif run:
+                transitions.extend([run[len(run) // 2]] if len(run) < 6 else [run[0], run[-1]])
+                run = []
+        return transitions
+
+    def _nodesOf(self, cluster: int) -> list[int]:
+        ''' returns the nodes (transition cells) inside a cluster '''
+        nodes = [inside for inside, _ in self._transitions[(cluster, True)]]
+        nodes += [inside for inside, _ in self._transitions[(cluster, False)]]
+        if cluster % self._across > 0:
+            nodes += [beyond for _, beyond in self._transitions[(cluster - 1, True)]]
+        if cluster >= self._across:
+            nodes += [beyond for _, beyond in self._transitions[(cluster - self._across, False)]]
+        return list(dict.fromkeys(nodes))
+
+    def _search(self, source: int, cluster: int, target: int = -1) -> dict[int, int]:
+        ''' BFS from a cell that never leaves its cluster, stopping early if
+            it reaches target
+        Returns:
+            a dict from each cell reached to its parent (-1 for source); its
+            insertion order is the order the cells were reached in
+        '''
+        cols, is_blocked = self._cols, self._isBlocked
+        top, left, bottom, right = self._bounds(cluster)
+        parent = {source: -1}
+        queue = [source]
+        for current in queue:
+            if current == target:
+                break
+            self.expanded += 1
+            row, col = divmod(current, cols)
+            for neighbor, inside in ((current - cols, row > top), (current + cols, row < bottom),
+                                     (current - 1, col > left),   (current + 1, col < right)):
+                if inside and neighbor not in parent and not is_blocked(neighbor):
+                    parent[neighbor] = current
+                    queue.append(neighbor)
+        return parent
+
+    def _distances(self, source: int, cluster: int, targets: list[int]) -> list[tuple[int, int]]:
+        ''' returns (target, distance within the cluster) for each of the
+            targets a source cell can reach without leaving its cluster '''
+        parent = self._search(source, cluster)
+        distances = []
+        for target in targets:
+            if target in parent and target != source:
+                steps, cell = 0, target
+                while cell != source:
+                    steps, cell = steps + 1, parent[cell]
+                distances.append((target, steps))
+        return distances
+
+    def _refresh(self) -> None:
+        ''' rebuilds what the clusters changed since the last query affect '''
+        if not self._dirty:
+            return
+        across, num_clusters = self._across, self._across * self._down
+        stale = set()
+        for cluster in self._dirty:
+            west, north = cluster - 1 if cluster % across > 0 else -1, cluster - across
+            for neighbor, east in ((cluster, True), (cluster, False), (west, True), (north, False)):
+                if neighbor >= 0:
+                    self._transitions[(neighbor, east)] = self._findTransitions(neighbor, east)
+            stale.update(neighbor for neighbor in (cluster, west, north, cluster + across,
+                                                   cluster + 1 if (cluster + 1) % across else -1)
+                         if 0 <= neighbor < num_clusters)
+        self._dirty.clear()
+
+        self._partners = {}
+        for transitions in self._transitions.values():
+            for inside, beyond in transitions:
+                self._partners.setdefault(inside, []).append(beyond)
+                self._partners.setdefault(beyond, []).append(inside)
+        for cluster in stale:
+            nodes = self._nodesOf(cluster)
+            self._intra[cluster] = {node: self._distances(node, cluster, nodes) for node in nodes}
+
+    def findPath(self, start: int, goal: int) -> list[int] | None:
+        ''' finds a path through the abstract graph and refines it into cells
+        Returns:
+            flat indices of the cells from start to goal, or None if the goal
+            cannot be reached
+        '''
+        self._refresh()
+        self.expanded = 0
+        cols = self._cols
+        goal_row, goal_col = divmod(goal, cols)
+        start_cluster, goal_cluster = self._clusterOf(start), self._clusterOf(goal)
+
+        # the start and goal join the graph through their own clusters' nodes
+        start_edges = self._distances(start, start_cluster,
+                                      self._nodesOf(start_cluster) + [goal])
+        goal_edges = dict(self._distances(goal, goal_cluster, self._nodesOf(goal_cluster)))
+
+        def heuristic(index: int) -> int:
+            row, col = divmod(index, cols)
+            return abs(row - goal_row) + abs(col - goal_col)
+
+        cost, parent = {start: 0}, {start: -1}
+        frontier = [(heuristic(start), start)]
+        while frontier:
+            key, current = heappop(frontier)
+            if key - heuristic(current) > cost[current]:
+                continue   # outdated: the node was reached more cheaply since
+            self.expanded += 1
+            if current == goal:
+                break
+            edges = start_edges if current == start else \
+                    self._intra[self._clusterOf(current)].get(current, [])
+            edges = edges + [(partner, 1) for partner in self._partners.get(current, [])]
+            if current in goal_edges:
+                edges.append((goal, goal_edges[current]))
+            for neighbor, length in edges:
+                new_cost = cost[current] + length
+                if new_cost < cost.get(neighbor, new_cost + 1):
+                    cost[neighbor], parent[neighbor] = new_cost, current
+                    heappush(frontier, (new_cost + heuristic(neighbor), neighbor))
+        if goal not in parent:
+            return None
+
+        abstract = [goal]
+        while parent[abstract[-1]] >= 0:
+            abstract.append(parent[abstract[-1]])
+        abstract.reverse()
+        path = [start]
+        for source, target in zip(abstract, abstract[1:]):
+            cluster = self._clusterOf(source)
+            if cluster != self._clusterOf(target):
+                path.append(target)   # across an edge: the two cells are adjacent
+                continue
+            steps = self._search(source, cluster, target)
+            piece = [target]
+            while steps[piece[-1]] != source:
+                piece.append(steps[piece[-1]])
+            path.extend(reversed(piece))
+        return path
+
+###################
+def main() -> None:
+    # 12x12 in 4x4 clusters, open but for a wall across row 5 with one gap,
+    # at column 10:
+    rows, cols = 12, 12
+    blocked = bytearray(rows * cols)
+    for col in range(cols):
+        if col != 10:
+            blocked[5 * cols + col] = 1
+    hierarchy = Hierarchy(rows, cols, blocked.__getitem__, cluster_size = 4)
+
+    path = hierarchy.findPath(0, 11 * cols)   # (0,0) to (11,0)
+    print(f"Path (0,0) to (11,0): {len(path) - 1} moves (Expected: 31, through the gap; " +
+          f"a shortest path is 31 too), expanded {hierarchy.expanded}")
+    print(f"Passes the gap? {5 * cols + 10 in path} (Expected: True)")
+
+    blocked[5 * cols + 1] = 0   # open a second gap, at column 1
+    hierarchy.cellChanged(5 * cols + 1)
+    path = hierarchy.findPath(0, 11 * cols)
+    print(f"After opening (5,1): {len(path) - 1} moves (Expected: 17, where a shortest " +
+          f"path is 13: paths must pass through the clusters' transitions)")
+
+    blocked[5 * cols + 1] = blocked[5 * cols + 10] = 1   # close both gaps
+    hierarchy.cellChanged(5 * cols + 1)
+    hierarchy.cellChanged(5 * cols + 10)
+    print(f"With the wall closed: {hierarchy.findPath(0, 11 * cols)} (Expected: None)")
+
+if __name__ == "__main__":
+    main()
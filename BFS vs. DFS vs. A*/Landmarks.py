@@ -0,0 +1,95 @@
+from __future__ import annotations
+from array import array
+from typing import Callable, Sequence
+
+def compactDistances(distance: array) -> array:
+    ''' returns a distance map that marks unreachable cells -1 (see
+        Maze._distancesFrom) in the smallest unsigned type that holds it
+        (uint16 or uint32), with the type's maximum for unreachable cells '''
+    typecode = 'H' if max(distance, default = 0) < 2 ** 16 - 1 else 'I'
+    unreached = 2 ** (8 * array(typecode).itemsize) - 1
+    return array(typecode, [unreached if d < 0 else d for d in distance])
+
+def chooseLandmarks(count: int, from_start: array,
+                    table: Callable[[int], Sequence[int]]) -> array:
+    ''' function to choose landmark cells farthest first: each is the cell
+        farthest from the start and every landmark chosen so far, which
+        spreads them around the edges of the start's component, where their
+        bounds are tightest
+    Parameters:
+        count:      the most landmarks to choose (fewer if the start's
+                    component runs out of cells)
+        from_start: every cell's distance from the start, -1 if unreachable
+        table:      function returning a landmark's table (see
+                    compactDistances), which the caller may keep for reuse
+    Returns:
+        an array('i') of the flat indices of the landmarks, in the order chosen
+    '''
+    closest = from_start   # to the nearest landmark (or the start)
+    cells = array('i')
+    for _ in range(count):
+        farthest = max(range(len(closest)), key = closest.__getitem__)
+        if closest[farthest] <= 0:
+            break   # every reachable cell is a landmark already
+        cells.append(farthest)
+        closest = array('i', map(min, closest, table(farthest)))
+    return cells
+
+################################################################################
+class Landmarks:
+    ''' landmark tables for the ALT heuristic (A*, Landmarks, Triangle
+        inequality; Goldberg & Harrelson): each table holds every cell's BFS
+        distance from one landmark cell, so for any cells n and goal the
+        triangle inequality gives |d(L, n) - d(L, goal)| <= d(n, goal); the
+        largest of these bounds over the landmarks, which unlike the
+        Manhattan distance accounts for walls, is an admissible and
+        consistent heuristic; the tables are stored as uint16 where every
+        distance fits, uint32 otherwise, with the type's maximum for cells a
+        landmark cannot reach
+    '''
+    __slots__ = ('cells', 'tables')
+
+    def __init__(self, cells: Sequence[int], tables: list[Sequence[int]]):
+        self.cells:  Sequence[int]       = cells    # flat index of each landmark
+        self.tables: list[Sequence[int]] = tables   # distances from each landmark
+
+    def bounds(self, goal: int) -> list[tuple[Sequence[int], int]]:
+        ''' returns (table, the goal's distance in it) for every landmark that
+            can reach the goal; only those bound distances to it '''
+        return [(table, table[goal]) for table in self.tables
+                if table[goal] != 2 ** (8 * table.itemsize) - 1]
+
+
+###################
+def main() -> None:
+    # a 1x7 corridor with a blocked cell at the east end:
+    #   | | | | | | |░|
+    cols = 7
+    blocked = [False] * 6 + [True]
+
+    def distancesFrom(root: int) -> array:
+        distance = array('i', [-1]) * cols
+        distance[root] = 0
+        for current in range(root + 1, cols):
+            if blocked[current]:
+                break
+            distance[current] = distance[current - 1] + 1
+        for current in range(root - 1, -1, -1):
+            distance[current] = distance[current + 1] + 1
+        return distance
+
+    table = compactDistances(distancesFrom(5))
+    print(f"Table from (0,5): typecode {table.typecode}, {table.tolist()}")
+    print("Expected:        typecode H, [5, 4, 3, 2, 1, 0, 65535]")
+
+    cells = chooseLandmarks(2, distancesFrom(2), lambda cell: compactDistances(distancesFrom(cell)))
+    print(f"Landmarks chosen from (0,2): {cells.tolist()} (Expected: [5, 0], the two ends)")
+
+    landmarks = Landmarks(cells, [compactDistances(distancesFrom(cell)) for cell in cells])
+    goal = 1
+    bound = max(abs(table[3] - at_goal) for table, at_goal in landmarks.bounds(goal))
+    print(f"ALT bound from (0,3) to (0,1): {bound} (Expected: 2, exact in a corridor)")
+    print(f"Landmarks bounding the blocked cell: {len(landmarks.bounds(6))} (Expected: 0)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+from __future__ import annotations
+import os
+import tempfile
+import numpy as np
+
+################################################################################
+class LayoutCache:
+    ''' class representing an on-disk cache of integer arrays derived from maze
+        layouts (distance maps, component labels, jump tables, ...); arrays are
+        grouped by the fingerprint of the layout they were derived from, saved
+        as .npy files, and memory-mapped read-only when loaded, so a restarted
+        process (or several worker processes) can share them without parsing
+    '''
+    __slots__ = ('_directory',)
+
+    def __init__(self, directory: str):
+        ''' initializer method for a LayoutCache object
+        Parameters:
+            directory: path of the directory holding the cache (created if
+                       it does not exist yet)
+        '''
+        os.makedirs(directory, exist_ok = True)
+        self._directory: str = directory
+
+    def _path(self, fingerprint: str, name: str) -> str:
+        ''' returns the path of the .npy file for one named array of a layout '''
+        return os.path.join(self._directory, fingerprint, name + ".npy")
+
+    def load(self, fingerprint: str, name: str) -> np.ndarray | None:
+        ''' method to memory-map a cached array read-only
+        Parameters:
+            fingerprint: the layout fingerprint (see Maze.fingerprint)
+            name:        the name the array was stored under
+        Returns:
+            the memory-mapped array, or None if it is not in the cache
+        '''
+        path = self._path(fingerprint, name)
+        if not os.path.exists(path):
+            return None
+        return np.load(path, mmap_mode = 'r')
+
+    def store(self, fingerprint: str, name: str, data: np.ndarray) -> np.ndarray:
+        ''' method to save an array in the cache; the file is written under a
+            temporary name and then renamed, so concurrent readers only ever
+            see complete files
+        Parameters:
+            fingerprint: the layout fingerprint (see Maze.fingerprint)
+            name:        the name to store the array under
+            data:        the array to save
+        Returns:
+            the saved array, memory-mapped back from the cache
+        '''
+        path = self._path(fingerprint, name)
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+        handle, temp_path = tempfile.mkstemp(dir = os.path.dirname(path), suffix = ".npy")
+        try:
+            with os.fdopen(handle, "wb") as file:
+                np.save(file, data)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)   # so a failed save leaves no temporary file behind
+            raise
+        return self.load(fingerprint, name)
+
+###################
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        cache = LayoutCache(directory)
+        print(f"Load before store: {cache.load('abc123', 'distances')}")
+        print("Expected:          None\n")
+
+        cache.store('abc123', 'distances', np.arange(5, dtype = np.int32))
+        loaded = cache.load('abc123', 'distances')
+        print(f"Load after store: {loaded.tolist()}")
+        print("Expected:         [0, 1, 2, 3, 4]")
+        print(f"Memory-mapped? {isinstance(loaded, np.memmap)}")
+        print("Expected:      True")
+
+if __name__ == "__main__":
+    main()
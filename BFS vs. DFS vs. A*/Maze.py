@@ -1,10 +1,48 @@
 from __future__ import annotations
 from enum import Enum
-from typing import NamedTuple
+from typing import Callable, Iterable, Iterator, Sequence, TextIO, TYPE_CHECKING
 from Stack import Stack
 from Queue import Queue
-from PriorityQueue import PriorityQueue
+from PriorityQueue import IndexedPriorityQueue, HeapEntry, BucketQueue
+from SearchStats import SearchStats
+from MazeFile import MazeFile, writeMazeFile, convertTextFile
+from MazeGenerator import PERFECT_GENERATORS, randomMask, carvePath
+from BitGrid import BitGrid
+from Components import Components, labelComponents
+from DStarLite import DStarLite
+from TileWorker import tileDistances, UNREACHED
+from Hierarchy import Hierarchy
+from Landmarks import Landmarks, chooseLandmarks, compactDistances
+from Position import Position, DIRECTION_MOVEMENTS
+from DistanceField import DistanceField
+from SearchScratch import SearchScratch
+from BatchSolver import BatchSolver, initBatchWorker, solveBatch
+from array import array
+from heapq import heappush, heappop
+from collections import OrderedDict
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import io
+import os
 import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+if TYPE_CHECKING:
+    from LayoutCache import LayoutCache
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for the vectorized search methods
+    np = None
+
+def _requireNumpy(feature: str) -> None:
+    ''' raises ImportError naming the given feature if numpy is unavailable '''
+    if np is None:
+        raise ImportError(f"{feature} requires numpy to be installed")
 
 ################################################################################
 class Contents(str, Enum):
@@ -23,14 +61,11 @@ class Contents(str, Enum):
 
     def __str__(self) -> str: return self.value
 
-################################################################################
-class Position(NamedTuple):
-    ''' just allows us to use .row and .col rather than the less-easy-to-read
-        [0] and [1] for accessing values'''
-    row: int
-    col: int
-
-    def __str__(self) -> str: return f"({self.row},{self.col})"
+# compact mazes store each cell's Contents as a single byte: the byte is the
+# index of the Contents member in definition order (so EMPTY is 0)
+CONTENTS_BY_CODE: list[Contents]     = list(Contents)
+CODE_BY_CONTENTS: dict[Contents,int] = {c: i for i, c in enumerate(CONTENTS_BY_CODE)}
+BLOCKED_CODE = CODE_BY_CONTENTS[Contents.BLOCKED]
 
 ################################################################################
 class SearchOrder(Enum):
@@ -39,6 +74,10 @@ class SearchOrder(Enum):
     NESW   = 2
     RANDOM = 3
 
+# how many DistanceFields (one per goal) a Maze keeps before evicting the
+# least recently used
+DISTANCE_FIELDS_CACHED = 16
+
 ################################################################################
 class Cell:
     ''' class that allows us to use Cell as a data type -- an ordered triple 
@@ -130,17 +169,86 @@ class Cell:
                self._position.col == other._position.col and \
                self._contents == other._contents
 
+################################################################################
+class CellView(Cell):
+    ''' lightweight stand-in for a Cell inside a compact Maze: a view holds only
+        the Maze and the cell's flat index (row * cols + col), and its contents,
+        parent, cost, and heuristic are read from and written to the Maze's flat
+        arrays, so views can be created on demand and thrown away freely
+    '''
+    __slots__ = ('_maze', '_index')
+
+    def __init__(self, maze: Maze, index: int):
+        self._maze:  Maze = maze
+        self._index: int  = index
+
+    @property
+    def _position(self) -> Position:
+        return Position(*divmod(self._index, self._maze._num_cols))
+
+    @property
+    def _contents(self) -> Contents:
+        return CONTENTS_BY_CODE[self._maze._flat_contents[self._index]]
+
+    @_contents.setter
+    def _contents(self, contents: Contents) -> None:
+        self._maze._flat_contents[self._index] = CODE_BY_CONTENTS[contents]
+
+    @property
+    def _parent(self) -> Cell | None:
+        parent = self._maze._flat_parent[self._index]
+        return None if parent < 0 else CellView(self._maze, parent)
+
+    @_parent.setter
+    def _parent(self, parent: CellView | None) -> None:
+        self._maze._flat_parent[self._index] = -1 if parent is None else parent._index
+
+    # costs and heuristics are integers on a unit-cost grid, so the flat arrays
+    # are integer arrays using -1 to stand in for an infinite (unknown) cost
+    @property
+    def _cost(self) -> float:
+        cost = self._maze._flat_cost[self._index]
+        return float('inf') if cost < 0 else cost
+
+    @_cost.setter
+    def _cost(self, cost: float) -> None:
+        self._maze._flat_cost[self._index] = -1 if cost == float('inf') else cost
+
+    @property
+    def _heur(self) -> float:
+        return self._maze._flat_heur[self._index]
+
+    @_heur.setter
+    def _heur(self, heur: float) -> None:
+        self._maze._flat_heur[self._index] = heur
+
+    def isBlocked(self) -> bool:
+        ''' Boolean method to indicate whether this cell contains a block
+        Returns:
+            True if the cell is blocked (cannot be explored), False o/w
+        '''
+        return self._maze._flat_contents[self._index] == BLOCKED_CODE
+
 ################################################################################
 class Maze:
-    ''' class representing a 2D maze of Cell objects '''
-    __slots__ = ('_grid', '_num_rows', '_num_cols', '_start', '_goal', '_search_order', '_path_length', '_num_cells_pushed', '_num_cells_explored')
+    ''' class representing a 2D maze of Cell objects; a compact Maze instead
+        keeps every cell's state in flat arrays indexed by row * cols + col and
+        only creates (CellView) Cell objects when they are asked for
+    '''
+    __slots__ = ('_grid', '_num_rows', '_num_cols', '_start', '_goal', '_search_order', '_path_length', '_num_cells_pushed', '_num_cells_explored',
+                 '_num_cells_explored_forward', '_num_cells_explored_backward',
+                 '_flat_contents', '_flat_parent', '_flat_cost', '_flat_heur', '_adjacency',
+                 '_jump_tables', '_fingerprint', '_layout_cache', '_components', '_goal_distances',
+                 '_planner', '_scratch', '_stats', '_bits', '_hierarchy', '_landmark_count',
+                 '_landmarks', '_terrain', '_distance_fields')
  
     def __init__(self, rows: int = 10, cols: int = 10,
                        start:        Position = None, \
                        goal:         Position = None, \
                        prop_blocked: float = 0.2, \
                        search_order: SearchOrder = SearchOrder.NSWE, \
-                       debug: bool = False):
+                       debug: bool = False, \
+                       compact: bool = False):
         ''' initializer method for a Maze object
         Parameters:
             rows:          number of rows in the grid
@@ -150,6 +258,9 @@ class Maze:
             prop_blocked:  proportion of cells to be blocked (between 0.0 and 1.0)
             search_order:  SearchOrder enum -- one of NSWE, NESW, or RANDOM
             debug:         whether to use one of the Maze examples from course slides
+            compact:       whether to store the grid as flat arrays (one byte of
+                           contents plus integer parent/cost/heuristic slots per
+                           cell) rather than as a 2D list of Cell objects
         Raises:
             TypeError  if prop_blocked is not a float
             ValueError if prop_blocked is not in (0,1)
@@ -190,39 +301,213 @@ class Maze:
 
         self._num_rows     = rows
         self._num_cols     = cols
-        self._start        = Cell(start.row, start.col, Contents.START)
-        self._goal         = Cell(goal.row,  goal.col,  Contents.GOAL)
         self._search_order = search_order
         self._path_length = 0
         self._num_cells_pushed = 0
         self._num_cells_explored = 0
-
-        # create a rows x cols 2D list of Cell objects, intially all empty
-        self._grid: list[list[Cell]] = \
-            [ [Cell(r,c, Contents.EMPTY) for c in range(cols)] for r in range(rows) ]
-
-        # set the start and goal cells (overriding two empty Cell objects from above)
-        self._grid[start.row][start.col] = self._start
-        self._grid[goal.row][goal.col]   = self._goal
-
-        # put blocks at random spots in the grid, using given proportion;  
-        # start by creating a collapsed 1D version of the grid, then
-        #   remove the start and goal, and then randomly pick cells to block;
-        # note that we are using identical object references in both 
-        #   options and self._grid so that updates to options will be seen
-        #   in self._grid (i.e., options is not a deep copy of cells);
-        if not debug: 
-            options = [cell for row in self._grid for cell in row]
-            options.remove(self._start)
-            options.remove(self._goal)
-            blocked = random.sample(options, k = round((rows * cols - 2) * prop_blocked))
-            for b in blocked: 
-                b._contents = Contents.BLOCKED  # this is changing self._grid!
+        self._num_cells_explored_forward  = 0   # per-direction counts for the
+        self._num_cells_explored_backward = 0   # bidirectional searches
+        self._adjacency = None   # built on first search; see _getAdjacency
+        self._jump_tables = None # built on first jps(); see _getJumpTables
+        self._fingerprint = None
+        self._layout_cache = None
+        self._components = None
+        self._goal_distances = None
+        self._planner = None     # created by the first replan()
+        self._scratch = None     # created by the first *Indexed search
+        self._stats = None       # attached by useStats
+        self._bits = None        # built on first bit-parallel query; see _getBits
+        self._hierarchy = None   # created by the first hpaStar()
+        self._landmark_count = 0 # set by useLandmarks
+        self._landmarks = None   # built by useLandmarks; see _getLandmarks
+        self._terrain = None     # per-cell move costs, created by the first setTerrainCost
+        self._distance_fields = OrderedDict()   # goal index -> DistanceField, oldest first
+
+        if compact:
+            # flat per-cell arrays, indexed by row * cols + col, all initially
+            # empty with no parent, unknown (-1) cost, and zero heuristic
+            num_cells = rows * cols
+            self._grid          = None
+            self._flat_contents = bytearray(num_cells)
+            self._flat_parent   = array('i', [-1]) * num_cells
+            self._flat_cost     = array('i', [-1]) * num_cells
+            self._flat_heur     = array('i', [0])  * num_cells
+            self._start = CellView(self, start.row * cols + start.col)
+            self._goal  = CellView(self, goal.row  * cols + goal.col)
+            self._start._contents = Contents.START
+            self._goal._contents  = Contents.GOAL
+        else:
+            self._flat_contents = self._flat_parent = None
+            self._flat_cost     = self._flat_heur   = None
+            self._start = Cell(start.row, start.col, Contents.START)
+            self._goal  = Cell(goal.row,  goal.col,  Contents.GOAL)
+
+            # create a rows x cols 2D list of Cell objects, intially all empty
+            self._grid: list[list[Cell]] = \
+                [ [Cell(r,c, Contents.EMPTY) for c in range(cols)] for r in range(rows) ]
+
+            # set the start and goal cells (overriding two empty Cell objects from above)
+            self._grid[start.row][start.col] = self._start
+            self._grid[goal.row][goal.col]   = self._goal
+
+        # put blocks at random spots in the grid, using given proportion: pick
+        #   flat indices among the cells other than the start and goal, where
+        #   the i-th such cell is the i-th cell in row-major order once the
+        #   start and goal are skipped (sampling a range rather than building
+        #   and trimming a list of cells, so a given seed yields the same maze
+        #   in either layout); see MazeGenerator for faster or solvable layouts
+        if not debug:
+            first, second = sorted((start.row * cols + start.col, goal.row * cols + goal.col))
+            num_blocked = round((rows * cols - 2) * prop_blocked)
+            for index in random.sample(range(rows * cols - 2), k = num_blocked):
+                if index >= first:  index += 1
+                if index >= second: index += 1
+                if compact:
+                    self._flat_contents[index] = BLOCKED_CODE
+                else:
+                    self._grid[index // cols][index % cols]._contents = Contents.BLOCKED
         else:
             # for example from slides
             pos = [(1,0),(1,3),(2,1),(2,4),(3,2),(5,1),(5,3),(5,4)]
             for p in pos:
-                self._grid[p[0]][p[1]]._contents = Contents.BLOCKED
+                self._cellAt(p[0] * cols + p[1])._contents = Contents.BLOCKED
+
+    @classmethod
+    def fromBlocked(cls, rows: int, cols: int, row_flags: Iterable[bytes],
+                         start: Position, goal: Position,
+                         search_order: SearchOrder = SearchOrder.NSWE,
+                         compact: bool = True) -> Maze:
+        ''' alternate constructor building a Maze from a given layout rather
+            than a random one
+        Parameters:
+            rows:         number of rows in the grid
+            cols:         number of columns in the grid
+            row_flags:    the grid's rows in order, each as one byte per cell
+                          (0 for open, anything else for blocked), e.g. from
+                          MazeFile.rowFlags
+            start:        Position object indicating the (row,col) of the start cell
+            goal:         Position object indicating the (row,col) of the goal cell
+            search_order: SearchOrder enum -- one of NSWE, NESW, or RANDOM
+            compact:      whether to store the grid as flat arrays (see __init__)
+        Returns:
+            the new Maze
+        Raises:
+            ValueError if row_flags does not hold rows rows of cols cells, or
+                if the start or goal cell is blocked (and as for __init__)
+        '''
+        maze = cls(rows, cols, start, goal, prop_blocked = 0.0,
+                   search_order = search_order, compact = compact)
+        to_codes = bytes([0]) + bytes([BLOCKED_CODE]) * 255
+        num_rows = 0
+        for row, flags in enumerate(row_flags):
+            if row >= rows or len(flags) != cols:
+                raise ValueError(f"row_flags must hold {rows} rows of {cols} cells")
+            if compact:
+                maze._flat_contents[row * cols:(row + 1) * cols] = flags.translate(to_codes)
+            else:
+                for col, flag in enumerate(flags):
+                    if flag: maze._grid[row][col]._contents = Contents.BLOCKED
+            num_rows += 1
+        if num_rows != rows:
+            raise ValueError(f"row_flags must hold {rows} rows of {cols} cells")
+
+        if maze._start.isBlocked() or maze._goal.isBlocked():
+            raise ValueError("the start and goal cells cannot be blocked")
+        maze._start._contents = Contents.START   # a compact row copy overwrote them
+        maze._goal._contents  = Contents.GOAL
+        return maze
+
+    @classmethod
+    def generate(cls, rows: int, cols: int, method: str = "random",
+                      prop_blocked: float = 0.2, seed: int | None = None,
+                      start: Position = None, goal: Position = None,
+                      search_order: SearchOrder = SearchOrder.NSWE,
+                      ensure_path: bool = False, compact: bool = True) -> Maze:
+        ''' alternate constructor building a Maze from a generated layout (see
+            MazeGenerator): "random" blocks prop_blocked of the cells, drawn in
+            one vectorized call by a NumPy Generator, while "backtracker",
+            "kruskal", and "wilson" carve perfect mazes, where exactly one path
+            joins any two open cells (with odd rows and cols, every cell at an
+            even row and col is open, including the default corners)
+        Parameters:
+            rows:         number of rows in the grid
+            cols:         number of columns in the grid
+            method:       one of "random", "backtracker", "kruskal", or "wilson"
+            prop_blocked: proportion of cells to block, for "random" only
+            seed:         seed for the generator, so a given seed always yields
+                          the same layout (None for a fresh one)
+            start:        Position object indicating the (row,col) of the start
+                          cell (default: the UL corner)
+            goal:         Position object indicating the (row,col) of the goal
+                          cell (default: the LR corner)
+            search_order: SearchOrder enum -- one of NSWE, NESW, or RANDOM
+            ensure_path:  whether to guarantee that the goal is reachable, by
+                          unblocking the fewest cells that join it to the start
+                          (see MazeGenerator.carvePath) instead of retrying
+            compact:      whether to store the grid as flat arrays (see __init__)
+        Returns:
+            the new Maze
+        Raises:
+            ValueError  if method is not one of those above, or if the row/col
+                of start or goal is out of range
+            ImportError if method is "random" and numpy is not installed
+        '''
+        if start is None or goal is None:
+            start = Position(0, 0)
+            goal  = Position(rows - 1, cols - 1)
+        for name, position in (("start", start), ("goal", goal)):
+            if not (0 <= position.row < rows and 0 <= position.col < cols):
+                raise ValueError(f"invalid (row,col) given for {name} cell")
+
+        if method == "random":
+            mask = randomMask(rows, cols, prop_blocked, seed, tuple(start), tuple(goal))
+        elif method in PERFECT_GENERATORS:
+            mask = PERFECT_GENERATORS[method](rows, cols, seed)
+        else:
+            raise ValueError(f"method must be one of random, {', '.join(PERFECT_GENERATORS)}")
+
+        if ensure_path:
+            carvePath(mask, rows, cols, tuple(start), tuple(goal))
+        else:
+            # a perfect maze's walls may cover a start or goal off the rooms
+            mask[start.row * cols + start.col] = mask[goal.row * cols + goal.col] = 0
+        return cls.fromBlocked(rows, cols, (mask[i:i + cols] for i in range(0, rows * cols, cols)),
+                               start, goal, search_order, compact)
+
+    @classmethod
+    def fromFile(cls, path: str, search_order: SearchOrder = SearchOrder.NSWE,
+                                 compact: bool = True) -> Maze:
+        ''' alternate constructor loading a Maze from a maze file (see MazeFile);
+            the file is only mapped while loading: its whole mask is copied
+            into the new Maze's own grid (a byte per cell when compact), so
+            the Maze takes as much memory as one built any other way, and
+            the bit-packed mask is rebuilt from that grid when first needed
+        Parameters:
+            path:         the maze file to read
+            search_order: SearchOrder enum -- one of NSWE, NESW, or RANDOM
+            compact:      whether to store the grid as flat arrays (see __init__)
+        Returns:
+            the new Maze
+        Raises:
+            ValueError if the file is not a valid maze file
+        '''
+        with MazeFile(path) as maze_file:
+            rows, cols = maze_file.getShape()
+            maze = cls.fromBlocked(rows, cols, (maze_file.rowFlags(row) for row in range(rows)),
+                                   Position(*maze_file.getStart()), Position(*maze_file.getGoal()),
+                                   search_order, compact)
+        return maze
+
+    def saveFile(self, path: str) -> None:
+        ''' method to save this Maze's layout, start, and goal as a maze file
+            (see MazeFile), which Maze.fromFile can load back
+        Parameters:
+            path: the maze file to create (or replace)
+        '''
+        flags, cols = self._blockedFlags(), self._num_cols
+        writeMazeFile(path, self._num_rows, cols, tuple(self._start._position),
+                      tuple(self._goal._position),
+                      (flags[i:i + cols] for i in range(0, len(flags), cols)))
 
     def __str__(self) -> str:
         ''' creates a str version of the Maze, showing contents, with cells
@@ -230,10 +515,46 @@ class Maze:
         Returns:
             a str representation of the Maze
         '''
-        maze_str = ""
-        for row in self._grid:  # row : list[Cell] 
-            maze_str += "|" + "|".join([cell._contents for cell in row]) + "|\n"
-        return maze_str[:-1]  # remove the final \n
+        return "\n".join(self._rowStrings())
+
+    def _rowStrings(self, on_path: bytearray | None = None) -> Iterator[str]:
+        ''' yields the rendering of each row in turn (see __str__), without a
+            newline, so a caller can consume a few rows at a time
+        Parameters:
+            on_path: if given, one byte per cell (indexed by row * cols + col)
+                     that is 1 for cells to show as on the path, whatever
+                     their contents, and 0 for every other cell
+        '''
+        cols = self._num_cols
+        symbols = [contents.value for contents in CONTENTS_BY_CODE]
+        path_symbol = Contents.PATH.value
+        for row in range(self._num_rows):
+            if self._grid is None:
+                cells = [symbols[code] for code in self._flat_contents[row * cols:(row + 1) * cols]]
+            else:
+                cells = [cell._contents.value for cell in self._grid[row]]
+            if on_path is not None:
+                # find() skips between marks, so rows off the path cost nothing
+                marks = on_path[row * cols:(row + 1) * cols]
+                col = marks.find(1)
+                while col >= 0:
+                    cells[col] = path_symbol
+                    col = marks.find(1, col + 1)
+            yield "|" + "|".join(cells) + "|"
+
+    def getCell(self, position: Position) -> Cell:
+        ''' accessor method to return the Cell object at a given Position
+        Parameters:
+            position: Position object indicating the (row,col) of the cell
+        Returns:
+            the Cell object at that location (a CellView for a compact Maze)
+        Raises:
+            ValueError if the row/col of position is out of range
+        '''
+        if position.row < 0 or position.row >= self._num_rows or \
+           position.col < 0 or position.col >= self._num_cols:
+            raise ValueError("invalid (row,col) given for cell")
+        return self._cellAt(position.row * self._num_cols + position.col)
 
     def getStart(self) -> Cell: 
         ''' accessor method to return the Cell object corresponding to the Maze start
@@ -249,17 +570,148 @@ class Maze:
         '''
         return self._goal
 
-    def getSearchLocations(self, cell: Cell) -> list[Cell]:
-        ''' method to return a list of Cell objects of valid places to explore
-            (i.e., not blocked and within the grid)
+    def setTerrainCost(self, position: Position, cost: int) -> None:
+        ''' method to set the cost of moving into the cell at a given Position
+            (every cell costs 1 until given another cost); aStar and dial find
+            the cheapest path by these costs, while the other searches still
+            count moves
         Parameters:
-            cell:  the current Cell being explored
+            position: Position object indicating the (row,col) of the cell
+            cost:     the cost of a move into the cell, from 1 to 255
+        Raises:
+            ValueError if the row/col of position is out of range, or if cost
+                is out of range
+        '''
+        cell = self.getCell(position)
+        if not 1 <= cost <= 255:
+            raise ValueError(f"terrain cost {cost} is not between 1 and 255")
+        if self._terrain is None:
+            self._terrain = array('B', [1]) * (self._num_rows * self._num_cols)
+        self._terrain[self._indexOf(cell)] = cost
+        self._distance_fields.clear()
+
+    def getTerrainCost(self, position: Position) -> int:
+        ''' method to return the cost of moving into the cell at a given Position
+        Raises:
+            ValueError if the row/col of position is out of range
+        '''
+        cell = self.getCell(position)
+        return 1 if self._terrain is None else self._terrain[self._indexOf(cell)]
+
+    def pathCost(self, goal: Cell) -> int:
+        ''' method to total the terrain costs of the moves along the path that
+            ends at a Cell (following parents back to the start)
+        Parameters:
+            goal: a Cell object returned by a search
         Returns:
-            a list of valid Cell objects (in N/S/W/E exploration) for further
-            consideration
+            the sum of the costs of every cell on the path but the start
         '''
-        direction_movements = {"N": (-1, 0), "S": (1, 0), "W": (0, -1), "E": (0, 1)}
+        cost, cell = 0, goal
+        while cell != self._start:
+            cost += 1 if self._terrain is None else self._terrain[self._indexOf(cell)]
+            cell = cell._parent
+        return cost
 
+    def setBlocked(self, position: Position, blocked: bool = True) -> None:
+        ''' method to block or unblock the cell at a given Position; this is how
+            a Maze's layout should be changed after construction, since it also
+            throws away the neighbor adjacency (and other search tables) cached
+            for the old layout
+        Parameters:
+            position: Position object indicating the (row,col) of the cell
+            blocked:  True to block the cell, False to make it empty again
+        Raises:
+            ValueError if the row/col of position is out of range, or if
+                position is the start or goal
+        '''
+        cell = self.getCell(position)
+        if position == self._start._position or position == self._goal._position:
+            raise ValueError("cannot block or unblock the start or goal cell")
+        if cell.isBlocked() == blocked:
+            return
+        cell._contents = Contents.BLOCKED if blocked else Contents.EMPTY
+
+        # the incremental planner, the HPA* clusters, and the component labels
+        # are repaired rather than rebuilt
+        if self._planner is not None:
+            self._planner.cellChanged(self._indexOf(cell))
+        if self._hierarchy is not None:
+            self._hierarchy.cellChanged(self._indexOf(cell))
+        if self._components is not None:
+            index = self._indexOf(cell)
+            if blocked:
+                self._components.block(index, self._openNeighbors(index), self._openNeighbors)
+            else:
+                self._components.unblock(index, self._openNeighbors(index))
+        self._layoutChanged()
+
+    def _layoutChanged(self) -> None:
+        ''' throws away everything cached for the old set of blocked cells
+            (except the component labels, which setBlocked keeps up to date)
+        '''
+        self._adjacency      = None
+        self._jump_tables    = None
+        self._fingerprint    = None
+        self._goal_distances = None
+        self._bits           = None
+        self._landmarks      = None
+        self._distance_fields.clear()
+
+    def _isBlockedAt(self, index: int) -> bool:
+        ''' indicates whether the cell at a flat index is blocked '''
+        if self._grid is None:
+            return self._flat_contents[index] == BLOCKED_CODE
+        return self._grid[index // self._num_cols][index % self._num_cols].isBlocked()
+
+    def replan(self, start: Position = None) -> Cell | None:
+        ''' method to find a shortest path from the start to the goal that is
+            kept up to date incrementally (D* Lite): the first call searches
+            from scratch, and later calls only repair the parts of that search
+            affected by cells blocked or unblocked (via setBlocked) since, or by
+            the start having moved (e.g., an agent partway along its route), so
+            their cost grows with the size of the change rather than the grid;
+            _num_cells_explored counts the cells the call had to (re)expand
+        Parameters:
+            start: if given, the Position to move the Maze's start to first
+        Returns:
+            a Cell object corresponding to the Maze goal, with parents set
+            along a shortest path from the start, or None if no goal can be
+            found
+        Raises:
+            ValueError if start is out of range, blocked, or the goal
+        '''
+        if start is not None and start != self._start._position:
+            cell = self.getCell(start)
+            if cell.isBlocked() or cell.isGoal():
+                raise ValueError("the start cannot be moved onto a blocked cell or the goal")
+            self._start._contents = Contents.EMPTY
+            cell._contents = Contents.START
+            cell._parent = None     # may still point along an earlier path
+            self._start = cell
+
+        if self._planner is None:
+            self._planner = DStarLite(self._num_rows, self._num_cols, self._isBlockedAt,
+                                      self._indexOf(self._start), self._indexOf(self._goal))
+        self._num_cells_pushed = 0
+        self._num_cells_explored = self._planner.replan(self._indexOf(self._start))
+        path = self._planner.path()
+        return None if path is None else self._linkPath(path)
+
+    def _openNeighbors(self, index: int) -> list[int]:
+        ''' returns the flat indices of the open in-grid neighbors of a cell,
+            looked up directly rather than through the cached adjacency
+        '''
+        rows, cols = self._num_rows, self._num_cols
+        row, col = divmod(index, cols)
+        candidates = [(index - cols, row > 0), (index + cols, row < rows - 1),
+                      (index - 1, col > 0),    (index + 1, col < cols - 1)]
+        return [neighbor for neighbor, in_bounds in candidates
+                if in_bounds and not self._isBlockedAt(neighbor)]
+
+    def _directions(self) -> list[str]:
+        ''' returns the neighbor directions in this Maze's search order (in a
+            fresh random order on each call if the search order is RANDOM)
+        '''
         if self._search_order == SearchOrder.NSWE:
             directions = ["N", "S", "W", "E"]
         elif self._search_order == SearchOrder.NESW:
@@ -267,21 +719,88 @@ class Maze:
         elif self._search_order == SearchOrder.RANDOM:
             directions = ["N", "S", "E", "W"]
             random.shuffle(directions)
-            
-        neighbors = []
-        pos = cell.getPosition()
-        row, col = pos.row, pos.col
+        return directions
 
-        for i in directions: 
-            dr, dc = direction_movements[i]
-            new_row, new_col = row + dr, col + dc
-
-            if 0 <= new_row < self._num_rows and 0 <= new_col < self._num_cols:
-                neighbor = self._grid[new_row][new_col]
-                if not neighbor.isBlocked():
-                    neighbors.append(neighbor)
+    def _blockedFlags(self) -> bytes:
+        ''' returns one byte per cell, indexed by row * cols + col, that is 1 if
+            the cell is blocked and 0 otherwise
+        '''
+        if self._grid is None:
+            table = bytes(code == BLOCKED_CODE for code in range(256))
+            return self._flat_contents.translate(table)
+        return bytes(cell.isBlocked() for row in self._grid for cell in row)
+
+    def _indexOf(self, cell: Cell) -> int:
+        ''' returns the flat index (row * cols + col) of a cell in this Maze '''
+        return cell._position.row * self._num_cols + cell._position.col
+
+    def _cellAt(self, index: int) -> Cell:
+        ''' internal accessor returning the Cell at an in-range flat index: the
+            stored Cell object, or a fresh CellView for a compact Maze
+        '''
+        if self._grid is None:
+            return CellView(self, index)
+        return self._grid[index // self._num_cols][index % self._num_cols]
+
+    def _getAdjacency(self) -> tuple[array, array]:
+        ''' returns the Maze's neighbor adjacency in CSR (compressed sparse
+            row) form, building and caching it first if the layout has changed:
+            the open neighbors of the cell with flat index i, in search order,
+            are neighbors[offsets[i]:offsets[i + 1]]; blocked cells have none
+        Returns:
+            a tuple (offsets, neighbors) of integer arrays, of lengths
+            rows * cols + 1 and the total number of open-to-open moves
+        '''
+        if self._adjacency is not None:
+            return self._adjacency
+
+        rows, cols = self._num_rows, self._num_cols
+        blocked   = self._blockedFlags()
+        offsets   = array('i', [0]) * (rows * cols + 1)
+        neighbors = array('i')
+        random_order = self._search_order == SearchOrder.RANDOM
+        directions   = self._directions()
+
+        index = 0
+        for row in range(rows):
+            for col in range(cols):
+                if not blocked[index]:
+                    # a RANDOM Maze fixes each cell's shuffled order once here
+                    # rather than reshuffling on every visit
+                    if random_order: random.shuffle(directions)
+                    for d in directions:
+                        dr, dc = DIRECTION_MOVEMENTS[d]
+                        new_row, new_col = row + dr, col + dc
+                        if 0 <= new_row < rows and 0 <= new_col < cols and \
+                           not blocked[new_row * cols + new_col]:
+                            neighbors.append(new_row * cols + new_col)
+                index += 1
+                offsets[index] = len(neighbors)
+
+        self._adjacency = (offsets, neighbors)
+        return self._adjacency
+
+    def _getScratch(self) -> SearchScratch:
+        ''' returns the scratch arrays the *Indexed searches share, creating
+            them on first use (they depend only on the grid size, so layout
+            changes leave them valid)
+        '''
+        if self._scratch is None:
+            self._scratch = SearchScratch(self._num_rows * self._num_cols)
+        return self._scratch
 
-        return neighbors
+    def getSearchLocations(self, cell: Cell) -> list[Cell]:
+        ''' method to return a list of Cell objects of valid places to explore
+            (i.e., not blocked and within the grid)
+        Parameters:
+            cell:  the current Cell being explored
+        Returns:
+            a list of valid Cell objects (in N/S/W/E exploration) for further
+            consideration
+        '''
+        offsets, neighbors = self._getAdjacency()
+        index = self._indexOf(cell)
+        return [self._cellAt(i) for i in neighbors[offsets[index]:offsets[index + 1]]]
 
     def dfs(self) -> Cell | None:
         ''' method to perform DFS (using a stack) to implement maze searching
@@ -289,16 +808,22 @@ class Maze:
             a Cell object corresponding to the Maze goal, or None if no goal
             can be found
         ''' 
-        self._num_cells_explored = 0
+        if self._stats is not None:
+            return self._profiledSearch("dfs")
+        self._num_cells_pushed = self._num_cells_explored = 0
+        if not self._goalReachable():
+            return None   # start and goal are in different components
         
         start = self.getStart()
         goal = self.getGoal()
+        offsets, neighbors = self._getAdjacency()
 
         stack = Stack()
         explored = set()
 
         stack.push(start)
-        explored.add(start.getPosition())
+        explored.add(self._indexOf(start))
+        self._num_cells_pushed += 1
 
         while not stack.isEmpty():
             current = stack.pop()
@@ -307,31 +832,43 @@ class Maze:
             if current.isGoal():
                 return current
 
-            for neighbor in self.getSearchLocations(current):
-                pos = neighbor.getPosition()
-                if pos not in explored:
+            index = self._indexOf(current)
+            for neighbor_index in neighbors[offsets[index]:offsets[index + 1]]:
+                if neighbor_index not in explored:
+                    neighbor = self._cellAt(neighbor_index)
                     neighbor.setParent(current)
                     stack.push(neighbor)
-                    explored.add(pos)
+                    explored.add(neighbor_index)
+                    self._num_cells_pushed += 1
 
         return None
 
     def bfs(self) -> Cell | None:
-        ''' method to perform BFS (using a queue) to implement maze searching
+        ''' method to perform BFS (using a queue) to implement maze searching;
+            with a LayoutCache attached (see useLayoutCache), a shortest path
+            is read from the layout's cached goal distance map instead
         Returns:
             a Cell object corresponding to the Maze goal, or None if no goal
             can be found
         ''' 
-        self._num_cells_explored = 0
+        if self._stats is not None:
+            return self._profiledSearch("bfs")
+        self._num_cells_pushed = self._num_cells_explored = 0
+        if self._layout_cache is not None:
+            return self._lookupPath()
+        if not self._goalReachable():
+            return None   # start and goal are in different components
 
         start = self.getStart()
         goal = self.getGoal()
+        offsets, neighbors = self._getAdjacency()
 
         queue = Queue()
         explored = set()
 
         queue.push(start)
-        explored.add(start.getPosition())
+        explored.add(self._indexOf(start))
+        self._num_cells_pushed += 1
 
         while not queue.isEmpty():
             current = queue.pop()
@@ -340,91 +877,1352 @@ class Maze:
             if current.isGoal():
                 return current
 
-            for neighbor in self.getSearchLocations(current):
-                pos = neighbor.getPosition()
-                if pos not in explored:
+            index = self._indexOf(current)
+            for neighbor_index in neighbors[offsets[index]:offsets[index + 1]]:
+                if neighbor_index not in explored:
+                    neighbor = self._cellAt(neighbor_index)
                     neighbor.setParent(current)
                     queue.push(neighbor)
-                    explored.add(pos)
+                    explored.add(neighbor_index)
+                    self._num_cells_pushed += 1
 
         return None
     
+    def batchSolver(self) -> BatchSolver:
+        ''' method to get a BatchSolver for this Maze's current layout, first
+            building the cached adjacency it searches and the component labels
+            that unreachable reads, so neither is built during a query; each
+            thread needs its own, as the solver reuses one set of scratch buffers
+        Returns:
+            a new BatchSolver object (see BatchSolver.py)
+        '''
+        self._getComponents()
+        return BatchSolver(self._num_cols, *self._getAdjacency())
+
+    def solveMany(self, pairs: list[tuple[Position, Position]], processes: int = 0,
+                        cancelled: Callable[[], bool] | None = None) -> list[list[Position] | None]:
+        ''' method to answer a batch of shortest-path queries on this Maze's
+            current layout; unlike dfs/bfs/aStar this does not touch the cells
+            at all (no parents, costs, or path marks are written), and every
+            query shares the cached adjacency and one set of scratch buffers
+        Parameters:
+            pairs:     a list of (start, goal) Position pairs
+            processes: if greater than 1, the number of worker processes across
+                       which to spread the queries
+            cancelled: if given, a check that each search calls every
+                       CANCEL_CHECK_INTERVAL expansions, abandoning the batch
+                       once it returns True (e.g. a threading.Event's is_set,
+                       so another thread can stop a long search); searches
+                       in worker processes do not call it
+        Returns:
+            a list with one entry per pair: the list of Positions along a
+            shortest path from that start to that goal (both inclusive), or
+            None if the goal cannot be reached (pairs whose ends are blocked
+            or in different components are answered without searching)
+        Raises:
+            ValueError if the row/col of any start or goal is out of range
+            SearchCancelled if cancelled returned True
+        '''
+        cols = self._num_cols
+        blocked = [self.unreachable(start, goal) for start, goal in pairs]
+        queries = [(start.row * cols + start.col, goal.row * cols + goal.col)
+                   for (start, goal), skip in zip(pairs, blocked) if not skip]
+        solver = self.batchSolver()
+
+        if processes > 1 and len(queries) > 1:
+            chunk_size = -(-len(queries) // processes)  # ceiling division
+            chunks = [queries[i:i + chunk_size] for i in range(0, len(queries), chunk_size)]
+            with ProcessPoolExecutor(max_workers = processes,
+                                     initializer = initBatchWorker,
+                                     initargs = (cols, solver.offsets, solver.neighbors)) as pool:
+                paths = [path for chunk in pool.map(solveBatch, chunks) for path in chunk]
+        else:
+            paths = [solver.solve(start, goal, cancelled) for start, goal in queries]
+
+        paths = iter(paths)
+        return [None if skip else next(paths) for skip in blocked]
+
+    def bfsParallel(self, processes: int = None, tile_size: int = 128) -> Cell | None:
+        ''' method to find a shortest path with several processes at once: the
+            grid is cut into square tiles, and every cell's distance from the
+            start is settled by relaxing the tiles in rounds, each on a worker
+            process that maps the grid from shared memory (see tileDistances
+            and TileWorker); the path is then walked back from the goal; the
+            Maze's counters both hold the number of cells reached
+        Parameters:
+            processes: the number of worker processes (os.cpu_count() if None;
+                       1 or less relaxes the tiles in this process instead)
+            tile_size: cells along each side of a tile
+        Returns:
+            a Cell object corresponding to the Maze goal, with parents set
+            along a shortest path (as long as the one bfs finds, though ties
+            may be broken differently), or None if no goal can be found
+        '''
+        self._num_cells_pushed = self._num_cells_explored = 0
+        if not self._goalReachable():
+            return None   # start and goal are in different components
+
+        processes = os.cpu_count() if processes is None else processes
+        start, goal = self._indexOf(self._start), self._indexOf(self._goal)
+        dist = tileDistances(self._num_rows, self._num_cols, self._blockedFlags(),
+                             start, processes, tile_size)
+
+        self._num_cells_pushed = self._num_cells_explored = len(dist) - dist.tolist().count(UNREACHED)
+        path = [goal]
+        while path[-1] != start:
+            current = path[-1]
+            path.append(next(neighbor for neighbor in self._openNeighbors(current)
+                             if dist[neighbor] == dist[current] - 1))
+        path.reverse()
+        return self._linkPath(path)
+
+    def _blockedMask(self) -> np.ndarray:
+        ''' builds a flat NumPy boolean array, indexed by row * cols + col, that
+            is True exactly at the blocked cells
+        Returns:
+            a 1D bool array of length rows * cols
+        '''
+        return np.frombuffer(self._blockedFlags(), dtype=bool)
+
+    def bfsVectorized(self) -> Cell | None:
+        ''' method to perform a level-synchronous BFS using NumPy: the whole
+            frontier is kept as an array of flat cell indices and all four
+            neighbor directions are expanded for it in one vectorized step;
+            within a level the new cells are kept in the order a FIFO queue
+            would have discovered them, so the path (and the Maze's counters)
+            match those of bfs()
+        Returns:
+            a Cell object corresponding to the Maze goal, with parents set
+            along the path from the start, or None if no goal can be found
+        Raises:
+            ImportError if numpy is not installed
+        '''
+        _requireNumpy("bfsVectorized")
+        self._num_cells_pushed = self._num_cells_explored = 0
+        if not self._goalReachable():
+            return None   # start and goal are in different components
+        self._num_cells_pushed = self._num_cells_explored = 1  # the start cell
+
+        rows, cols = self._num_rows, self._num_cols
+        start = self._start._position.row * cols + self._start._position.col
+        goal  = self._goal._position.row  * cols + self._goal._position.col
+
+        directions = self._directions()
+        steps = np.array([DIRECTION_MOVEMENTS[d][0] * cols + DIRECTION_MOVEMENTS[d][1]
+                          for d in directions], dtype=np.int64)
+
+        # blocked cells are simply treated as already visited
+        visited = self._blockedMask().copy()
+        visited[start] = True
+        parent  = np.full(rows * cols, -1, dtype=np.int32)
+
+        def expand(frontier: np.ndarray) -> np.ndarray:
+            ''' discovers the unvisited neighbors of a level's cells, marking
+                them visited and setting their parents; returns them in FIFO order '''
+            col = frontier % cols
+            in_bounds = np.empty((frontier.size, len(directions)), dtype=bool)
+            for i, d in enumerate(directions):
+                if   d == "N": in_bounds[:, i] = frontier >= cols
+                elif d == "S": in_bounds[:, i] = frontier < (rows - 1) * cols
+                elif d == "W": in_bounds[:, i] = col > 0
+                else:          in_bounds[:, i] = col < cols - 1
+
+            # one row per frontier cell, one column per direction: flattening
+            # row by row gives exactly the order a FIFO queue would see them
+            candidates = frontier[:, None] + steps[None, :]
+            sources    = np.broadcast_to(frontier[:, None], candidates.shape)
+            keep = np.zeros_like(in_bounds)
+            keep[in_bounds] = ~visited[candidates[in_bounds]]
+            candidates, sources = candidates[keep], sources[keep]
+
+            # a cell reached from several frontier cells keeps its first parent
+            _, first = np.unique(candidates, return_index=True)
+            first.sort()
+            discovered = candidates[first]
+            visited[discovered] = True
+            parent[discovered]  = sources[first]
+            return discovered
+
+        frontier = np.array([start], dtype=np.int64)
+        while frontier.size > 0:
+            frontier = expand(frontier)
+            self._num_cells_pushed += int(frontier.size)
+            if parent[goal] >= 0:
+                # bfs() would pop every earlier cell before popping the goal,
+                # pushing their unvisited neighbors from the next level
+                before_goal = int(np.flatnonzero(frontier == goal)[0])
+                self._num_cells_explored += before_goal + 1
+                self._num_cells_pushed   += int(expand(frontier[:before_goal]).size)
+                break
+            self._num_cells_explored += int(frontier.size)
+        else:
+            return None
+
+        path = [goal]
+        while parent[path[-1]] >= 0:
+            path.append(int(parent[path[-1]]))
+        path.reverse()
+        return self._linkPath(path)
+
+    def _linkPath(self, path: list[int]) -> Cell:
+        ''' sets the parent of each cell along a path of flat indices to the
+            cell before it, which is all that showPath needs
+        Parameters:
+            path: flat indices of the cells from the start to the goal
+        Returns:
+            the Cell at the end of the path (i.e., the goal)
+        '''
+        cell = self._cellAt(path[0])
+        for index in path[1:]:
+            next_cell = self._cellAt(index)
+            next_cell.setParent(cell)
+            cell = next_cell
+        return cell
+
+    @staticmethod
+    def _joinPaths(meet: int, forward_parent: dict[int, int],
+                               backward_parent: dict[int, int]) -> list[int]:
+        ''' joins the two halves of a bidirectional search at the cell where
+            they met, following each side's parents back to where it started
+        Returns:
+            flat indices of the cells from the start to the goal
+        '''
+        path = [meet]
+        while forward_parent[path[-1]] >= 0:
+            path.append(forward_parent[path[-1]])
+        path.reverse()
+        while backward_parent[path[-1]] >= 0:
+            path.append(backward_parent[path[-1]])
+        return path
+
+    def bidirectionalBfs(self) -> Cell | None:
+        ''' method to perform BFS from the start and from the goal at the same
+            time, a whole level at a time (always growing the smaller frontier),
+            stopping once a level in which the two searches meet is finished;
+            the cells explored by each side are counted separately in
+            _num_cells_explored_forward and _num_cells_explored_backward
+        Returns:
+            a Cell object corresponding to the Maze goal, with parents set
+            along a shortest path from the start, or None if no goal can be
+            found
+        '''
+        self._num_cells_explored_forward = self._num_cells_explored_backward = 0
+        self._num_cells_pushed = self._num_cells_explored = 0
+        if not self._goalReachable():
+            return None   # start and goal are in different components
+        self._num_cells_pushed = 2   # the roots
+
+        start, goal = self._indexOf(self._start), self._indexOf(self._goal)
+        offsets, neighbors = self._getAdjacency()
+
+        # parent and distance from that side's root for every cell it reached
+        forward_parent,  backward_parent  = {start: -1}, {goal: -1}
+        forward_dist,    backward_dist    = {start: 0},  {goal: 0}
+        forward_frontier, backward_frontier = [start], [goal]
+
+        meet, best = None, float('inf')
+        while forward_frontier and backward_frontier and meet is None:
+            forward = len(forward_frontier) <= len(backward_frontier)
+            if forward:
+                frontier, parent, dist = forward_frontier, forward_parent, forward_dist
+                other_dist = backward_dist
+                self._num_cells_explored_forward += len(frontier)
+            else:
+                frontier, parent, dist = backward_frontier, backward_parent, backward_dist
+                other_dist = forward_dist
+                self._num_cells_explored_backward += len(frontier)
+
+            # the first level that touches the other side holds a shortest
+            # path, but not necessarily at the first touch, so finish it
+            next_frontier = []
+            for current in frontier:
+                for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+                    if neighbor in parent:
+                        continue
+                    parent[neighbor] = current
+                    dist[neighbor] = dist[current] + 1
+                    next_frontier.append(neighbor)
+                    if neighbor in other_dist and dist[neighbor] + other_dist[neighbor] < best:
+                        meet, best = neighbor, dist[neighbor] + other_dist[neighbor]
+
+            self._num_cells_pushed += len(next_frontier)
+            if forward: forward_frontier  = next_frontier
+            else:       backward_frontier = next_frontier
+
+        self._num_cells_explored = self._num_cells_explored_forward + \
+                                   self._num_cells_explored_backward
+        if meet is None:
+            return None
+        return self._linkPath(self._joinPaths(meet, forward_parent, backward_parent))
+
+    def bidirectionalAStar(self) -> Cell | None:
+        ''' method to perform A* from the start (toward the goal) and from the
+            goal (toward the start) at the same time, always expanding the side
+            with fewer queued cells; the search stops once the best path found
+            through a cell reached by both sides costs no more than the larger
+            of the two sides' smallest queued f = cost + heuristic, since no
+            unexplored path can be cheaper; cells taken off each side's queue
+            are counted in _num_cells_explored_forward and
+            _num_cells_explored_backward, and insertions and key decreases of
+            both sides in _num_cells_pushed
+        Returns:
+            a Cell object corresponding to the Maze goal, with parents set
+            along a shortest path from the start, or None if no goal can be
+            found
+        '''
+        self._num_cells_explored_forward = self._num_cells_explored_backward = 0
+        self._num_cells_pushed = self._num_cells_explored = 0
+        if not self._goalReachable():
+            return None   # start and goal are in different components
+        self._num_cells_pushed = 2   # the roots
+
+        cols = self._num_cols
+        start, goal = self._indexOf(self._start), self._indexOf(self._goal)
+        offsets, neighbors = self._getAdjacency()
+
+        def towards(target: int):
+            target_row, target_col = divmod(target, cols)
+            def heuristic(index: int) -> int:
+                row, col = divmod(index, cols)
+                return abs(row - target_row) + abs(col - target_col)
+            return heuristic
+
+        # for each side: its queue, cost from its root, parents, Entries, heuristic
+        sides = []
+        for root, target in ((start, goal), (goal, start)):
+            heuristic = towards(target)
+            queue = IndexedPriorityQueue[int, int]()
+            sides.append((queue, {root: 0}, {root: -1},
+                          {root: queue.insert(heuristic(root), root)}, heuristic))
+        forward_side, backward_side = sides
+
+        meet, best = None, float('inf')
+        while not forward_side[0].isEmpty() and not backward_side[0].isEmpty():
+            if best <= max(forward_side[0].min().key, backward_side[0].min().key):
+                break
+
+            # grow whichever side has fewer queued cells, which keeps the two
+            # searches balanced even while their smallest f values are tied
+            forward = len(forward_side[0]) <= len(backward_side[0])
+            queue, cost, parent, seen, heuristic = forward_side if forward else backward_side
+            other_cost = (backward_side if forward else forward_side)[1]
+
+            current = queue.removeMin().value
+            if forward: self._num_cells_explored_forward  += 1
+            else:       self._num_cells_explored_backward += 1
+            for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+                new_cost = cost[current] + 1
+                if neighbor in cost and new_cost >= cost[neighbor]:
+                    continue
+                self._num_cells_pushed += 1
+
+                cost[neighbor], parent[neighbor] = new_cost, current
+                handle = seen.get(neighbor)
+                if handle is not None and queue.contains(handle):
+                    queue.decreaseKey(handle, new_cost + heuristic(neighbor))
+                else:
+                    seen[neighbor] = queue.insert(new_cost + heuristic(neighbor), neighbor)
+
+                if neighbor in other_cost and new_cost + other_cost[neighbor] < best:
+                    meet, best = neighbor, new_cost + other_cost[neighbor]
+
+        self._num_cells_explored = self._num_cells_explored_forward + \
+                                   self._num_cells_explored_backward
+        if meet is None:
+            return None
+        return self._linkPath(self._joinPaths(meet, forward_side[2], backward_side[2]))
+
     def manhattan(self, cell1: Cell, cell2: Cell) -> int:
         pos1, pos2 = cell1.getPosition(), cell2.getPosition()
         return abs(pos1.row - pos2.row) + abs(pos1.col - pos2.col)
 
-    
+    def useLandmarks(self, count: int) -> None:
+        ''' method to have aStar estimate distances with the ALT heuristic (see
+            Landmarks) as well as the Manhattan distance, taking whichever is
+            larger; on maze-like layouts, where walls make the Manhattan
+            distance badly underestimate, this keeps A* from degrading toward
+            Dijkstra; the landmark tables are built here, up front, and kept
+            until the layout changes (after which the next aStar rebuilds
+            them); with a LayoutCache attached, the landmarks chosen and their
+            tables are stored there too
+        Parameters:
+            count: the number of landmarks, each costing one BFS over the
+                   grid and one distance per cell (0 to use only the
+                   Manhattan distance again)
+        '''
+        self._landmark_count = count
+        self._landmarks = None
+        if count > 0:
+            self._getLandmarks()
+
+    def _getLandmarks(self) -> Landmarks:
+        ''' returns (choosing, building, or loading first if needed) the
+            landmark tables (see chooseLandmarks)
+        '''
+        if self._landmarks is None:
+            start = self._indexOf(self._start)
+            tables: dict[int, Sequence[int]] = {}
+
+            def table(cell: int) -> Sequence[int]:
+                if cell not in tables:
+                    tables[cell] = self._cachedArray(f"landmark-{cell}", lambda:
+                                                     compactDistances(self._distancesFrom(cell)))
+                return tables[cell]
+
+            cells = self._cachedArray(f"landmarks-{self._landmark_count}-from-{start}", lambda:
+                                      chooseLandmarks(self._landmark_count, self._distancesFrom(start), table))
+            self._landmarks = Landmarks(cells, [table(cell) for cell in cells])
+        return self._landmarks
+
+    def _heuristicTo(self, goal: int) -> Callable[[int], int]:
+        ''' returns the function aStar estimates a cell's (flat index's)
+            distance to the goal with: the Manhattan distance, or, with
+            landmarks in use, the larger of it and the ALT bound
+        '''
+        cols = self._num_cols
+        goal_row, goal_col = divmod(goal, cols)
+
+        def manhattan(index: int) -> int:
+            row, col = divmod(index, cols)
+            return abs(row - goal_row) + abs(col - goal_col)
+
+        if self._landmark_count == 0:
+            return manhattan
+        bounds = self._getLandmarks().bounds(goal)
+
+        def alt(index: int) -> int:
+            return max(manhattan(index), *(abs(table[index] - at_goal) for table, at_goal in bounds))
+        return alt if bounds else manhattan
+
     def aStar(self) -> Cell | None:
-        ''' method to perform A* (using a priority queue) to implement maze searching
+        ''' method to perform A* (using a priority queue) to implement maze searching;
+            each cell has at most one Entry in the queue, whose key is lowered
+            in place when a cheaper way to reach the cell is found; a move
+            costs the terrain cost of the cell moved into (see
+            setTerrainCost), and cells are estimated by their Manhattan
+            distance to the goal, or after useLandmarks by the ALT bound where
+            that is larger (both still underestimate, since no move costs
+            less than 1); with a LayoutCache attached (see useLayoutCache) and
+            no terrain costs set, a shortest path is read from the layout's
+            cached goal distance map instead;
+            _num_cells_pushed counts insertions and key decreases, and
+            _num_cells_explored counts cells taken off the queue, as for dfs
+            and bfs
         Returns:
             a Cell object corresponding to the Maze goal, or None if no goal
             can be found
         '''
-        self._num_cells_explored = 0
+        if self._stats is not None:
+            return self._profiledSearch("aStar")
+        self._num_cells_pushed = self._num_cells_explored = 0
+        if self._layout_cache is not None and self._terrain is None:
+            return self._lookupPath()
+        if not self._goalReachable():
+            return None   # start and goal are in different components
 
         start = self.getStart()
         goal = self.getGoal()
 
-        to_explore = PriorityQueue[float, Cell]()
-        seen: dict[Position, float] = {}
+        offsets, neighbors = self._getAdjacency()
+        terrain = self._terrain
+
+        to_explore = IndexedPriorityQueue[float, Cell]()
+        seen: dict[int, HeapEntry] = {}   # flat cell index -> the cell's Entry
 
+        estimate = self._heuristicTo(self._indexOf(goal))
         start._cost = 0
-        start._heur = self.manhattan(start, goal)
-        to_explore.insert(start._cost + start._heur, start)
-        seen[start.getPosition()] = 0
-        self._num_cells_explored += 1
+        start._heur = estimate(self._indexOf(start))
+        seen[self._indexOf(start)] = to_explore.insert(start._cost + start._heur, start)
+        self._num_cells_pushed += 1
 
         while not to_explore.isEmpty():
             entry = to_explore.removeMin()
             current = entry.value
+            self._num_cells_explored += 1
 
             if current.isGoal():
                 return current
 
-            for neighbor in self.getSearchLocations(current):
-                pos = neighbor.getPosition()
-                new_cost = current._cost + 1
+            index = self._indexOf(current)
+            for neighbor_index in neighbors[offsets[index]:offsets[index + 1]]:
+                new_cost = current._cost + (1 if terrain is None else terrain[neighbor_index])
+                handle = seen.get(neighbor_index)
+
+                if handle is None or new_cost < handle.value._cost:
+                    self._num_cells_pushed += 1
+
+                    neighbor = self._cellAt(neighbor_index) if handle is None else handle.value
+                    neighbor._cost = new_cost
+                    neighbor._heur = estimate(neighbor_index)
+                    neighbor.setParent(current)
+                    if handle is not None and to_explore.contains(handle):
+                        to_explore.decreaseKey(handle, neighbor._cost + neighbor._heur)
+                    else:
+                        seen[neighbor_index] = to_explore.insert(neighbor._cost + neighbor._heur, neighbor)
+
+        return None
+
+    def dial(self, guided: bool = True) -> Cell | None:
+        ''' method to find the cheapest path by terrain cost (see
+            setTerrainCost) with Dial's algorithm: Dijkstra's search, but
+            with a BucketQueue in place of a heap, since every cost is a small
+            integer, so each push and pop is O(1) rather than O(log n); when
+            guided, the keys are A*'s cost plus Manhattan distance instead,
+            which works just as well, since along a move the key grows by the
+            move's cost plus or minus 1, never shrinking; like aStarIndexed,
+            it runs on flat indices and the shared scratch arrays, and a cell
+            whose cost drops is simply queued again, its outdated entry skipped
+            when popped; counters are kept as in aStar
+        Parameters:
+            guided: whether to order the search like A* rather than Dijkstra
+        Returns:
+            a Cell object corresponding to the Maze goal, with parents set
+            along a cheapest path from the start, or None if no goal can be
+            found
+        '''
+        self._num_cells_pushed = self._num_cells_explored = 0
+        if not self._goalReachable():
+            return None   # start and goal are in different components
+
+        scratch = self._getScratch()
+        generation = scratch.begin()
+        stamp, parent, cost = scratch.stamp, scratch.parent, scratch.cost
+        offsets, neighbors = self._getAdjacency()
+        terrain = self._terrain
+        cols = self._num_cols
+        start, goal = self._indexOf(self._start), self._indexOf(self._goal)
+        goal_row, goal_col = divmod(goal, cols)
+
+        def estimate(index: int) -> int:
+            row, col = divmod(index, cols)
+            return abs(row - goal_row) + abs(col - goal_col)
+
+        max_cost = 1 if terrain is None else max(terrain)
+        first_key = estimate(start) if guided else 0
+        queue = BucketQueue[int](max_cost + 1 if guided else max_cost, first_key)
+        stamp[start] = generation
+        parent[start] = -1
+        cost[start] = 0
+        queue.insert(first_key, start)
+        pushed, explored = 1, 0
+        while not queue.isEmpty():
+            entry = queue.removeMin()
+            current = entry.value
+            if entry.key != cost[current] + (estimate(current) if guided else 0):
+                continue   # outdated entry: the cell was queued again, cheaper
+            explored += 1
+            if current == goal:
+                self._num_cells_pushed, self._num_cells_explored = pushed, explored
+                return self._linkPath(scratch.path(goal))
+
+            for i in range(offsets[current], offsets[current + 1]):
+                neighbor = neighbors[i]
+                new_cost = cost[current] + (1 if terrain is None else terrain[neighbor])
+                if stamp[neighbor] != generation or new_cost < cost[neighbor]:
+                    stamp[neighbor] = generation
+                    parent[neighbor] = current
+                    cost[neighbor] = new_cost
+                    pushed += 1
+                    queue.insert(new_cost + (estimate(neighbor) if guided else 0), neighbor)
+
+        self._num_cells_pushed, self._num_cells_explored = pushed, explored
+        return None
+
+    def useStats(self, stats: SearchStats | None) -> None:
+        ''' method to attach a SearchStats object that every later dfs, bfs,
+            and aStar call fills in with a profile of its search, or to detach
+            it (with None), returning those methods to their plain loops
+        Parameters:
+            stats: the SearchStats to fill in, or None to stop profiling
+        '''
+        self._stats = stats
+
+    def _profiledSearch(self, algorithm: str) -> Cell | None:
+        ''' runs dfs, bfs, or aStar (by name) while filling in the attached
+            SearchStats; the instrumented loop below visits cells in exactly
+            the same order as the plain one, so the path and the Maze's own
+            counters come out the same
+        '''
+        stats = self._stats
+        stats.reset(algorithm)
+        baseline, own_tracing = 0, False
+        if stats.track_memory:
+            if tracemalloc.is_tracing():   # someone else is tracing: share it
+                baseline = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                own_tracing = True
+        started = time.perf_counter()
+        try:
+            goal = self._profiledLoop(algorithm, stats)
+        finally:
+            stats.total_seconds = time.perf_counter() - started
+            if stats.track_memory:
+                stats.peak_memory = tracemalloc.get_traced_memory()[1] - baseline
+                if own_tracing:
+                    tracemalloc.stop()
+
+        if goal is not None:
+            cell, start = goal, self._start._position
+            stats.path_length = 1
+            while cell._position != start:
+                cell = cell._parent
+                stats.path_length += 1
+        return goal
+
+    def _profiledLoop(self, algorithm: str, stats: SearchStats) -> Cell | None:
+        ''' the dfs/bfs/aStar loops, timing frontier operations separately
+            from neighbor generation and reporting each expansion to the trace
+            callback; see _profiledSearch '''
+        self._num_cells_pushed = self._num_cells_explored = 0
+        if self._layout_cache is not None and (algorithm == "bfs" or
+                                               algorithm == "aStar" and self._terrain is None):
+            return self._lookupPath()
+        if not self._goalReachable():
+            return None   # start and goal are in different components
+
+        clock, trace = time.perf_counter, stats.trace
+        start, goal = self.getStart(), self.getGoal()
+        offsets, neighbors = self._getAdjacency()
+        terrain = self._terrain
+        a_star = algorithm == "aStar"
+
+        tick = clock()
+        if a_star:
+            frontier = IndexedPriorityQueue[float, Cell]()
+            seen: dict[int, HeapEntry] = {}
+            estimate = self._heuristicTo(self._indexOf(goal))
+            start._cost = 0
+            start._heur = estimate(self._indexOf(start))
+            seen[self._indexOf(start)] = frontier.insert(start._cost + start._heur, start)
+        else:
+            frontier = Stack() if algorithm == "dfs" else Queue()
+            explored = set()
+            frontier.push(start)
+            explored.add(self._indexOf(start))
+        stats.queue_seconds += clock() - tick
+        stats.pushes = stats.peak_frontier = self._num_cells_pushed = 1
+
+        while not frontier.isEmpty():
+            tick = clock()
+            current = frontier.removeMin().value if a_star else frontier.pop()
+            stats.queue_seconds += clock() - tick
+            stats.pops += 1
+            self._num_cells_explored += 1
+            if trace is not None:
+                trace(current.getPosition(), len(frontier))
 
-                if pos not in seen or new_cost < seen[pos]:
-                    self._num_cells_explored += 1
+            if current.isGoal():
+                return current
 
+            expand_start, queue_seconds = clock(), 0.0
+            index = self._indexOf(current)
+            for neighbor_index in neighbors[offsets[index]:offsets[index + 1]]:
+                if a_star:
+                    new_cost = current._cost + (1 if terrain is None else terrain[neighbor_index])
+                    handle = seen.get(neighbor_index)
+                    if handle is not None and new_cost >= handle.value._cost:
+                        continue
+                    neighbor = self._cellAt(neighbor_index) if handle is None else handle.value
                     neighbor._cost = new_cost
-                    neighbor._heur = self.manhattan(neighbor, goal)
+                    neighbor._heur = estimate(neighbor_index)
                     neighbor.setParent(current)
-                    seen[pos] = new_cost
-                    to_explore.insert(neighbor._cost + neighbor._heur, neighbor)
+                    tick = clock()
+                    if handle is not None and frontier.contains(handle):
+                        frontier.decreaseKey(handle, neighbor._cost + neighbor._heur)
+                    else:
+                        seen[neighbor_index] = frontier.insert(neighbor._cost + neighbor._heur, neighbor)
+                    queue_seconds += clock() - tick
+                else:
+                    if neighbor_index in explored:
+                        continue
+                    neighbor = self._cellAt(neighbor_index)
+                    neighbor.setParent(current)
+                    tick = clock()
+                    frontier.push(neighbor)
+                    queue_seconds += clock() - tick
+                    explored.add(neighbor_index)
+                stats.pushes += 1
+                self._num_cells_pushed += 1
+            stats.neighbor_seconds += clock() - expand_start - queue_seconds
+            stats.queue_seconds += queue_seconds
+            stats.peak_frontier = max(stats.peak_frontier, len(frontier))
+
+        return None
+
+    def dfsIndexed(self) -> Cell | None:
+        ''' same search as dfs, but run entirely on flat cell indices: the
+            stack, visited marks, and parents live in scratch arrays reused by
+            every call (see SearchScratch), so no Cell, Position, or set is
+            created while searching, and only the cells on the path found have
+            their parents set
+        Returns:
+            a Cell object corresponding to the Maze goal, with parents set
+            along the same path dfs finds, or None if no goal can be found
+        '''
+        self._num_cells_pushed = self._num_cells_explored = 0
+        if not self._goalReachable():
+            return None   # start and goal are in different components
+
+        scratch = self._getScratch()
+        generation = scratch.begin()
+        stamp, parent, stack = scratch.stamp, scratch.parent, scratch.buffer
+        offsets, neighbors = self._getAdjacency()
+        start, goal = self._indexOf(self._start), self._indexOf(self._goal)
+
+        stamp[start] = generation
+        parent[start] = -1
+        stack[0] = start
+        top = 1   # each cell is stamped when pushed, so the stack never overflows
+        explored = 0
+        while top:
+            top -= 1
+            current = stack[top]
+            explored += 1
+            if current == goal:
+                # every cell pushed was either popped or is still stacked
+                self._num_cells_pushed, self._num_cells_explored = explored + top, explored
+                return self._linkPath(scratch.path(goal))
+            for i in range(offsets[current], offsets[current + 1]):
+                neighbor = neighbors[i]
+                if stamp[neighbor] != generation:
+                    stamp[neighbor] = generation
+                    parent[neighbor] = current
+                    stack[top] = neighbor
+                    top += 1
+
+        self._num_cells_pushed = self._num_cells_explored = explored
+        return None
+
+    def bfsIndexed(self) -> Cell | None:
+        ''' same search as bfs, but run entirely on flat cell indices (see
+            dfsIndexed); with a LayoutCache attached, a shortest path is read
+            from the layout's cached goal distance map instead
+        Returns:
+            a Cell object corresponding to the Maze goal, with parents set
+            along the same path bfs finds, or None if no goal can be found
+        '''
+        self._num_cells_pushed = self._num_cells_explored = 0
+        if self._layout_cache is not None:
+            return self._lookupPath()
+        if not self._goalReachable():
+            return None   # start and goal are in different components
+
+        scratch = self._getScratch()
+        generation = scratch.begin()
+        stamp, parent, queue = scratch.stamp, scratch.parent, scratch.buffer
+        offsets, neighbors = self._getAdjacency()
+        start, goal = self._indexOf(self._start), self._indexOf(self._goal)
+
+        stamp[start] = generation
+        parent[start] = -1
+        queue[0] = start
+        head, tail = 0, 1
+        while head < tail:
+            current = queue[head]
+            head += 1
+            if current == goal:
+                self._num_cells_pushed, self._num_cells_explored = tail, head
+                return self._linkPath(scratch.path(goal))
+            for i in range(offsets[current], offsets[current + 1]):
+                neighbor = neighbors[i]
+                if stamp[neighbor] != generation:
+                    stamp[neighbor] = generation
+                    parent[neighbor] = current
+                    queue[tail] = neighbor
+                    tail += 1
+
+        self._num_cells_pushed, self._num_cells_explored = tail, head
+        return None
+
+    def aStarIndexed(self) -> Cell | None:
+        ''' A* run entirely on flat cell indices (see dfsIndexed): costs live
+            in a scratch array, and each frontier entry is a single int packing
+            the cell's key, then its heuristic (so ties favor cells nearer the
+            goal), then its index, so the reused heap holds no tuples or Entry
+            objects; a cell whose cost drops is simply pushed again, and the
+            outdated entry is skipped when popped, since its key no longer
+            matches the cell's cost; the Maze's counters mean what they do for
+            aStar (every push counts as pushed, and only pops of current
+            entries as explored), but their values differ from aStar's on the
+            same maze: breaking ties toward cells nearer the goal usually
+            reaches it after far fewer expansions, and a cheaper route pushes
+            a cell again where aStar lowers its key in place
+        Returns:
+            a Cell object corresponding to the Maze goal, with parents set
+            along a shortest path from the start, or None if no goal can be
+            found
+        '''
+        self._num_cells_pushed = self._num_cells_explored = 0
+        if self._layout_cache is not None:
+            return self._lookupPath()
+        if not self._goalReachable():
+            return None   # start and goal are in different components
+
+        scratch = self._getScratch()
+        generation = scratch.begin()
+        stamp, parent, cost, heap = scratch.stamp, scratch.parent, scratch.cost, scratch.heap
+        heap.clear()
+        offsets, neighbors = self._getAdjacency()
+        rows, cols = self._num_rows, self._num_cols
+        start, goal = self._indexOf(self._start), self._indexOf(self._goal)
+        goal_row, goal_col = divmod(goal, cols)
+        index_bits = (rows * cols).bit_length()
+        heur_bits  = (rows + cols).bit_length()
+        key_shift  = index_bits + heur_bits
+        index_mask = (1 << index_bits) - 1
+
+        row, col = divmod(start, cols)
+        heur = abs(row - goal_row) + abs(col - goal_col)
+        stamp[start] = generation
+        parent[start] = -1
+        cost[start] = 0
+        heappush(heap, heur << key_shift | heur << index_bits | start)
+        pushed, explored = 1, 0
+        while heap:
+            packed = heappop(heap)
+            current = packed & index_mask
+            row, col = divmod(current, cols)
+            if packed >> key_shift != cost[current] + abs(row - goal_row) + abs(col - goal_col):
+                continue   # outdated entry: the cell was pushed again, cheaper
+            explored += 1
+            if current == goal:
+                self._num_cells_pushed, self._num_cells_explored = pushed, explored
+                return self._linkPath(scratch.path(goal))
+
+            new_cost = cost[current] + 1
+            for i in range(offsets[current], offsets[current + 1]):
+                neighbor = neighbors[i]
+                if stamp[neighbor] != generation or new_cost < cost[neighbor]:
+                    stamp[neighbor] = generation
+                    parent[neighbor] = current
+                    cost[neighbor] = new_cost
+                    pushed += 1
+                    row, col = divmod(neighbor, cols)
+                    heur = abs(row - goal_row) + abs(col - goal_col)
+                    heappush(heap, (new_cost + heur) << key_shift | heur << index_bits | neighbor)
+
+        self._num_cells_pushed, self._num_cells_explored = pushed, explored
+        return None
+
+    def _getBits(self) -> BitGrid:
+        ''' returns the bit-packed open-cell mask (see BitGrid), building
+            and caching it first if the layout has changed '''
+        if self._bits is None:
+            self._bits = BitGrid.fromFlags(self._num_rows, self._num_cols, self._blockedFlags())
+        return self._bits
+
+    def _flatIndex(self, position: Position | None, default: Cell) -> int:
+        ''' returns the flat index of a Position, or of a default Cell if None
+        Raises:
+            ValueError if the row/col of the position is out of range
+        '''
+        if position is None:
+            return self._indexOf(default)
+        return self._indexOf(self.getCell(position))
+
+    def reachableCount(self, start: Position = None) -> int:
+        ''' method to count the open cells reachable from a cell, by a
+            bit-parallel flood fill over the bit-packed mask (see BitGrid):
+            each step grows the reached region by one move in every direction
+            using a few whole-grid shifts and ANDs
+        Parameters:
+            start: the Position to count from (the Maze's start if None)
+        Returns:
+            the number of cells reachable, including start itself (0 if it
+            is blocked)
+        Raises:
+            ValueError if the row/col of start is out of range
+        '''
+        return self._getBits().reachable(self._flatIndex(start, self._start)).bit_count()
+
+    def shortestDistance(self, start: Position = None, goal: Position = None) -> int | None:
+        ''' method to find the length of a shortest path by a bit-parallel BFS
+            over the bit-packed mask (see BitGrid), one whole level per step;
+            no cells or parents are touched, so only the distance is found
+        Parameters:
+            start: the Position to measure from (the Maze's start if None)
+            goal:  the Position to measure to (the Maze's goal if None)
+        Returns:
+            the number of moves on a shortest path from start to goal, or None
+            if there is none
+        Raises:
+            ValueError if the row/col of start or goal is out of range
+        '''
+        return self._getBits().distance(self._flatIndex(start, self._start),
+                                        self._flatIndex(goal, self._goal))
+
+    def distanceField(self, goal: Position = None) -> DistanceField:
+        ''' method to find every cell's distance to one goal, and the first
+            step of a cheapest path from it (see DistanceField), in a single
+            search outward from the goal -- a BFS, or with terrain costs set
+            (see setTerrainCost) a Dial search over a BucketQueue; the fields
+            of the most recently used goals (up to DISTANCE_FIELDS_CACHED) are
+            kept, so asking again for one is a dict lookup, until the layout
+            or a terrain cost changes
+        Parameters:
+            goal: the Position to route to (the Maze's goal if None)
+        Returns:
+            the DistanceField for that goal
+        Raises:
+            ValueError if the row/col of goal is out of range
+        '''
+        root = self._flatIndex(goal, self._goal)
+        fields = self._distance_fields
+        if root in fields:
+            fields.move_to_end(root)
+            return fields[root]
+
+        field = DistanceField.build(self._num_rows, self._num_cols, *self._getAdjacency(),
+                                    self._terrain, root, not self._isBlockedAt(root))
+        fields[root] = field
+        if len(fields) > DISTANCE_FIELDS_CACHED:
+            fields.popitem(last = False)
+        return field
+
+    def fingerprint(self) -> str:
+        ''' method to return a stable fingerprint of this Maze's layout: a hash
+            of its dimensions and of which cells are blocked (so mazes with the
+            same layout share it, whatever their start, goal, or search order)
+        Returns:
+            a hex string identifying the layout
+        '''
+        if self._fingerprint is None:
+            digest = hashlib.sha256(f"{self._num_rows}x{self._num_cols}:".encode())
+            digest.update(self._blockedFlags())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def useLayoutCache(self, cache: LayoutCache | None) -> None:
+        ''' method to attach (or, given None, detach) an on-disk LayoutCache;
+            while one is attached, the jump tables, connected-component labels,
+            and goal-rooted BFS distance map for this layout are memory-mapped
+            from the cache (computed and stored there the first time), and
+            bfs() and aStar() answer by walking down the distance map
+        Parameters:
+            cache: a LayoutCache object, or None
+        '''
+        self._layout_cache   = cache
+        self._jump_tables    = None
+        self._components     = None
+        self._goal_distances = None
+        self._landmarks      = None
+
+    def _cachedArray(self, name: str, build: Callable[[], array]) -> Sequence[int]:
+        ''' returns an integer array derived from this layout, from the attached
+            LayoutCache if there is one (building and storing it on a miss)
+        Parameters:
+            name:  the name of the array within this layout's cache entry
+            build: function computing the array (as an array of any integer type)
+        Returns:
+            the array itself, or a memoryview of the memory-mapped copy
+        '''
+        if self._layout_cache is None:
+            return build()
+        data = self._layout_cache.load(self.fingerprint(), name)
+        if data is None:
+            built = build()
+            data = self._layout_cache.store(self.fingerprint(), name,
+                                            np.frombuffer(built, dtype = built.typecode))
+        return memoryview(data)
+
+    def _distancesFrom(self, root: int) -> array:
+        ''' runs a BFS over the whole component containing a cell
+        Parameters:
+            root: flat index of the cell to measure from
+        Returns:
+            an array('i') holding every cell's number of moves from root, or
+            -1 for cells that cannot be reached (including blocked cells)
+        '''
+        offsets, neighbors = self._getAdjacency()
+        distance = array('i', [-1]) * (self._num_rows * self._num_cols)
+        distance[root] = 0
+        queue = Queue[int]()
+        queue.push(root)
+        while not queue.isEmpty():
+            current = queue.pop()
+            for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+                if distance[neighbor] < 0:
+                    distance[neighbor] = distance[current] + 1
+                    queue.push(neighbor)
+        return distance
+
+    def _getComponents(self) -> Components:
+        ''' returns (building or loading first if needed) the connected-component
+            labels of the cells; see labelComponents
+        '''
+        if self._components is None:
+            self._components = Components(self._cachedArray("components", lambda:
+                labelComponents(*self._getAdjacency(), self._blockedFlags())))
+        return self._components
+
+    def _goalReachable(self) -> bool:
+        ''' indicates whether the start and goal are in the same connected
+            component, which costs O(1) once the labels exist
+        '''
+        return self._getComponents().connected(self._indexOf(self._start),
+                                               self._indexOf(self._goal))
+
+    def unreachable(self, start: Position, goal: Position) -> bool:
+        ''' method to tell whether a shortest-path query can be answered None
+            without searching, in O(1) once the component labels exist
+        Parameters:
+            start: Position object indicating the (row,col) of the start cell
+            goal:  Position object indicating the (row,col) of the goal cell
+        Returns:
+            True if either end is blocked, or they are in different
+            components, False o/w
+        Raises:
+            ValueError if the row/col of start or goal is out of range
+        '''
+        cols = self._num_cols
+        return (self.getCell(start).isBlocked() or self.getCell(goal).isBlocked() or
+                not self._getComponents().connected(start.row * cols + start.col,
+                                                    goal.row  * cols + goal.col))
+
+    def _goalDistances(self) -> Sequence[int]:
+        ''' returns (building or loading first if needed) every cell's BFS
+            distance to the goal; see _distancesFrom
+        '''
+        if self._goal_distances is None:
+            goal = self._indexOf(self._goal)
+            self._goal_distances = self._cachedArray(f"distance-{goal}",
+                                                     lambda: self._distancesFrom(goal))
+        return self._goal_distances
+
+    def _lookupPath(self) -> Cell | None:
+        ''' answers a search from the layout's cached data: the component labels
+            rule out an unreachable goal at once, and otherwise a shortest path
+            is read off the goal distance map by stepping from the start to any
+            neighbor one move closer to the goal, until the goal is reached
+        Returns:
+            a Cell object corresponding to the Maze goal, with parents set
+            along the path, or None if the goal cannot be reached
+        '''
+        rows, cols = self._num_rows, self._num_cols
+        start, goal = self._indexOf(self._start), self._indexOf(self._goal)
+        if not self._goalReachable():
+            return None
+
+        distance = self._goalDistances()
+        path = [start]
+        while path[-1] != goal:
+            current = path[-1]
+            row, col = divmod(current, cols)
+            for neighbor, in_bounds in ((current - cols, row > 0), (current + cols, row < rows - 1),
+                                        (current - 1, col > 0),    (current + 1, col < cols - 1)):
+                if in_bounds and distance[neighbor] == distance[current] - 1:
+                    path.append(neighbor)
+                    break
+        self._num_cells_explored = len(path)
+        return self._linkPath(path)
+
+    def _getJumpTables(self) -> dict[str, Sequence[int]]:
+        ''' returns the Maze's JPS+ jump tables, building (or loading from the
+            attached LayoutCache) and keeping them first if needed; see
+            _buildJumpTables for what they hold
+        Returns:
+            a dict mapping each of "N", "S", "W", "E" to an integer array
+        '''
+        if self._jump_tables is None:
+            built: dict[str, array] = {}
+            def build(direction: str) -> array:
+                if not built:  # all four come out of one build
+                    built.update(self._buildJumpTables())
+                return built[direction]
+            self._jump_tables = {d: self._cachedArray(f"jump-{d}", lambda d = d: build(d))
+                                 for d in "NSWE"}
+        return self._jump_tables
+
+    def _buildJumpTables(self) -> dict[str, array]:
+        ''' builds the Maze's JPS+ jump tables: for each direction d, table[d][i]
+            is the number of steps from the cell with flat index i, moving in
+            direction d, to the first jump point (when positive), or else
+            minus the number of open cells before a wall or the grid edge
+
+            a cell is a jump point when moving north or south if a west or east
+            neighbor is open there but was blocked beside the previous cell (a
+            forced turn), and when moving west or east if a north or south jump
+            from it would find a jump point
+        Returns:
+            a dict mapping each of "N", "S", "W", "E" to an array('i')
+        '''
+        rows, cols = self._num_rows, self._num_cols
+        blocked = self._blockedFlags()
+        tables  = {d: array('i', [0]) * (rows * cols) for d in "NSWE"}
+
+        def vertical(table: array, row_order: range, step: int) -> None:
+            for row in row_order:
+                for col in range(cols):
+                    index, ahead = row * cols + col, row * cols + col + step
+                    if not 0 <= row + step // cols < rows or blocked[ahead]:
+                        continue   # wall right ahead: stays 0
+                    forced = (col + 1 < cols and not blocked[ahead + 1] and blocked[index + 1]) or \
+                             (col > 0 and not blocked[ahead - 1] and blocked[index - 1])
+                    steps = table[ahead]
+                    table[index] = 1 if forced else steps + 1 if steps > 0 else steps - 1
+
+        def horizontal(table: array, col_order: range, step: int) -> None:
+            north, south = tables["N"], tables["S"]
+            for row in range(rows):
+                for col in col_order:
+                    index, ahead = row * cols + col, row * cols + col + step
+                    if not 0 <= col + step < cols or blocked[ahead]:
+                        continue
+                    steps = table[ahead]
+                    table[index] = 1 if north[ahead] > 0 or south[ahead] > 0 else \
+                                   steps + 1 if steps > 0 else steps - 1
+
+        # each sweep runs against its direction so the cell ahead is done first
+        vertical(tables["N"], range(rows), -cols)
+        vertical(tables["S"], range(rows - 1, -1, -1), cols)
+        horizontal(tables["W"], range(cols), -1)
+        horizontal(tables["E"], range(cols - 1, -1, -1), 1)
+        return tables
+
+    def jps(self) -> Cell | None:
+        ''' method to perform Jump Point Search (A* over jump points only) for
+            this 4-connected, unit-cost grid, using the precomputed JPS+ jump
+            tables; among equally short paths, moves west/east are taken as
+            early as possible, so a path only turns from north/south to
+            west/east where a wall forces it and runs in between are jumped
+            over without queueing their cells; since the allowed turns depend
+            on the direction a cell was reached from, the queue holds (cell,
+            direction) pairs, and the Maze's counters count those pairs the
+            way aStar counts cells
+        Returns:
+            a Cell object corresponding to the Maze goal, with parents set
+            along a shortest path from the start, or None if no goal can be
+            found
+        '''
+        self._num_cells_pushed = self._num_cells_explored = 0
+        if not self._goalReachable():
+            return None   # start and goal are in different components
+
+        cols    = self._num_cols
+        tables  = self._getJumpTables()
+        blocked = self._blockedFlags()
+        start, goal = self._indexOf(self._start), self._indexOf(self._goal)
+        goal_row, goal_col = divmod(goal, cols)
+        steps = {d: DIRECTION_MOVEMENTS[d][0] * cols + DIRECTION_MOVEMENTS[d][1] for d in "NSWE"}
+        names = "NSWE"   # a queued key is cell * 5 + (index of arrival direction, or 4 at the start)
+
+        def jump(index: int, direction: str) -> tuple[int, int] | None:
+            ''' returns (cell, distance) for the next jump point (or the goal)
+                moving from index in direction, or None if there is none '''
+            steps_ahead = tables[direction][index]
+            reach = steps_ahead if steps_ahead > 0 else -steps_ahead
+            row, col = divmod(index, cols)
+            sign = 1 if direction in "SE" else -1
+            if direction in "NS":
+                if col == goal_col and 0 < (goal_row - row) * sign <= reach:
+                    return goal, abs(goal_row - row)
+            else:
+                if row == goal_row and 0 < (goal_col - col) * sign <= reach:
+                    return goal, abs(goal_col - col)
+                # the cell in the goal's column is a jump point if the goal is
+                # in plain sight straight north or south of it
+                distance = (goal_col - col) * sign
+                if 0 < distance < reach or (0 < distance == reach and steps_ahead <= 0):
+                    turn = index + distance * steps[direction]
+                    table = tables["N" if goal_row < row else "S"]
+                    if table[turn] <= 0 and abs(goal_row - row) <= -table[turn]:
+                        return turn, distance
+            if steps_ahead > 0:
+                return index + steps_ahead * steps[direction], steps_ahead
+            return None
+
+        queue = IndexedPriorityQueue[int, int]()
+        start_key = start * 5 + 4
+        cost:   dict[int, int] = {start_key: 0}
+        parent: dict[int, int] = {start_key: -1}
+        seen:   dict[int, HeapEntry] = {start_key: queue.insert(self.manhattan(self._start, self._goal), start_key)}
+        self._num_cells_pushed += 1
+
+        while not queue.isEmpty():
+            key = queue.removeMin().value
+            self._num_cells_explored += 1
+            index, arrived = divmod(key, 5)
+            if index == goal:
+                # unroll the straight runs between jump points into cells
+                path = [index]
+                while parent[key] >= 0:
+                    key = parent[key]
+                    previous = key // 5
+                    step = 1 if previous > path[-1] else -1
+                    stride = cols if abs(previous - path[-1]) >= cols else 1
+                    path.extend(range(path[-1] + step * stride, previous + step * stride, step * stride))
+                path.reverse()
+                return self._linkPath(path)
+
+            if arrived == 4:
+                directions = self._directions()
+            elif names[arrived] in "WE":
+                directions = [names[arrived], "N", "S"]
+            else:
+                # keep going, or turn where the cell beside the previous one is blocked
+                directions = [names[arrived]]
+                previous = index - steps[names[arrived]]
+                col = index % cols
+                if col > 0 and blocked[previous - 1]:        directions.append("W")
+                if col < cols - 1 and blocked[previous + 1]: directions.append("E")
+
+            for direction in directions:
+                found = jump(index, direction)
+                if found is None:
+                    continue
+                neighbor, distance = found
+                neighbor_key = neighbor * 5 + names.index(direction)
+                new_cost = cost[key] + distance
+                if neighbor_key in cost and new_cost >= cost[neighbor_key]:
+                    continue
+                self._num_cells_pushed += 1
+
+                cost[neighbor_key], parent[neighbor_key] = new_cost, key
+                row, col = divmod(neighbor, cols)
+                priority = new_cost + abs(row - goal_row) + abs(col - goal_col)
+                handle = seen.get(neighbor_key)
+                if handle is not None and queue.contains(handle):
+                    queue.decreaseKey(handle, priority)
+                else:
+                    seen[neighbor_key] = queue.insert(priority, neighbor_key)
 
         return None
 
+    def hpaStar(self, cluster_size: int = 16) -> Cell | None:
+        ''' method to find a path by hierarchical A* (HPA*, see Hierarchy):
+            an A* over an abstract graph of the cluster edges' transition
+            cells, refined back into cells one cluster at a time; the graph is
+            built on the first call and kept, and setBlocked only marks the
+            clusters it touches for rebuilding, so long queries on a big grid
+            expand far fewer cells than aStar; the path may be a little longer
+            than a shortest one (see hpaGap); _num_cells_explored counts the
+            abstract nodes and cells expanded by the query
+        Parameters:
+            cluster_size: cells along each side of a cluster (changing it
+                          rebuilds the graph)
+        Returns:
+            a Cell object corresponding to the Maze goal, with parents set
+            along the path found, or None if no goal can be found
+        '''
+        self._num_cells_pushed = self._num_cells_explored = 0
+        if not self._goalReachable():
+            return None   # start and goal are in different components
+        if self._hierarchy is None or self._hierarchy.cluster_size != cluster_size:
+            self._hierarchy = Hierarchy(self._num_rows, self._num_cols, self._isBlockedAt, cluster_size)
+
+        path = self._hierarchy.findPath(self._indexOf(self._start), self._indexOf(self._goal))
+        self._num_cells_pushed = self._num_cells_explored = self._hierarchy.expanded
+        return None if path is None else self._linkPath(path)
+
+    def hpaGap(self, cluster_size: int = 16) -> float | None:
+        ''' method to measure how much longer the path hpaStar finds is than
+            the one aStar finds (a shortest path, whose length is found here
+            by the bit-parallel shortestDistance rather than by running aStar)
+        Parameters:
+            cluster_size: cells along each side of a cluster
+        Returns:
+            the relative excess of hpaStar's path, in moves (0.0 when it is a
+            shortest path, 0.05 when it is 5% longer), or None if no goal can
+            be found
+        '''
+        goal = self.hpaStar(cluster_size)
+        if goal is None:
+            return None
+        moves = 0
+        while goal != self._start:
+            goal, moves = goal.getParent(), moves + 1
+        shortest = self.shortestDistance()
+        return moves / shortest - 1 if shortest else 0.0
+
+    def _pathIndices(self, goal: Cell) -> array:
+        ''' returns the flat indices of the cells on the path from a goal back
+            to the start, following parent links (so the goal comes first), as
+            an array of 4 bytes per cell rather than a list of Cells
+        Raises:
+            ValueError if the goal's parents do not lead back to the start
+        '''
+        path = array('i')
+        if self._grid is None:
+            parent = self._flat_parent
+            index = self._indexOf(goal)
+            while index >= 0:
+                path.append(index)
+                index = parent[index]
+        else:
+            cell = goal
+            while cell is not None:
+                path.append(self._indexOf(cell))
+                cell = cell._parent
+        if path[-1] != self._indexOf(self._start):
+            raise ValueError("the goal's parents do not lead back to the start")
+        return path
+
+    def iterPath(self, goal: Cell) -> Iterator[Position]:
+        ''' generator method yielding the Positions along the path from the
+            start to a goal found by a search, in order, without marking any
+            cells (unlike showPath); since parent links run from the goal back,
+            the path's flat indices are gathered first and then yielded in
+            reverse, each as a Position only when it is reached
+        Parameters:
+            goal: a Cell object corresponding to the goal location
+        Raises:
+            ValueError (when iteration starts) if the goal's parents do not
+                lead back to the start
+        '''
+        cols = self._num_cols
+        for index in reversed(self._pathIndices(goal)):
+            yield Position(*divmod(index, cols))
+
+    def writeTo(self, file: TextIO, goal: Cell | None = None, chunk_rows: int = 256) -> None:
+        ''' method to stream the Maze's rendering (as __str__ gives it, plus a
+            final newline) to a text file object, chunk_rows rows per write,
+            so memory holds one chunk of text rather than the whole rendering
+        Parameters:
+            file:       the text file object to write to, e.g. sys.stdout
+            goal:       if given, a Cell object returned by a search, whose
+                        path is shown without marking any cells (which takes
+                        one byte per cell of the grid while writing)
+            chunk_rows: number of rows joined into each write
+        Raises:
+            ValueError if the goal's parents do not lead back to the start
+        '''
+        on_path = None
+        if goal is not None:
+            on_path = bytearray(self._num_rows * self._num_cols)
+            for index in self._pathIndices(goal):
+                on_path[index] = 1
+            on_path[self._indexOf(self._start)] = on_path[self._indexOf(self._goal)] = 0
+
+        rows = self._rowStrings(on_path)
+        while chunk := list(islice(rows, chunk_rows)):
+            file.write("\n".join(chunk) + "\n")
+
     def showPath(self, goal: Cell) -> None:
         ''' method to update the path from start to goal, identifying the steps
             along the way as belonging to the path (updating the cell via
             .markOnPath, which will change that cell's ._contents to
-            Contents.PATH), printing the final resulting solutions
+            Contents.PATH), printing the final resulting solutions (streamed
+            to stdout by writeTo; see iterPath to follow a path without
+            marking it)
         Parameters:
             goal: a Cell object corresponding to the goal location
         Returns:
             nothing -- just updates the cells in the grid to identify those on the path
+        Raises:
+            ValueError if the goal's parents do not lead back to the start
         '''
+        path = self._pathIndices(goal)
+        ends = (self._indexOf(self._start), self._indexOf(self._goal))
+        for index in path:
+            if index not in ends:
+                self._cellAt(index).markOnPath()
 
-        path = []
-        cell = goal
-        while cell._parent is not None:
-            path.append(cell)
-            cell = cell._parent
-        path.append(cell)  # should be the start
-        assert(cell == self._start)
-
-        path.reverse()  # reverse the list
-
-        for cell in path:
-            if cell != self._start and cell != self._goal:
-                cell.markOnPath()
-        
         self._path_length = len(path)
 
-        # print the maze, i.e., using __str__ which will show the solved maze
-        print(self)
+        # print the maze, which will show the solved maze
+        self.writeTo(sys.stdout)
 
 ###################
 def main() -> None:
@@ -434,13 +2232,13 @@ def main() -> None:
     print(maze)
 
     print("\nChecking neighbors of middle cell (1,1):")
-    cell = maze._grid[1][1]
+    cell = maze.getCell(Position(1, 1))
     neighbors = maze.getSearchLocations(cell)
     print("Found:", [str(n.getPosition()) for n in neighbors])
     print("Should be 4 directions\n")
 
     print("Checking neighbors of corner cell (0,0):")
-    corner = maze._grid[0][0]
+    corner = maze.getCell(Position(0, 0))
     neighbors_corner = maze.getSearchLocations(corner)
     print("Found:", [str(n.getPosition()) for n in neighbors_corner])
     print("Should be 2 directions (down, right) in a 3x3 open maze\n")
@@ -491,7 +2289,6 @@ def main() -> None:
         print("Testing DFS")
         random.seed(seed)
         maze_dfs = Maze(30, 30, prop_blocked=0.20, search_order=SearchOrder.NSWE)
-        maze_dfs._num_cells_pushed = 0  # you'll need to increment this inside dfs
         goal_dfs = maze_dfs.dfs()
         if goal_dfs:
             print("\nDFS Solved Maze:")
@@ -504,7 +2301,6 @@ def main() -> None:
         print("Testing BFS")
         random.seed(seed)
         maze_bfs = Maze(30, 30, prop_blocked=0.20, search_order=SearchOrder.NSWE)
-        maze_bfs._num_cells_pushed = 0
         goal_bfs = maze_bfs.bfs()
         if goal_bfs:
             print("\nBFS Solved Maze:")
@@ -522,9 +2318,249 @@ def main() -> None:
             print("\nA* Solved Maze:")
             maze_astar.showPath(goal_astar)
             print(f"A* Path Length: {maze_astar._path_length}")
-            print(f"A* Cells Inserted: {maze_astar._num_cells_explored}")
+            print(f"A* Cells Pushed: {maze_astar._num_cells_pushed}")
+            print(f"A* Cells Explored: {maze_astar._num_cells_explored}")
         else:
             print("\nA* could not find a path")
 
+    print("\nTesting compact grid mode (should match the Cell-object mazes above)")
+    for seed in seeds:
+        random.seed(seed)
+        maze_compact = Maze(30, 30, prop_blocked=0.20, search_order=SearchOrder.NSWE, compact=True)
+        goal_compact = maze_compact.aStar()
+        if goal_compact:
+            maze_compact.showPath(goal_compact)
+            print(f"Seed {seed}: compact A* Path Length: {maze_compact._path_length}")
+        else:
+            print(f"Seed {seed}: compact A* could not find a path")
+
+    print("\nTesting search profiling (counters should match the plain searches above)")
+    random.seed(seeds[0])
+    maze_profiled = Maze(30, 30, prop_blocked=0.20, search_order=SearchOrder.NSWE)
+    expansions = []
+    stats = SearchStats(track_memory=True, trace=lambda position, frontier: expansions.append(position))
+    maze_profiled.useStats(stats)
+    for name in ["dfs", "bfs", "aStar"]:
+        getattr(maze_profiled, name)()
+        print(stats)
+    print(f"Traced expansions in the last search: {len(expansions[-stats.pops:])} (Expected: {stats.pops})")
+    maze_profiled.useStats(None)
+
+    print("\nTesting the index-based search kernels (should match DFS/BFS/A* above)")
+    for seed in seeds:
+        for name in ["dfsIndexed", "bfsIndexed", "aStarIndexed"]:
+            random.seed(seed)
+            maze_indexed = Maze(30, 30, prop_blocked=0.20, search_order=SearchOrder.NSWE, compact=True)
+            goal_indexed = getattr(maze_indexed, name)()
+            if goal_indexed:
+                maze_indexed.showPath(goal_indexed)
+                print(f"Seed {seed}: {name} Path Length: {maze_indexed._path_length}, " +
+                      f"Cells Explored: {maze_indexed._num_cells_explored}")
+            else:
+                print(f"Seed {seed}: {name} could not find a path")
+
+    print("\nTesting bidirectional searches (path lengths should match BFS/A* above)")
+    for seed in seeds:
+        for name in ["bidirectionalBfs", "bidirectionalAStar"]:
+            random.seed(seed)
+            maze_bi = Maze(30, 30, prop_blocked=0.20, search_order=SearchOrder.NSWE, compact=True)
+            goal_bi = getattr(maze_bi, name)()
+            if goal_bi:
+                maze_bi.showPath(goal_bi)
+                print(f"Seed {seed}: {name} Path Length: {maze_bi._path_length}, " +
+                      f"Cells Explored: {maze_bi._num_cells_explored_forward} forward + " +
+                      f"{maze_bi._num_cells_explored_backward} backward")
+            else:
+                print(f"Seed {seed}: {name} could not find a path")
+
+    print("\nTesting Jump Point Search (path lengths should match A* above)")
+    for seed in seeds:
+        random.seed(seed)
+        maze_jps = Maze(30, 30, prop_blocked=0.20, search_order=SearchOrder.NSWE, compact=True)
+        goal_jps = maze_jps.jps()
+        if goal_jps:
+            maze_jps.showPath(goal_jps)
+            print(f"Seed {seed}: JPS Path Length: {maze_jps._path_length}, " +
+                  f"Cells Explored: {maze_jps._num_cells_explored}")
+        else:
+            print(f"Seed {seed}: JPS could not find a path")
+
+    # on the random mazes above the Manhattan distance is already close to
+    # exact, leaving ALT little to prune; a perfect maze's winding corridors
+    # are where it pays off
+    print("\nTesting A* with ALT landmarks on generated 31x31 mazes (same moves, fewer cells explored)")
+    for seed in seeds:
+        maze_alt = Maze.generate(31, 31, method="wilson", seed=seed)
+        goal_alt = maze_alt.aStar()
+        plain_moves, plain_explored = maze_alt.pathCost(goal_alt), maze_alt._num_cells_explored
+        maze_alt.useLandmarks(8)
+        goal_alt = maze_alt.aStar()
+        if goal_alt:
+            print(f"Seed {seed}: Moves: A* {plain_moves}, ALT A* {maze_alt.pathCost(goal_alt)}; " +
+                  f"Cells Explored: A* {plain_explored}, ALT A* {maze_alt._num_cells_explored}")
+        else:
+            print(f"Seed {seed}: ALT A* could not find a path")
+
+    print("\nTesting terrain costs (A* with a heap and Dial's bucket queue should agree)")
+    random.seed(seeds[0])
+    maze_terrain = Maze(30, 30, prop_blocked=0.20, search_order=SearchOrder.NSWE, compact=True)
+    for row in range(5, 25):
+        for col in range(5, 25):
+            maze_terrain.setTerrainCost(Position(row, col), 5)   # a swamp in the middle
+    for name, search in [("A*", maze_terrain.aStar), ("Dial", maze_terrain.dial),
+                         ("unguided Dial", lambda: maze_terrain.dial(guided=False))]:
+        goal_terrain = search()
+        if goal_terrain:
+            print(f"{name}: path cost {maze_terrain.pathCost(goal_terrain)}, " +
+                  f"Cells Explored: {maze_terrain._num_cells_explored}")
+            if name == "unguided Dial":   # show one of the three paths, after the last search
+                maze_terrain.showPath(goal_terrain)
+        else:
+            print(f"{name} could not find a path")
+    print("(the path should skirt the swamp; all three costs should be equal)")
+
+    print("\nTesting hierarchical A* (path lengths should be close to A* above)")
+    for seed in seeds:
+        random.seed(seed)
+        maze_hpa = Maze(30, 30, prop_blocked=0.20, search_order=SearchOrder.NSWE, compact=True)
+        goal_hpa = maze_hpa.hpaStar(cluster_size=10)
+        if goal_hpa:
+            maze_hpa.showPath(goal_hpa)
+            print(f"Seed {seed}: HPA* Path Length: {maze_hpa._path_length}, " +
+                  f"Cells Explored: {maze_hpa._num_cells_explored}, " +
+                  f"gap against A*: {maze_hpa.hpaGap(cluster_size=10):.1%}")
+        else:
+            print(f"Seed {seed}: HPA* could not find a path")
+    maze_hpa.setBlocked(Position(15, 15))
+    print(f"After blocking one cell: HPA* finds goal? {maze_hpa.hpaStar(cluster_size=10) is not None} " +
+          f"(Expected: {maze_hpa.shortestDistance() is not None})")
+
+    if np is not None:
+        from LayoutCache import LayoutCache
+        print("\nTesting the layout cache (a second maze with the same layout reuses it)")
+        with tempfile.TemporaryDirectory() as directory:
+            for attempt in ["first (builds the cache)", "second (looks the path up)"]:
+                random.seed(seeds[0])
+                maze_cached = Maze(30, 30, prop_blocked=0.20, search_order=SearchOrder.NSWE, compact=True)
+                maze_cached.useLayoutCache(LayoutCache(directory))
+                goal_cached = maze_cached.aStar()
+                print(f"{attempt}: fingerprint {maze_cached.fingerprint()[:12]}..., " +
+                      f"goal found: {goal_cached is not None}, " +
+                      f"Cells Explored: {maze_cached._num_cells_explored}")
+
+    print("\nTesting unreachable goal detection (goal walled off after construction)")
+    maze_walled = Maze(5, 5, prop_blocked=0.0, compact=True)
+    print(f"Before walling: BFS finds goal? {maze_walled.bfs() is not None} (Expected: True)")
+    maze_walled.setBlocked(Position(3, 4))
+    maze_walled.setBlocked(Position(4, 3))
+    print(f"After walling:  BFS finds goal? {maze_walled.bfs() is not None} (Expected: False), " +
+          f"Cells Explored: {maze_walled._num_cells_explored} (Expected: 0)")
+    maze_walled.setBlocked(Position(3, 4), False)
+    print(f"After reopening: BFS finds goal? {maze_walled.bfs() is not None} (Expected: True)")
+
+    print("\nTesting incremental replanning (D* Lite)")
+    random.seed(seeds[0])
+    maze_replan = Maze(30, 30, prop_blocked=0.20, search_order=SearchOrder.NSWE, compact=True)
+    goal_replan = maze_replan.replan()
+    print(f"Initial plan found goal? {goal_replan is not None}, " +
+          f"Cells Expanded: {maze_replan._num_cells_explored}")
+    maze_replan.setBlocked(Position(28, 29))
+    goal_replan = maze_replan.replan(start=Position(2, 2))
+    print(f"After blocking one cell and moving the start: found goal? {goal_replan is not None}, " +
+          f"Cells Expanded: {maze_replan._num_cells_explored} (should be far fewer)")
+
+    print("\nTesting maze files (a saved maze, and its text rendering, should load back the same)")
+    random.seed(seeds[0])
+    maze_saved = Maze(30, 30, prop_blocked=0.20, search_order=SearchOrder.NSWE)
+    with tempfile.TemporaryDirectory() as directory:
+        maze_saved.saveFile(os.path.join(directory, "saved.maze"))
+        maze_loaded = Maze.fromFile(os.path.join(directory, "saved.maze"))
+        print(f"Loaded layout matches? {str(maze_loaded) == str(maze_saved)} (Expected: True)")
+        with open(os.path.join(directory, "saved.txt"), "w", encoding="utf-8") as file:
+            file.write(str(maze_saved))
+        convertTextFile(os.path.join(directory, "saved.txt"), os.path.join(directory, "text.maze"))
+        maze_converted = Maze.fromFile(os.path.join(directory, "text.maze"), compact=False)
+        print(f"Converted layout matches? {str(maze_converted) == str(maze_saved)} (Expected: True)")
+        goal_loaded = maze_loaded.bfs()
+        maze_loaded.showPath(goal_loaded)
+        print(f"Loaded maze BFS Path Length: {maze_loaded._path_length} " +
+              f"(should match BFS for seed {seeds[0]} above)")
+
+    print("\nTesting bit-parallel reachability and distance queries")
+    for seed in seeds:
+        random.seed(seed)
+        maze_bits = Maze(30, 30, prop_blocked=0.20, search_order=SearchOrder.NSWE, compact=True)
+        distance = maze_bits.shortestDistance()
+        print(f"Seed {seed}: shortest distance {distance} moves " +
+              f"(Expected: one less than the BFS Path Length above), " +
+              f"reachable cells: {maze_bits.reachableCount()}")
+
+    print("\nTesting distance fields (every agent routed to the goal by lookups)")
+    random.seed(seeds[0])
+    maze_field = Maze(30, 30, prop_blocked=0.20, search_order=SearchOrder.NSWE, compact=True)
+    field = maze_field.distanceField()
+    for agent in [Position(0, 0), Position(29, 0), Position(15, 15)]:
+        path = field.pathFrom(agent)
+        print(f"Agent at {agent}: distance {field.distanceFrom(agent)}, next step {field.nextStep(agent)}, " +
+              ("no path" if path is None else f"Path Length: {len(path)}"))
+    print(f"Agent at (0,0) should match BFS Path Length for seed {seeds[0]} above")
+    print(f"Second request cached? {maze_field.distanceField() is field} (Expected: True)")
+
+    print("\nTesting solveMany (three queries against one 30x30 maze)")
+    random.seed(seeds[0])
+    maze_many = Maze(30, 30, prop_blocked=0.20, search_order=SearchOrder.NSWE, compact=True)
+    queries = [(Position(0, 0), Position(29, 29)), (Position(29, 0), Position(0, 29)),
+               (Position(0, 0), Position(15, 15))]
+    for (start, goal), path in zip(queries, maze_many.solveMany(queries)):
+        print(f"{start} -> {goal}: " + ("no path" if path is None else f"Path Length: {len(path)}"))
+    print(f"First query should match BFS Path Length for seed {seeds[0]} above")
+
+    print("\nTesting parallel tiled BFS (path lengths should match BFS above)")
+    for seed in seeds:
+        random.seed(seed)
+        maze_parallel = Maze(30, 30, prop_blocked=0.20, search_order=SearchOrder.NSWE, compact=True)
+        goal_parallel = maze_parallel.bfsParallel(processes=2, tile_size=8)
+        if goal_parallel:
+            maze_parallel.showPath(goal_parallel)
+            print(f"Seed {seed}: parallel BFS Path Length: {maze_parallel._path_length}, " +
+                  f"Cells Reached: {maze_parallel._num_cells_explored}")
+        else:
+            print(f"Seed {seed}: parallel BFS could not find a path")
+
+    print("\nTesting iterPath and streamed rendering (no cells marked)")
+    random.seed(seeds[0])
+    maze_stream = Maze(30, 30, prop_blocked=0.20, search_order=SearchOrder.NSWE, compact=True)
+    goal_stream = maze_stream.bfs()
+    if goal_stream:
+        path = list(maze_stream.iterPath(goal_stream))
+        print(f"iterPath: {path[0]} -> {path[-1]}, Path Length: {len(path)} " +
+              f"(Expected: (0,0) -> (29,29), BFS Path Length for seed {seeds[0]} above)")
+        text = io.StringIO()
+        maze_stream.writeTo(text, goal_stream, chunk_rows=8)
+        print(f"Streamed path cells: {text.getvalue().count(Contents.PATH.value)} " +
+              f"(Expected: {len(path) - 2}), maze left unmarked? " +
+              f"{Contents.PATH.value not in str(maze_stream)} (Expected: True)")
+
+    print("\nTesting generated mazes (perfect mazes and ensure_path always have a path)")
+    for method in ["backtracker", "kruskal", "wilson"] + (["random"] if np is not None else []):
+        maze_gen = Maze.generate(31, 31, method=method, prop_blocked=0.45, seed=seeds[0],
+                                 ensure_path=True)
+        goal_gen = maze_gen.bfs()
+        print(f"{method}: " + ("no path (unexpected)" if goal_gen is None else
+                               f"BFS Path Length: {maze_gen.shortestDistance() + 1}"))
+
+    if np is not None:
+        print("\nTesting vectorized BFS (should match BFS above)")
+        for seed in seeds:
+            random.seed(seed)
+            maze_vec = Maze(30, 30, prop_blocked=0.20, search_order=SearchOrder.NSWE, compact=True)
+            goal_vec = maze_vec.bfsVectorized()
+            if goal_vec:
+                maze_vec.showPath(goal_vec)
+                print(f"Seed {seed}: vectorized BFS Path Length: {maze_vec._path_length}, " +
+                      f"Cells Explored: {maze_vec._num_cells_explored}")
+            else:
+                print(f"Seed {seed}: vectorized BFS could not find a path")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
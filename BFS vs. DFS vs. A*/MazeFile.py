@@ -0,0 +1,272 @@
+from __future__ import annotations
+from typing import Iterable
+import mmap
+import os
+import struct
+import tempfile
+
+# file layout (all integers little-endian):
+#   a 64-byte header: magic b"MAZE", version (u16), header size (u16), rows,
+#     cols, start row, start col, goal row, goal col, and words per row (u32
+#     each), 4 reserved bytes, the byte offset of the mask (u64), and padding
+#   the blocked mask: for each row, words_per_row 64-bit words, where bit
+#     (col % 64) of word (col // 64) is set if that cell is blocked; each row is
+#     padded with zero bits to a whole number of words, so every row starts
+#     8-byte aligned and can be read as an array of uint64 words in place
+MAGIC   = b"MAZE"
+VERSION = 1
+HEADER  = struct.Struct("<4sHHIIIIIIIIQ16x")
+
+# translation tables between one byte per cell (0 open, anything else blocked)
+# and the ASCII '0'/'1' digits that int() and format() use for binary
+_FLAGS_TO_DIGITS = bytes([ord('0')] + [ord('1')] * 255)
+_DIGITS_TO_FLAGS = bytes.maketrans(b"01", b"\x00\x01")
+
+# the cell symbols Maze.__str__ can produce, plus the plain ASCII alternatives
+# suggested alongside them in Maze.Contents
+_OPEN_SYMBOLS    = " ★*⦿S◆G"
+_BLOCKED_SYMBOLS = "░X"
+
+################################################################################
+class MazeFile:
+    ''' class representing a maze file opened read-only through mmap: opening
+        one reads only the header, so even a 10**9-cell grid opens at once, and
+        since the mask is bit-packed the operating system shares its pages
+        between every process that maps the same file (a MazeFile sent to a
+        worker process reopens the file there rather than copying the mask)
+    '''
+    __slots__ = ('_path', '_file', '_map', '_rows', '_cols', '_start', '_goal',
+                 '_row_bytes', '_offset')
+
+    def __init__(self, path: str):
+        ''' initializer method for a MazeFile object
+        Parameters:
+            path: the maze file to open
+        Raises:
+            ValueError if the file is not a maze file of a supported version,
+                or is shorter than its header says
+        '''
+        self._path: str = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access = mmap.ACCESS_READ)
+        except ValueError:   # an empty file cannot be mapped
+            self._file.close()
+            raise ValueError(f"{path} is not a maze file")
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is not a maze file")
+
+        magic, version, _, rows, cols, start_row, start_col, goal_row, goal_col, \
+            words_per_row, _, offset = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} maze file")
+        self._rows:      int = rows
+        self._cols:      int = cols
+        self._start:     tuple[int, int] = (start_row, start_col)
+        self._goal:      tuple[int, int] = (goal_row, goal_col)
+        self._row_bytes: int = words_per_row * 8
+        self._offset:    int = offset
+        if len(self._map) < offset + rows * self._row_bytes:
+            self.close()
+            raise ValueError(f"{path} is truncated")
+
+    def __reduce__(self):
+        ''' pickles as just the path, so worker processes map the file themselves '''
+        return (MazeFile, (self._path,))
+
+    def __enter__(self) -> MazeFile:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        ''' unmaps and closes the file '''
+        self._map.close()
+        self._file.close()
+
+    def getShape(self) -> tuple[int, int]:
+        ''' returns the (rows, cols) of the grid '''
+        return self._rows, self._cols
+
+    def getStart(self) -> tuple[int, int]:
+        ''' returns the (row, col) of the start cell '''
+        return self._start
+
+    def getGoal(self) -> tuple[int, int]:
+        ''' returns the (row, col) of the goal cell '''
+        return self._goal
+
+    def isBlocked(self, row: int, col: int) -> bool:
+        ''' indicates whether a cell is blocked, reading a single byte of the mask
+        Raises:
+            IndexError if row/col is out of range
+        '''
+        if not (0 <= row < self._rows and 0 <= col < self._cols):
+            raise IndexError(f"({row},{col}) is outside the {self._rows}x{self._cols} grid")
+        return bool(self._map[self._offset + row * self._row_bytes + (col >> 3)] >> (col & 7) & 1)
+
+    def rowWords(self, row: int) -> memoryview:
+        ''' returns one row of the mask, in place, as a read-only view of its
+            words (as the machine's native uint64, i.e., little-endian on every
+            common platform) '''
+        start = self._offset + row * self._row_bytes
+        return memoryview(self._map)[start:start + self._row_bytes].cast('Q')
+
+    def rowBits(self, row: int) -> int:
+        ''' returns one row of the mask as an int whose bit c is set if the
+            cell in column c is blocked '''
+        start = self._offset + row * self._row_bytes
+        return int.from_bytes(self._map[start:start + self._row_bytes], "little")
+
+    def maskBits(self) -> int:
+        ''' returns the whole mask as one int whose bit r * words_per_row * 64
+            + c is set if the cell at (r, c) is blocked -- the file's
+            little-endian, row-aligned words read as a single number '''
+        return int.from_bytes(self._map[self._offset:self._offset + self._rows * self._row_bytes],
+                              "little")
+
+    def rowFlags(self, row: int) -> bytes:
+        ''' returns one row of the mask unpacked to one byte per cell (1 if
+            blocked, 0 if not) '''
+        digits = format(self.rowBits(row), f"0{self._row_bytes * 8}b")[::-1]
+        return digits[:self._cols].encode().translate(_DIGITS_TO_FLAGS)
+
+################################################################################
+def writeMazeFile(path: str, rows: int, cols: int,
+                  start: tuple[int, int], goal: tuple[int, int],
+                  row_flags: Iterable[bytes]) -> None:
+    ''' function to write a maze file, one row at a time (so a grid larger than
+        memory can be written from a stream); the file is written under a
+        temporary name and then renamed, so readers only ever see whole files
+    Parameters:
+        path:      the maze file to create (or replace)
+        rows:      number of rows in the grid
+        cols:      number of columns in the grid
+        start:     (row, col) of the start cell
+        goal:      (row, col) of the goal cell
+        row_flags: the grid's rows in order, each as one byte per cell (0 for
+                   open, anything else for blocked)
+    Raises:
+        ValueError if start or goal is out of range, or if row_flags does
+            not hold exactly rows rows of cols cells
+    '''
+    for name, (row, col) in (("start", start), ("goal", goal)):
+        if not (0 <= row < rows and 0 <= col < cols):
+            raise ValueError(f"invalid (row,col) given for {name} cell")
+
+    words_per_row = (cols + 63) // 64
+    row_bytes = words_per_row * 8
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temp_path = tempfile.mkstemp(dir = directory, suffix = ".maze")
+    try:
+        with os.fdopen(handle, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, HEADER.size, rows, cols, *start, *goal,
+                                   words_per_row, 0, HEADER.size))
+            written = 0
+            for flags in row_flags:
+                if len(flags) != cols:
+                    raise ValueError(f"row {written} has {len(flags)} cells, not {cols}")
+                # reversed, the row reads as a binary number whose bit c is cell c
+                bits = int(flags.translate(_FLAGS_TO_DIGITS)[::-1] or b"0", 2)
+                file.write(bits.to_bytes(row_bytes, "little"))
+                written += 1
+            if written != rows:
+                raise ValueError(f"got {written} rows, not {rows}")
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+def parseTextRow(line: str) -> tuple[bytes, int | None, int | None]:
+    ''' function to parse one line of a Maze's text rendering (see
+        Maze.__str__), e.g. "|⦿| |░|"
+    Returns:
+        a tuple (flags, start_col, goal_col): one byte per cell (1 if
+        blocked), and the columns of the start and goal in this row (None
+        where they are not in it)
+    Raises:
+        ValueError if the line is not a rendering of a row
+    '''
+    line = line.rstrip("\r\n")
+    symbols = line[1::2]
+    if len(line) < 3 or len(line) % 2 == 0 or line[::2] != "|" * (len(symbols) + 1):
+        raise ValueError(f"not a maze row: {line!r}")
+    unknown = set(symbols) - set(_OPEN_SYMBOLS) - set(_BLOCKED_SYMBOLS)
+    if unknown:
+        raise ValueError(f"unknown cell symbols {sorted(unknown)} in {line!r}")
+
+    flags = symbols.translate({ord(s): 0 for s in _OPEN_SYMBOLS} |
+                              {ord(s): 1 for s in _BLOCKED_SYMBOLS})
+    start = next((col for col, s in enumerate(symbols) if s in "⦿S"), None)
+    goal  = next((col for col, s in enumerate(symbols) if s in "◆G"), None)
+    return flags.encode("latin-1"), start, goal
+
+def convertTextFile(text_path: str, maze_path: str) -> tuple[int, int]:
+    ''' function to convert a Maze's text rendering (as printed by
+        Maze.__str__, one row per line; cells on a printed path count as open)
+        into a maze file, reading the text twice rather than holding it all
+    Parameters:
+        text_path: the text file to read
+        maze_path: the maze file to write
+    Returns:
+        the (rows, cols) of the grid
+    Raises:
+        ValueError if the text is not a maze rendering with exactly one start
+            and one goal, or if its rows differ in length
+    '''
+    rows, cols, start, goal = 0, None, None, None
+    with open(text_path, encoding = "utf-8") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            flags, start_col, goal_col = parseTextRow(line)
+            if cols is None:
+                cols = len(flags)
+            elif len(flags) != cols:
+                raise ValueError(f"row {rows} has {len(flags)} cells, not {cols}")
+            for found, name in ((start_col, "start"), (goal_col, "goal")):
+                if found is not None:
+                    if (start if name == "start" else goal) is not None:
+                        raise ValueError(f"more than one {name} cell")
+                    if name == "start": start = (rows, found)
+                    else:               goal  = (rows, found)
+            rows += 1
+    if start is None or goal is None:
+        raise ValueError("the text needs both a start and a goal cell")
+
+    def flagRows() -> Iterable[bytes]:
+        with open(text_path, encoding = "utf-8") as file:
+            for line in file:
+                if line.strip():
+                    yield parseTextRow(line)[0]
+
+    writeMazeFile(maze_path, rows, cols, start, goal, flagRows())
+    return rows, cols
+
+###################
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        text_path = os.path.join(directory, "maze.txt")
+        maze_path = os.path.join(directory, "maze.maze")
+        with open(text_path, "w", encoding = "utf-8") as file:
+            file.write("|⦿| |░|\n|░|★| |\n| |░|◆|")
+
+        print(f"Converted shape: {convertTextFile(text_path, maze_path)}")
+        print("Expected:        (3, 3)")
+        with MazeFile(maze_path) as maze_file:
+            print(f"Start {maze_file.getStart()}, goal {maze_file.getGoal()}")
+            print("Expected: Start (0, 0), goal (2, 2)")
+            print(f"Row flags: {[list(maze_file.rowFlags(row)) for row in range(3)]}")
+            print("Expected:  [[0, 0, 1], [1, 0, 0], [0, 1, 0]]")
+            print(f"(1,0) blocked? {maze_file.isBlocked(1, 0)} | (1,1) blocked? {maze_file.isBlocked(1, 1)}")
+            print("Expected:      True | (1,1) blocked? False")
+            print(f"Row 2 as words: {maze_file.rowWords(2).tolist()}")
+            print("Expected:       [2]")
+            print(f"File size: {os.path.getsize(maze_path)} bytes")
+            print(f"Expected:  {HEADER.size + 3 * 8} bytes")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+from __future__ import annotations
+from collections import deque
+import random
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for randomMask
+    np = None
+
+# every generator returns a mask: a bytearray with one byte per cell, indexed by
+# row * cols + col, that is 1 if the cell is blocked and 0 otherwise (the
+# layout Maze.fromBlocked takes, one row at a time)
+
+# the perfect-maze generators carve passages between "rooms", the cells with
+# an even row and an even column; every other cell starts as a wall, and the
+# cell between two rooms is opened to join them; with an odd number of rows
+# and of columns, the corners are rooms, so the default start and goal are
+# always connected
+
+def randomMask(rows: int, cols: int, prop_blocked: float, seed: int | None,
+               start: tuple[int, int], goal: tuple[int, int]) -> bytearray:
+    ''' function to block a given proportion of the cells other than the start
+        and goal, chosen uniformly at random by a NumPy Generator -- the same
+        number Maze.__init__ blocks, but drawn in a single vectorized call
+        rather than cell by cell
+    Parameters:
+        rows, cols:   the grid's dimensions
+        prop_blocked: proportion of the other cells to block (0.0 to 1.0)
+        seed:         seed for numpy.random.default_rng (None for a fresh one)
+        start, goal:  (row, col) of the two cells never to block
+    Returns:
+        the mask
+    Raises:
+        ImportError if numpy is not installed
+    '''
+    if np is None:
+        raise ImportError("randomMask requires numpy to be installed")
+    num_cells = rows * cols
+    start_idx, goal_idx = start[0] * cols + start[1], goal[0] * cols + goal[1]
+    first, second = min(start_idx, goal_idx), max(start_idx, goal_idx)
+    num_others = num_cells - 1 - (second != first)
+    chosen = np.random.default_rng(seed).choice(num_others, size = round(num_others * prop_blocked),
+                                                replace = False)
+    # the i-th other cell is the i-th cell once the start and goal are skipped
+    # (just one cell to skip when they are the same)
+    chosen += chosen >= first
+    if second != first:
+        chosen += chosen >= second
+    mask = np.zeros(num_cells, dtype = np.uint8)
+    mask[chosen] = 1
+    return bytearray(mask.tobytes())
+
+def _roomGrid(rows: int, cols: int) -> tuple[bytearray, int, int]:
+    ''' returns a mask with only the rooms open, and the rooms' rows and cols '''
+    mask = bytearray(b"\x01") * (rows * cols)
+    room_cols = (cols + 1) // 2
+    for row in range(0, rows, 2):
+        mask[row * cols:(row + 1) * cols:2] = bytes(room_cols)
+    return mask, (rows + 1) // 2, room_cols
+
+def _roomCell(room: int, room_cols: int, cols: int) -> int:
+    ''' returns the flat index of a room's cell '''
+    room_row, room_col = divmod(room, room_cols)
+    return 2 * room_row * cols + 2 * room_col
+
+def _roomNeighbors(room: int, room_rows: int, room_cols: int) -> list[int]:
+    room_row, room_col = divmod(room, room_cols)
+    return [neighbor for neighbor, in_bounds in
+            ((room - room_cols, room_row > 0), (room + room_cols, room_row < room_rows - 1),
+             (room - 1, room_col > 0),         (room + 1, room_col < room_cols - 1)) if in_bounds]
+
+def backtrackerMask(rows: int, cols: int, seed: int | None) -> bytearray:
+    ''' function to carve a perfect maze (exactly one path between any two
+        rooms) by the recursive backtracker, run on an explicit stack: walk
+        to a random unvisited neighboring room, opening the wall between,
+        and back up when there is none; gives long, winding corridors
+    Parameters:
+        rows, cols: the grid's dimensions
+        seed:       seed for the random choices (None for a fresh one)
+    Returns:
+        the mask
+    '''
+    rng = random.Random(seed)
+    mask, room_rows, room_cols = _roomGrid(rows, cols)
+    visited = bytearray(room_rows * room_cols)
+    visited[0] = 1
+    stack = [0]
+    while stack:
+        room = stack[-1]
+        options = [neighbor for neighbor in _roomNeighbors(room, room_rows, room_cols)
+                   if not visited[neighbor]]
+        if not options:
+            stack.pop()
+            continue
+        neighbor = rng.choice(options)
+        visited[neighbor] = 1
+        # the wall lies halfway between the two rooms' cells
+        mask[(_roomCell(room, room_cols, cols) + _roomCell(neighbor, room_cols, cols)) // 2] = 0
+        stack.append(neighbor)
+    return mask
+
+def kruskalMask(rows: int, cols: int, seed: int | None) -> bytearray:
+    ''' function to carve a perfect maze by randomized Kruskal: go through
+        the walls between rooms in random order, opening each one that joins
+        two rooms not yet connected (tracked by union-find); gives many
+        short dead ends
+    Parameters:
+        rows, cols: the grid's dimensions
+        seed:       seed for the random order (None for a fresh one)
+    Returns:
+        the mask
+    '''
+    mask, room_rows, room_cols = _roomGrid(rows, cols)
+    walls = [(room, neighbor) for room in range(room_rows * room_cols)
+             for neighbor in _roomNeighbors(room, room_rows, room_cols) if neighbor > room]
+    random.Random(seed).shuffle(walls)
+
+    parent = list(range(room_rows * room_cols))
+    def find(room: int) -> int:
+        while parent[room] != room:
+            parent[room] = parent[parent[room]]   # path halving
+            room = parent[room]
+        return room
+
+    for room, neighbor in walls:
+        root, other = find(room), find(neighbor)
+        if root != other:
+            parent[other] = root
+            mask[(_roomCell(room, room_cols, cols) + _roomCell(neighbor, room_cols, cols)) // 2] = 0
+    return mask
+
+def wilsonMask(rows: int, cols: int, seed: int | None) -> bytearray:
+    ''' function to carve a perfect maze by Wilson's algorithm: from each room
+        not yet in the maze, take a random walk until it meets the maze, then
+        add the walk with its loops erased (only the last exit taken from
+        each room is remembered, which erases them); unlike the others, every
+        perfect maze is equally likely
+    Parameters:
+        rows, cols: the grid's dimensions
+        seed:       seed for the random walks (None for a fresh one)
+    Returns:
+        the mask
+    '''
+    rng = random.Random(seed)
+    mask, room_rows, room_cols = _roomGrid(rows, cols)
+    num_rooms = room_rows * room_cols
+    in_maze = bytearray(num_rooms)
+    in_maze[rng.randrange(num_rooms)] = 1
+    exit_to = [-1] * num_rooms
+    for first in range(num_rooms):
+        room = first
+        while not in_maze[room]:
+            exit_to[room] = rng.choice(_roomNeighbors(room, room_rows, room_cols))
+            room = exit_to[room]
+        room = first
+        while not in_maze[room]:
+            in_maze[room] = 1
+            mask[(_roomCell(room, room_cols, cols) + _roomCell(exit_to[room], room_cols, cols)) // 2] = 0
+            room = exit_to[room]
+    return mask
+
+def carvePath(mask: bytearray, rows: int, cols: int,
+              start: tuple[int, int], goal: tuple[int, int]) -> int:
+    ''' function to make sure a path joins the start and goal, by unblocking
+        as few cells as possible: a 0-1 BFS from the start, where a move into
+        an open cell costs 0 and into a blocked one costs 1, finds the path
+        through the fewest blocked cells, and those are opened; when the goal
+        is already reachable this costs no more than a BFS of the start's
+        component, so no caller ever needs to retry with another seed
+    Parameters:
+        mask:        the mask to repair, in place (the start and goal are
+                     opened too, if blocked)
+        rows, cols:  the grid's dimensions
+        start, goal: (row, col) of the cells to join
+    Returns:
+        the number of cells unblocked
+    '''
+    source, target = start[0] * cols + start[1], goal[0] * cols + goal[1]
+    opened = mask[source] + mask[target]
+    mask[source] = mask[target] = 0
+    cost = {source: 0}
+    parent = {source: -1}
+    frontier = deque([source])
+    while frontier:
+        current = frontier.popleft()
+        if current == target:
+            break
+        row, col = divmod(current, cols)
+        for neighbor, in_bounds in ((current - cols, row > 0), (current + cols, row < rows - 1),
+                                    (current - 1, col > 0),    (current + 1, col < cols - 1)):
+            if not in_bounds:
+                continue
+            new_cost = cost[current] + mask[neighbor]
+            if new_cost < cost.get(neighbor, new_cost + 1):
+                cost[neighbor], parent[neighbor] = new_cost, current
+                if mask[neighbor]:
+                    frontier.append(neighbor)
+                else:
+                    frontier.appendleft(neighbor)
+
+    cell = target
+    while cell >= 0:
+        opened += mask[cell]
+        mask[cell] = 0
+        cell = parent[cell]
+    return opened
+
+# generator name (for Maze.generate) -> function building the mask
+PERFECT_GENERATORS = {"backtracker": backtrackerMask, "kruskal": kruskalMask, "wilson": wilsonMask}
+
+###################
+def main() -> None:
+    for name, generate in PERFECT_GENERATORS.items():
+        mask = generate(5, 7, seed = 1)
+        print(f"{name}: {mask.count(0)} open cells (Expected: 23, a perfect 3x4-room maze)")
+        print("\n".join("".join("░" if flag else " " for flag in mask[row * 7:(row + 1) * 7])
+                        for row in range(5)))
+
+    mask = bytearray(b"\x01") * 25
+    print(f"Cells opened to join (0,0) and (4,4) in a solid 5x5 grid: " +
+          f"{carvePath(mask, 5, 5, (0, 0), (4, 4))} (Expected: 9)")
+    if np is not None:
+        mask = randomMask(10, 10, 0.25, seed = 7, start = (0, 0), goal = (9, 9))
+        print(f"Random mask blocks {sum(mask)} cells (Expected: 24), " +
+              f"start open? {mask[0] == 0} (Expected: True)")
+        mask = randomMask(10, 10, 0.25, seed = 7, start = (4, 4), goal = (4, 4))
+        print(f"With start == goal, blocks {sum(mask)} cells (Expected: 25), " +
+              f"start open? {mask[44] == 0} (Expected: True)")
+
+if __name__ == "__main__":
+    main()
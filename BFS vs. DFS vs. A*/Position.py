@@ -0,0 +1,26 @@
+from __future__ import annotations
+from typing import NamedTuple
+
+################################################################################
+class Position(NamedTuple):
+    ''' just allows us to use .row and .col rather than the less-easy-to-read
+        [0] and [1] for accessing values'''
+    row: int
+    col: int
+
+    def __str__(self) -> str: return f"({self.row},{self.col})"
+
+# (row, col) change for a move in each direction
+DIRECTION_MOVEMENTS = {"N": (-1, 0), "S": (1, 0), "W": (0, -1), "E": (0, 1)}
+
+###################
+def main() -> None:
+    position = Position(2, 3)
+    print(f"Position: {position}, row {position.row}, col {position.col}")
+    print("Expected: (2,3), row 2, col 3")
+    row_change, col_change = DIRECTION_MOVEMENTS["N"]
+    print(f"One step north: {Position(position.row + row_change, position.col + col_change)}")
+    print("Expected:       (1,3)")
+
+if __name__ == "__main__":
+    main()
@@ -89,6 +89,255 @@ class PriorityQueue[K,V]:
     def __str__(self) -> str:
         return str(self._container)
 
+#######################################
+class HeapEntry[K,V](Entry[K,V]):
+    ''' an Entry that also remembers its index in an IndexedPriorityQueue's
+        heap (-1 once removed), so it can serve as a handle to that Entry '''
+    __slots__ = ('index',)
+
+    def __init__(self, priority: K, data: V, index: int) -> None:
+        super().__init__(priority, data)
+        self.index: int = index
+
+##############################
+class IndexedPriorityQueue[K,V]:
+    ''' binary min-heap priority queue whose insert returns a handle to the new
+        Entry; the queue tracks where every Entry sits in the heap, so an
+        Entry's key can later be lowered in place (decreaseKey) rather than
+        inserting a duplicate Entry and leaving the stale one behind
+    '''
+    __slots__ = ('_container',)
+
+    def __init__(self) -> None:
+        self._container: list[HeapEntry[K,V]] = list()
+
+    def __len__(self)  -> int:  return len(self._container)
+    def isEmpty(self) -> bool:  return len(self._container) == 0
+
+    def contains(self, handle: HeapEntry[K,V]) -> bool:
+        ''' indicates whether a handle's Entry is still in this queue
+        Parameters:
+            handle: a HeapEntry returned by insert
+        Returns:
+            True if the Entry has not yet been removed, False o/w
+        '''
+        return 0 <= handle.index < len(self._container) and \
+               self._container[handle.index] is handle
+
+    def insert(self, key: K, item: V) -> HeapEntry[K,V]:
+        ''' method to create a new Entry having key and item, and then insert
+            the Entry into the heap
+        Parameters:
+            key: the entry's priority
+            item: the entry's data
+        Returns:
+            the inserted HeapEntry, to be used as a handle for decreaseKey
+        '''
+        entry = HeapEntry(key, item, len(self._container))
+        self._container.append(entry)
+        self._siftUp(entry.index)
+        return entry
+
+    def decreaseKey(self, handle: HeapEntry[K,V], new_key: K) -> None:
+        ''' method to lower the priority key of an Entry already in the queue,
+            moving it up the heap to its new place
+        Parameters:
+            handle:  a HeapEntry returned by insert
+            new_key: the new priority, no greater than the current one
+        Raises:
+            ValueError if the handle's Entry is no longer in the queue, or if
+                new_key is greater than the Entry's current key
+        '''
+        if not self.contains(handle):
+            raise ValueError("Entry is not in the Priority Queue")
+        if handle.key < new_key:
+            raise ValueError("decreaseKey cannot increase an Entry's key")
+        handle.key = new_key
+        self._siftUp(handle.index)
+
+    def update(self, handle: HeapEntry[K,V], new_key: K) -> None:
+        ''' method to change the priority key of an Entry already in the queue,
+            in either direction, moving it up or down the heap to its new place
+        Parameters:
+            handle:  a HeapEntry returned by insert
+            new_key: the new priority
+        Raises:
+            ValueError if the handle's Entry is no longer in the queue
+        '''
+        if not self.contains(handle):
+            raise ValueError("Entry is not in the Priority Queue")
+        handle.key = new_key
+        self._siftUp(handle.index)
+        self._siftDown(handle.index)
+
+    def remove(self, handle: HeapEntry[K,V]) -> None:
+        ''' method to remove an Entry from anywhere in the queue
+        Parameters:
+            handle: a HeapEntry returned by insert
+        Raises:
+            ValueError if the handle's Entry is no longer in the queue
+        '''
+        if not self.contains(handle):
+            raise ValueError("Entry is not in the Priority Queue")
+        heap  = self._container
+        index = handle.index
+        last  = heap.pop()
+        if last is not handle:
+            # fill the hole with the last Entry, which may belong above or below
+            heap[index] = last
+            last.index = index
+            self._siftUp(index)
+            self._siftDown(last.index)
+        handle.index = -1
+
+    def removeMin(self) -> HeapEntry[K,V]:
+        ''' method to remove the highest priority (e.g., minimum time) Entry
+            from the queue, returning that Entry
+        Returns:
+            HeapEntry object corresponding to the highest priority Entry
+        Raises:
+            EmptyError if the priority queue is empty
+        '''
+        if self.isEmpty():
+            raise EmptyError("Priority Queue is empty")
+        top = self._container[0]
+        self.remove(top)
+        return top
+
+    def min(self) -> HeapEntry[K,V]:
+        ''' method to return but not remove the highest priority Entry
+        Returns:
+            HeapEntry object corresponding to the highest priority Entry
+        Raises:
+            EmptyError if the priority queue is empty
+        '''
+        if self.isEmpty():
+            raise EmptyError("Priority Queue is empty")
+        return self._container[0]
+
+    def _siftUp(self, index: int) -> None:
+        ''' moves the Entry at the given heap index up until its parent's key
+            is no greater than its own, keeping every Entry's index current
+        '''
+        heap  = self._container
+        entry = heap[index]
+        while index > 0:
+            parent_index = (index - 1) // 2
+            parent = heap[parent_index]
+            if not entry < parent:
+                break
+            heap[index] = parent
+            parent.index = index
+            index = parent_index
+        heap[index] = entry
+        entry.index = index
+
+    def _siftDown(self, index: int) -> None:
+        ''' moves the Entry at the given heap index down until neither child's
+            key is smaller than its own, keeping every Entry's index current
+        '''
+        heap  = self._container
+        size  = len(heap)
+        entry = heap[index]
+        while True:
+            child_index = 2 * index + 1
+            if child_index >= size:
+                break
+            if child_index + 1 < size and heap[child_index + 1] < heap[child_index]:
+                child_index += 1
+            child = heap[child_index]
+            if not child < entry:
+                break
+            heap[index] = child
+            child.index = index
+            index = child_index
+        heap[index] = entry
+        entry.index = index
+
+    def __str__(self) -> str:
+        return str(self._container)
+
+##############################
+class BucketQueue[V]:
+    ''' monotone priority queue for small non-negative integer keys, as used
+        by Dial's shortest-path algorithm: a circular array of max_step + 1
+        buckets, one per key, with key k kept in bucket k % (max_step + 1);
+        every key inserted must be at least the last key removed and at most
+        max_step more than it (as when each key is a removed key plus a step
+        cost of at most max_step), so the keys queued at any moment fit in
+        the buckets without wrapping onto each other; insert is O(1), and
+        removeMin only ever moves forward through the buckets, so a whole
+        run costs O(1) per Entry plus O(1) per key value passed, rather
+        than a heap's O(log n) per operation; Entries with equal keys come
+        out in no particular order
+    '''
+    __slots__ = ('_buckets', '_current', '_size')
+
+    def __init__(self, max_step: int, first_key: int = 0) -> None:
+        ''' initializer method for a BucketQueue object
+        Parameters:
+            max_step:  the most a key inserted may exceed the last key removed
+            first_key: the smallest key that will be inserted, which stands
+                       in for the last key removed until one is
+        '''
+        self._buckets: list[list[V]] = [[] for _ in range(max_step + 1)]
+        self._current: int = first_key   # no key below this is queued
+        self._size:    int = 0
+
+    def __len__(self)  -> int:  return self._size
+    def isEmpty(self) -> bool:  return self._size == 0
+
+    def insert(self, key: int, item: V) -> None:
+        ''' method to insert an item with an integer key
+        Parameters:
+            key:  the item's priority
+            item: the item's data
+        Raises:
+            ValueError if key is below the last key removed (first_key before
+                any removal), or more than max_step above it
+        '''
+        if not self._current <= key < self._current + len(self._buckets):
+            raise ValueError(f"key {key} is outside [{self._current}, " +
+                             f"{self._current + len(self._buckets) - 1}]")
+        self._buckets[key % len(self._buckets)].append(item)
+        self._size += 1
+
+    def _advance(self) -> list[V]:
+        ''' moves forward to the first non-empty bucket, returning it
+        Raises:
+            EmptyError if the queue is empty
+        '''
+        if self._size == 0:
+            raise EmptyError("Priority Queue is empty")
+        buckets = self._buckets
+        while not buckets[self._current % len(buckets)]:
+            self._current += 1
+        return buckets[self._current % len(buckets)]
+
+    def removeMin(self) -> Entry[int,V]:
+        ''' method to remove an Entry with the smallest key, returning it
+        Returns:
+            Entry object with the smallest key and its item
+        Raises:
+            EmptyError if the queue is empty
+        '''
+        bucket = self._advance()
+        self._size -= 1
+        return Entry(self._current, bucket.pop())
+
+    def min(self) -> Entry[int,V]:
+        ''' method to return but not remove an Entry with the smallest key
+        Returns:
+            Entry object with the smallest key and its item
+        Raises:
+            EmptyError if the queue is empty
+        '''
+        return Entry(self._current, self._advance()[-1])
+
+    def __str__(self) -> str:
+        return str(sorted((key, item) for key in range(self._current, self._current + len(self._buckets))
+                          for item in self._buckets[key % len(self._buckets)]))
+
 ########################## need to work on this
 def main() -> None:
     pq = PriorityQueue()
@@ -132,5 +381,38 @@ def main() -> None:
     print(f"Expected isEmpty: True | Actual: {pq.isEmpty()}")
     print(f"Expected length: 0 | Actual: {len(pq)}")
 
+    print("\nTesting IndexedPriorityQueue")
+    ipq = IndexedPriorityQueue()
+    handles = {name: ipq.insert(key, name) for key, name in
+               [(5, "event at 5"), (3, "event at 3"), (4, "event at 4"), (9, "event at 9")]}
+    ipq.decreaseKey(handles["event at 9"], 1)
+    print(f"Expected: event at 9 (key 1) | Actual: {ipq.min()}")
+    try:
+        ipq.decreaseKey(handles["event at 3"], 7)
+    except ValueError as err:
+        print(f"Correctly caught ValueError: {err}")
+    for expected in ["event at 9", "event at 3", "event at 4", "event at 5"]:
+        entry = ipq.removeMin()
+        print(f"Expected: {expected} | Actual: {entry.value}")
+    print(f"Removed Entry still contained? Expected: False | Actual: {ipq.contains(entry)}")
+
+    handles = [ipq.insert(key, f"event at {key}") for key in [6, 2, 8]]
+    ipq.update(handles[1], 10)   # 2 -> 10
+    ipq.remove(handles[0])       # drop 6
+    print(f"After update and remove, Expected: event at 8 | Actual: {ipq.removeMin().value}")
+    print(f"                         Expected: (10,event at 2) | Actual: {ipq.removeMin()}")
+
+    print("\nTesting BucketQueue")
+    bq = BucketQueue(max_step = 3)
+    for key in [2, 0, 3, 1]:
+        bq.insert(key, f"event at {key}")
+    print(f"Expected: (0,event at 0) | Actual: {bq.removeMin()}")
+    bq.insert(3, "second event at 3")   # allowed: at most 3 above the last key removed
+    try:
+        bq.insert(4, "event at 4")
+    except ValueError as err:
+        print(f"Correctly caught ValueError: {err}")
+    print(f"Expected keys: [1, 2, 3, 3] | Actual: {[bq.removeMin().key for _ in range(len(bq))]}")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
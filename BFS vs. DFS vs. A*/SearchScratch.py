@@ -0,0 +1,61 @@
+from __future__ import annotations
+from array import array
+
+################################################################################
+class SearchScratch:
+    ''' per-cell scratch arrays shared by every search over a grid of one
+        size: a cell counts as visited only while its stamp equals the
+        current generation, so starting a new search clears every visited
+        mark by bumping a counter, and parent/cost slots are trusted only
+        for stamped cells, so they never need clearing either
+    '''
+    __slots__ = ('stamp', 'generation', 'parent', 'cost', 'buffer', 'heap')
+
+    def __init__(self, num_cells: int):
+        self.stamp:      array = array('I', [0]) * num_cells
+        self.generation: int   = 0
+        self.parent:     array = array('i', [-1]) * num_cells
+        self.cost:       array = array('i', [0]) * num_cells
+        self.buffer:     array = array('i', [0]) * num_cells  # BFS queue or DFS stack
+        self.heap:       list[int] = []                       # A* frontier
+
+    def begin(self) -> int:
+        ''' starts a new search
+        Returns:
+            the generation to stamp the new search's visited cells with
+        '''
+        self.generation += 1
+        if self.generation == 2 ** 32:  # stamps wrapped: start them over
+            self.stamp = array('I', [0]) * len(self.stamp)
+            self.generation = 1
+        return self.generation
+
+    def path(self, goal: int) -> list[int]:
+        ''' follows the parent slots back from the goal to the search's start
+            (whose parent slot holds -1)
+        Returns:
+            flat indices of the cells from the start to the goal
+        '''
+        parent = self.parent
+        path = [goal]
+        while parent[path[-1]] >= 0:
+            path.append(parent[path[-1]])
+        path.reverse()
+        return path
+
+###################
+def main() -> None:
+    # a path 0 -> 2 -> 3 recorded in the parent slots, as a search would
+    scratch = SearchScratch(4)
+    generation = scratch.begin()
+    for cell, parent in ((0, -1), (2, 0), (3, 2)):
+        scratch.stamp[cell] = generation
+        scratch.parent[cell] = parent
+    print(f"Path to 3: {scratch.path(3)} (Expected: [0, 2, 3])")
+
+    # a new search forgets every mark without clearing anything
+    generation = scratch.begin()
+    print(f"Cells visited after begin(): {sum(stamp == generation for stamp in scratch.stamp)} (Expected: 0)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+from typing import Callable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from Position import Position
+
+################################################################################
+class SearchStats:
+    ''' class collecting a profile of one Maze search; attach one to a Maze with
+        Maze.useStats, and each dfs/bfs/aStar call then runs an instrumented
+        copy of its loop that fills it in (a Maze without one runs the plain
+        loop, so profiling costs nothing when it is off); the definitions are
+        the same for every search:
+            pushes:           cells added to the frontier (a key decrease
+                              counts again)
+            pops:             cells taken off the frontier (each expanded:
+                              dfs, bfs, and aStar never queue a cell twice,
+                              so no outdated entries are ever skipped)
+            peak_frontier:    the most cells the frontier held at once
+            peak_memory:      peak bytes allocated during the search (only if
+                              track_memory is set, via tracemalloc, which
+                              slows the search down considerably)
+            neighbor_seconds: time spent finding and preparing neighbors
+            queue_seconds:    time spent in frontier operations
+            total_seconds:    wall time of the whole search
+            path_length:      cells on the path found (0 if none)
+    '''
+    __slots__ = ('algorithm', 'pushes', 'pops', 'peak_frontier', 'peak_memory',
+                 'neighbor_seconds', 'queue_seconds', 'total_seconds', 'path_length',
+                 'track_memory', 'trace')
+
+    def __init__(self, track_memory: bool = False,
+                       trace: Callable[[Position, int], None] | None = None) -> None:
+        ''' initializer method for a SearchStats object
+        Parameters:
+            track_memory: whether to record the search's peak memory
+            trace:        if given, called once per expanded cell with that
+                          cell's Position and the frontier size after the pop
+        '''
+        self.track_memory: bool = track_memory
+        self.trace: Callable[[Position, int], None] | None = trace
+        self.reset("")
+
+    def reset(self, algorithm: str) -> None:
+        ''' clears every counter, ready for a new search
+        Parameters:
+            algorithm: name of the search about to run
+        '''
+        self.algorithm:        str   = algorithm
+        self.pushes:           int   = 0
+        self.pops:             int   = 0
+        self.peak_frontier:    int   = 0
+        self.peak_memory:      int   = 0
+        self.neighbor_seconds: float = 0.0
+        self.queue_seconds:    float = 0.0
+        self.total_seconds:    float = 0.0
+        self.path_length:      int   = 0
+
+    def asDict(self) -> dict[str, object]:
+        ''' returns the collected profile (without the settings) as a dict,
+            e.g., for writing out as JSON '''
+        return {name: getattr(self, name) for name in self.__slots__
+                if name not in ('track_memory', 'trace')}
+
+    def __str__(self) -> str:
+        ''' returns a one-line summary of the profile '''
+        other_seconds = self.total_seconds - self.neighbor_seconds - self.queue_seconds
+        return (f"{self.algorithm}: {self.pushes} pushes, {self.pops} pops, " +
+                f"peak frontier {self.peak_frontier}, " +
+                (f"peak memory {self.peak_memory / 1024:.1f} KiB, " if self.track_memory else "") +
+                f"{self.total_seconds * 1000:.2f} ms (neighbors {self.neighbor_seconds * 1000:.2f}, " +
+                f"queue {self.queue_seconds * 1000:.2f}, other {other_seconds * 1000:.2f}), " +
+                f"path length {self.path_length}")
+
+###################
+def main() -> None:
+    stats = SearchStats()
+    stats.reset("bfs")
+    stats.pushes, stats.pops, stats.peak_frontier, stats.path_length = 10, 8, 3, 5
+    print(stats)
+    print("Expected: bfs: 10 pushes, 8 pops, peak frontier 3, 0.00 ms " +
+          "(neighbors 0.00, queue 0.00, other 0.00), path length 5")
+    print(f"asDict keys: {sorted(stats.asDict())[:3]}")
+    print("Expected:    ['algorithm', 'neighbor_seconds', 'path_length']")
+
+if __name__ == "__main__":
+    main()
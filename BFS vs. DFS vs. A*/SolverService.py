@@ -0,0 +1,344 @@
+from __future__ import annotations
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable
+import asyncio
+import random
+import threading
+import time
+
+from Maze import Maze
+from Position import Position
+from BatchSolver import SearchCancelled, initBatchWorker, solveBatch
+
+# line protocol spoken by SolverService.handleLine (one request or reply per line):
+#   request: "<row>,<col> <row>,<col>"          the start and goal of a query
+#   replies: "path <row>,<col> <row>,<col> ..."  the cells of a shortest path
+#            "none"                              the goal cannot be reached
+#            "busy"                              too many searches are pending
+#            "cancelled"                         the search was cancelled
+#            "error <message>"                   the request was not understood
+
+################################################################################
+class ServiceBusy(Exception):
+    ''' raised by SolverService.solve, when told not to wait, if max_pending
+        searches are already queued or running '''
+
+################################################################################
+class _Computation:
+    ''' one search in flight, shared by every caller asking the same query
+        until it finishes; cancel is the event its search checks (see
+        BatchSolver.solve), set once no caller is waiting for it any more
+    '''
+    __slots__ = ('future', 'cancel', 'waiters')
+
+    def __init__(self, future: asyncio.Future, cancel: threading.Event):
+        self.future:  asyncio.Future  = future
+        self.cancel:  threading.Event = cancel
+        self.waiters: int             = 0
+
+################################################################################
+class SolverService:
+    ''' class answering shortest-path queries on one Maze for asyncio code
+        without blocking the event loop: each search runs on a bounded pool
+        of worker threads (or processes), each keeping one BatchSolver (see
+        Maze.batchSolver) whose scratch buffers it reuses for every search, so
+        concurrent searches never disturb each other or the Maze's cells;
+        queries with a blocked end, or whose ends are in different
+        components, are answered at once without a search; identical queries
+        asked while one is in flight share its search, at most max_pending
+        distinct searches are queued or running at once (solve waits for
+        room, or raises ServiceBusy), and a search nobody awaits any longer
+        is stopped at its next cancellation check; the Maze's layout must not change
+        while searches are in flight, and a process pool copies the layout
+        once, when the service starts, and can only cancel searches that have
+        not started yet
+    '''
+    __slots__ = ('_maze', '_workers', '_use_processes', '_executor', '_layout', '_local', '_num_cols',
+                 '_max_pending', '_slots', '_pending', 'searches', 'coalesced', 'cancelled')
+
+    def __init__(self, maze: Maze, workers: int = 4, max_pending: int = 64,
+                       use_processes: bool = False):
+        ''' initializer method for a SolverService object (see start)
+        Parameters:
+            maze:          the Maze whose queries to answer
+            workers:       number of worker threads or processes
+            max_pending:   most distinct searches queued or running at once
+            use_processes: whether to search in worker processes, which run
+                           in parallel, rather than in threads, which share
+                           the interpreter (but start at once and can stop a
+                           running search)
+        Raises:
+            ValueError if workers or max_pending is less than 1
+        '''
+        if workers < 1 or max_pending < 1:
+            raise ValueError("workers and max_pending must both be at least 1")
+        self._maze:          Maze = maze
+        self._workers:       int  = workers
+        self._use_processes: bool = use_processes
+        self._executor:      Executor | None = None
+        self._layout:        str | None = None   # fingerprint copied by a process pool
+        self._local:         threading.local = threading.local()   # each worker thread's solver
+        self._num_cols:      int = 0
+        self._max_pending:   int = max_pending
+        self._slots:         asyncio.Semaphore = asyncio.Semaphore(max_pending)
+        self._pending:       dict[tuple[str, Position, Position], _Computation] = {}
+        self.searches:       int = 0   # searches started
+        self.coalesced:      int = 0   # queries answered by another query's search
+        self.cancelled:      int = 0   # searches abandoned by every caller
+
+    def start(self) -> None:
+        ''' method to start the worker pool (done by async with, too), first
+            building the Maze's cached adjacency and component labels, so no
+            search pays for them (and none can be stuck building them when
+            cancelled)
+        '''
+        if self._executor is not None:
+            return
+        solver = self._maze.batchSolver()
+        self._num_cols = solver.num_cols
+        if self._use_processes:
+            self._layout = self._maze.fingerprint()
+            self._executor = ProcessPoolExecutor(max_workers = self._workers,
+                                                 initializer = initBatchWorker,
+                                                 initargs = (solver.num_cols, solver.offsets,
+                                                             solver.neighbors))
+        else:
+            self._executor = ThreadPoolExecutor(max_workers = self._workers,
+                                                thread_name_prefix = "maze-solver")
+
+    def close(self) -> None:
+        ''' method to stop the worker pool without waiting: every pending
+            search is cancelled, so its callers see CancelledError (or
+            SearchCancelled, if it had started)
+        '''
+        if self._executor is None:
+            return
+        for computation in list(self._pending.values()):
+            computation.cancel.set()
+            computation.future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait = False, cancel_futures = True)
+        self._executor = None
+
+    async def __aenter__(self) -> SolverService:
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def _layoutKey(self) -> str:
+        ''' returns the fingerprint of the layout a new search would use '''
+        return self._layout if self._use_processes else self._maze.fingerprint()
+
+    def _solveInThread(self, start: int, goal: int,
+                             cancelled: Callable[[], bool]) -> list[list[Position] | None]:
+        ''' runs one search on a worker thread, with the BatchSolver that
+            thread keeps (built on its first search, and again after the
+            layout changes), in the form solveBatch returns '''
+        layout = self._maze.fingerprint()
+        if getattr(self._local, "layout", None) != layout:
+            self._local.solver = self._maze.batchSolver()
+            self._local.layout = layout
+        solver = self._local.solver
+        return [solver.solve(start, goal, cancelled)]
+
+    def _submit(self, key: tuple[str, Position, Position],
+                      start: Position, goal: Position) -> _Computation:
+        ''' starts a search on the pool, holding a slot until it finishes '''
+        cancel = threading.Event()
+        cols = self._num_cols
+        start_idx, goal_idx = start.row * cols + start.col, goal.row * cols + goal.col
+        if self._use_processes:
+            job = self._executor.submit(solveBatch, [(start_idx, goal_idx)])
+        else:
+            job = self._executor.submit(self._solveInThread, start_idx, goal_idx, cancel.is_set)
+        # the slot is freed only when the worker is done, not when every caller
+        # gives up, so abandoned searches still count until they stop
+        loop = asyncio.get_running_loop()
+        job.add_done_callback(lambda _: loop.call_soon_threadsafe(self._slots.release))
+
+        computation = _Computation(asyncio.wrap_future(job), cancel)
+        computation.future.add_done_callback(lambda future: self._finished(key, computation, future))
+        self._pending[key] = computation
+        self.searches += 1
+        return computation
+
+    def _finished(self, key: tuple[str, Position, Position], computation: _Computation,
+                        future: asyncio.Future) -> None:
+        ''' forgets a finished search, so a later query starts a new one '''
+        if self._pending.get(key) is computation:
+            del self._pending[key]
+        if not future.cancelled():
+            future.exception()   # marks an abandoned search's error as seen
+
+    async def solve(self, start: Position, goal: Position,
+                          wait: bool = True) -> list[Position] | None:
+        ''' method to find a shortest path (in moves, as Maze.solveMany does)
+            without blocking the event loop; a query Maze.solveMany would
+            answer without searching is answered at once, in either mode;
+            cancelling the awaiting task stops the search too, unless another
+            caller is awaiting it
+        Parameters:
+            start: Position object indicating the (row,col) of the start cell
+            goal:  Position object indicating the (row,col) of the goal cell
+            wait:  whether to wait for room when max_pending searches are
+                   already pending, rather than raise ServiceBusy
+        Returns:
+            the list of Positions along a shortest path from start to goal
+            (both inclusive), or None if the goal cannot be reached
+        Raises:
+            RuntimeError    if the service has not been started
+            ValueError      if the row/col of start or goal is out of range
+            ServiceBusy     if wait is False and there is no room
+            SearchCancelled if the service was closed during the search
+        '''
+        if self._executor is None:
+            raise RuntimeError("the SolverService has not been started")
+        start, goal = Position(*start), Position(*goal)
+        if self._maze.unreachable(start, goal):
+            return None
+
+        key = (self._layoutKey(), start, goal)
+        computation = self._pending.get(key)
+        if computation is None:
+            if not wait and self._slots.locked():
+                raise ServiceBusy(f"{self._max_pending} searches are already pending")
+            await self._slots.acquire()
+            computation = self._pending.get(key)   # started by another caller meanwhile?
+            if computation is None:
+                computation = self._submit(key, start, goal)
+            else:
+                self._slots.release()
+                self.coalesced += 1
+        else:
+            self.coalesced += 1
+
+        computation.waiters += 1
+        try:
+            # shielded, so one caller giving up leaves the search to the others
+            return (await asyncio.shield(computation.future))[0]
+        except asyncio.CancelledError:
+            computation.waiters -= 1
+            if computation.waiters == 0 and not computation.future.done():
+                computation.cancel.set()
+                computation.future.cancel()
+                self.cancelled += 1
+            raise
+
+    async def handleLine(self, line: str, wait: bool = True) -> str:
+        ''' method to answer one request of the line protocol (see the top of
+            this file)
+        Parameters:
+            line: the request, with or without its newline
+            wait: as for solve
+        Returns:
+            the reply, without a newline
+        '''
+        try:
+            start, goal = (Position(*map(int, cell.split(","))) for cell in line.split())
+        except (TypeError, ValueError):
+            return f"error expected '<row>,<col> <row>,<col>', got {line.strip()!r}"
+        try:
+            path = await self.solve(start, goal, wait)
+        except ServiceBusy:
+            return "busy"
+        except SearchCancelled:
+            return "cancelled"
+        except ValueError as error:
+            return f"error {error}"
+        if path is None:
+            return "none"
+        return "path " + " ".join(f"{row},{col}" for row, col in path)
+
+    async def handleConnection(self, reader: asyncio.StreamReader,
+                                     writer: asyncio.StreamWriter) -> None:
+        ''' method to serve one connection, answering its requests in order;
+            pass it to asyncio.start_server to serve queries over a socket '''
+        try:
+            while line := await reader.readline():
+                writer.write((await self.handleLine(line.decode()) + "\n").encode())
+                await writer.drain()
+        finally:
+            writer.close()
+
+################################################################################
+class LocalClient:
+    ''' stand-in for a socket client, for testing a SolverService without a
+        server: each query is encoded in the line protocol and handed straight
+        to the service's handleLine, and the reply is decoded
+    '''
+    __slots__ = ('_service',)
+
+    def __init__(self, service: SolverService):
+        self._service: SolverService = service
+
+    async def query(self, start: Position, goal: Position,
+                          wait: bool = True) -> list[Position] | None:
+        ''' method to ask the service for a shortest path
+        Parameters:
+            start, goal: Position objects of the query (see SolverService.solve)
+            wait:        as for SolverService.solve
+        Returns:
+            the list of Positions along the path, or None if there is none
+        Raises:
+            ServiceBusy     if the service replied busy
+            SearchCancelled if the service replied cancelled
+            ValueError      if the service replied with an error
+        '''
+        reply = await self._service.handleLine(f"{start.row},{start.col} {goal.row},{goal.col}", wait)
+        kind, _, rest = reply.partition(" ")
+        if kind == "path":
+            return [Position(*map(int, cell.split(","))) for cell in rest.split()]
+        if kind == "none":
+            return None
+        if kind == "busy":
+            raise ServiceBusy("the service is busy")
+        if kind == "cancelled":
+            raise SearchCancelled("the service cancelled the search")
+        raise ValueError(rest)
+
+###################
+async def demo() -> None:
+    random.seed(8675309)
+    maze = Maze(30, 30, prop_blocked=0.20, compact=True)
+    start, goal = Position(0, 0), Position(29, 29)
+    async with SolverService(maze, workers=2) as service:
+        paths = await asyncio.gather(*(service.solve(start, goal) for _ in range(5)))
+        print(f"Five identical queries: {service.searches} search, {service.coalesced} coalesced " +
+              f"(Expected: 1 search, 4 coalesced)")
+        print(f"Path Length: {len(paths[0])} (Expected: 59, as for BFS with this seed in Maze.py)")
+
+        client = LocalClient(service)
+        path = await client.query(start, goal)
+        print(f"Local client Path Length: {len(path)} (Expected: 59)")
+        try:
+            await client.query(Position(0, 0), Position(30, 0))
+        except ValueError as error:
+            print(f"Out-of-range query: {error} (Expected: invalid (row,col) given for cell)")
+
+    # a big open maze, so a single search takes a while
+    open_maze = Maze(600, 600, prop_blocked=0.0, compact=True)
+    async with SolverService(open_maze, workers=1, max_pending=1) as service:
+        long_query = asyncio.create_task(service.solve(Position(0, 0), Position(599, 599)))
+        await asyncio.sleep(0.05)
+        try:
+            await service.solve(Position(0, 0), Position(300, 300), wait=False)
+        except ServiceBusy:
+            print("Second query while one is pending: busy (Expected: busy)")
+
+        began = time.perf_counter()
+        long_query.cancel()
+        try:
+            await long_query
+        except asyncio.CancelledError:
+            pass
+        path = await service.solve(Position(0, 0), Position(0, 5))   # waits for the slot
+        print(f"Cancelled searches: {service.cancelled} (Expected: 1), slot freed after " +
+              f"{(time.perf_counter() - began) * 1000:.0f} ms, next Path Length: {len(path)} (Expected: 6)")
+
+def main() -> None:
+    asyncio.run(demo())
+
+if __name__ == "__main__":
+    main()
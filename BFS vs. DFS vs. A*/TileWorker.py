@@ -0,0 +1,189 @@
+from __future__ import annotations
+from array import array
+from heapq import heappush, heappop
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+# distance of a cell no tile has reached yet (and, always, of a blocked cell)
+UNREACHED = 2 ** 31 - 1
+
+################################################################################
+class TileWorker:
+    ''' one process's handle on the grid of a parallel BFS (see
+        Maze.bfsParallel): the blocked flags (one byte per cell) and the
+        distance of every cell from the start (an int32 per cell) live in
+        shared memory, so every worker reads and writes the same arrays in
+        place, and the grid is cut into square tiles of tile_size cells a side
+    '''
+    __slots__ = ('_rows', '_cols', '_tile_size', '_memory', '_blocked', '_dist')
+
+    def __init__(self, rows: int, cols: int, tile_size: int,
+                       blocked_name: str, dist_name: str):
+        self._rows:      int = rows
+        self._cols:      int = cols
+        self._tile_size: int = tile_size
+        self._memory = [shared_memory.SharedMemory(name = blocked_name),
+                        shared_memory.SharedMemory(name = dist_name)]
+        self._blocked: memoryview = self._memory[0].buf
+        self._dist:    memoryview = self._memory[1].buf.cast('i')
+
+    def close(self) -> None:
+        ''' releases the views and detaches from the shared memory '''
+        self._blocked.release()
+        self._dist.release()
+        for memory in self._memory:
+            memory.close()
+
+    def relax(self, tile: tuple[int, int],
+                    seeds: list[tuple[int, int]]) -> list[tuple[int, int]]:
+        ''' brings the distances inside one tile up to date: every open cell
+            just outside the tile offers its neighbor inside one more than its
+            own distance, and a Dijkstra search confined to the tile spreads
+            whatever improves; only this tile's cells are written, and the
+            cells just outside it are only read, so tiles that share no edge
+            can be relaxed at the same time
+        Parameters:
+            tile:  (row, col) of the tile, counted in tiles
+            seeds: extra (distance, flat index) offers for cells in the tile
+        Returns:
+            the neighboring tiles that now have a better offer along their
+            shared edge, and so need relaxing again
+        '''
+        rows, cols, size = self._rows, self._cols, self._tile_size
+        blocked, dist = self._blocked, self._dist
+        tile_row, tile_col = tile
+        top, left = tile_row * size, tile_col * size
+        bottom, right = min(top + size, rows) - 1, min(left + size, cols) - 1
+
+        # each edge of the tile: the tile beyond it, the edge's cells, and
+        # the step from one of them to the cell beyond
+        edges = []
+        if top > 0:
+            edges.append(((tile_row - 1, tile_col), range(top * cols + left, top * cols + right + 1), -cols))
+        if bottom < rows - 1:
+            edges.append(((tile_row + 1, tile_col), range(bottom * cols + left, bottom * cols + right + 1), cols))
+        if left > 0:
+            edges.append(((tile_row, tile_col - 1), range(top * cols + left, bottom * cols + left + 1, cols), -1))
+        if right < cols - 1:
+            edges.append(((tile_row, tile_col + 1), range(top * cols + right, bottom * cols + right + 1, cols), 1))
+
+        heap = []
+        offers = list(seeds)
+        for _, cells, step in edges:
+            offers.extend((dist[cell + step] + 1, cell) for cell in cells
+                          if dist[cell + step] != UNREACHED)
+        for distance, cell in offers:
+            if distance < dist[cell] and not blocked[cell]:
+                dist[cell] = distance
+                heappush(heap, distance << 32 | cell)
+
+        while heap:
+            packed = heappop(heap)
+            distance, current = packed >> 32, packed & 0xFFFFFFFF
+            if distance != dist[current]:
+                continue   # outdated: the cell was improved again since
+            row, col = divmod(current, cols)
+            distance += 1
+            for neighbor, inside in ((current - cols, row > top), (current + cols, row < bottom),
+                                     (current - 1, col > left),   (current + 1, col < right)):
+                if inside and distance < dist[neighbor] and not blocked[neighbor]:
+                    dist[neighbor] = distance
+                    heappush(heap, distance << 32 | neighbor)
+
+        # a neighboring tile needs another pass if any cell along the shared
+        # edge now offers it better than what its adjacent cell holds
+        return [neighbor for neighbor, cells, step in edges
+                if any(dist[cell] != UNREACHED and dist[cell] + 1 < dist[cell + step]
+                       and not blocked[cell + step] for cell in cells)]
+
+# each pool worker attaches to the shared grid once, in initTileWorker
+_tile_worker: TileWorker = None
+
+def initTileWorker(rows: int, cols: int, tile_size: int, blocked_name: str, dist_name: str) -> None:
+    global _tile_worker
+    _tile_worker = TileWorker(rows, cols, tile_size, blocked_name, dist_name)
+
+def relaxTile(job: tuple[tuple[int, int], list[tuple[int, int]]]) -> list[tuple[int, int]]:
+    return _tile_worker.relax(*job)
+
+def tileDistances(rows: int, cols: int, blocked: bytes, start: int,
+                  processes: int, tile_size: int) -> array:
+    ''' function to find every cell's BFS distance from a start cell with
+        several processes at once: the blocked flags and a distance per cell
+        are put in shared memory that every worker maps (see TileWorker);
+        each round, the workers relax all the tiles with pending work, and
+        report which neighboring tiles they handed a better distance to;
+        those are the next round's tiles, until no tile has work left; since
+        the next round's tiles all border this round's, the tiles of a round
+        alternate colors like a checkerboard and never share an edge, so they
+        never write cells another is reading; tiles only trade edges once per
+        round rather than once per BFS level, so each trip to the pool buys
+        up to tile_size ** 2 cells of work
+    Parameters:
+        rows, cols: the grid's dimensions
+        blocked:    one byte per cell (indexed by row * cols + col), nonzero
+                    if the cell is blocked
+        start:      flat index of the (open) cell to measure from
+        processes:  the number of worker processes (1 or less relaxes the
+                    tiles in this process instead)
+        tile_size:  cells along each side of a tile
+    Returns:
+        an array('i') of every cell's number of moves from start, with
+        UNREACHED for cells that cannot be reached (including blocked cells)
+    '''
+    num_cells = rows * cols
+    blocked_memory = shared_memory.SharedMemory(create = True, size = num_cells)
+    dist_memory = shared_memory.SharedMemory(create = True, size = 4 * num_cells)
+    worker_args = (rows, cols, tile_size, blocked_memory.name, dist_memory.name)
+    worker = TileWorker(*worker_args)
+    pool = None
+    try:
+        blocked_memory.buf[:num_cells] = blocked
+        worker._dist[:] = array('i', [UNREACHED]) * num_cells
+        if processes > 1:
+            pool = ProcessPoolExecutor(max_workers = processes,
+                                       initializer = initTileWorker,
+                                       initargs = worker_args)
+
+        jobs = [((start // cols // tile_size, start % cols // tile_size), [(0, start)])]
+        while jobs:
+            if pool is None:
+                handed_to = [worker.relax(*job) for job in jobs]
+            else:
+                chunk_size = max(1, len(jobs) // (4 * processes))
+                handed_to = pool.map(relaxTile, jobs, chunksize = chunk_size)
+            jobs = [(tile, []) for tile in dict.fromkeys(tile for tiles in handed_to for tile in tiles)]
+
+        distances = array('i')
+        distances.frombytes(worker._dist.tobytes())
+        return distances
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        worker.close()
+        for memory in (blocked_memory, dist_memory):
+            memory.close()
+            memory.unlink()
+
+###################
+def main() -> None:
+    # 5x6, with a wall down column 2 but for a gap in the bottom row, cut
+    # into 2x2 tiles, so the distances must cross several tile edges:
+    #   | | |░| | | |
+    #   | | |░| | | |
+    #   | | |░| | | |
+    #   | | |░| | | |
+    #   | | | | | | |
+    rows, cols = 5, 6
+    blocked = bytearray(rows * cols)
+    for row in range(4):
+        blocked[row * cols + 2] = 1
+
+    distances = tileDistances(rows, cols, blocked, 0, processes = 1, tile_size = 2)
+    print(f"Distance to (0,5): {distances[5]} (Expected: 13, around the wall)")
+    print(f"Cells reached: {rows * cols - distances.tolist().count(UNREACHED)} (Expected: 26)")
+    in_parallel = tileDistances(rows, cols, blocked, 0, processes = 2, tile_size = 2)
+    print(f"Same distances with 2 processes? {in_parallel == distances} (Expected: True)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+'''
+Benchmark of UnrolledLinkedList against LinkedList (one item per Node) and
+collections.deque: for each container, times appending n items on the right,
+iterating over them, indexing at random positions, and popping them all from
+the left, and measures the peak memory of building the container of n items.
+
+Usage:
+    python Benchmark.py [--sizes 10000 100000 1000000] [--capacity 64] [--lookups 1000]
+'''
+
+from __future__ import annotations
+from collections import deque
+from typing import Callable
+from LinkedList import LinkedList
+from UnrolledLinkedList import UnrolledLinkedList
+import argparse
+import random
+import time
+import tracemalloc
+
+################################################################################
+def timed(operation: Callable[[], object]) -> float:
+    ''' returns the seconds a call of operation takes '''
+    began = time.perf_counter()
+    operation()
+    return time.perf_counter() - began
+
+def iterate(container: object) -> None:
+    ''' walks over every item in a container '''
+    if isinstance(container, LinkedList):
+        node = container._head   # LinkedList has no __iter__, so walk its Nodes
+        while node is not None:
+            _ = node.data
+            node = node.next
+    else:
+        for _ in container:
+            pass
+
+def benchmark(name: str, make: Callable[[], object], n: int,
+              lookups: list[int] | None) -> dict[str, float]:
+    ''' function to benchmark one kind of container holding n items
+    Parameters:
+        name:    the container's name, for the report
+        make:    function returning a new, empty container
+        n:       number of items
+        lookups: indices to read by [], or None if the container has no
+                 __getitem__
+    Returns:
+        a dict of the measurements: seconds per operation and KiB for the items
+    '''
+    def fill(container: object) -> None:
+        append = container.appendRight if hasattr(container, "appendRight") else container.append
+        for item in range(n):
+            append(item)
+
+    # memory is measured on a separate build, since tracing slows every allocation
+    tracemalloc.start()
+    fill(make())
+    kib = tracemalloc.get_traced_memory()[1] / 1024
+    tracemalloc.stop()
+
+    container = make()
+    seconds_append = timed(lambda: fill(container))
+    seconds_iterate = timed(lambda: iterate(container))
+    seconds_index = timed(lambda: [container[index] for index in lookups]) if lookups else float('nan')
+    pop = container.popLeft if hasattr(container, "popLeft") else container.popleft
+    seconds_pop = timed(lambda: [pop() for _ in range(n)])
+    return {"append": seconds_append, "iterate": seconds_iterate, "index": seconds_index,
+            "pop": seconds_pop, "kib": kib}
+
+###################
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "Benchmark UnrolledLinkedList")
+    parser.add_argument("--sizes", type = int, nargs = "+", default = [10_000, 100_000, 1_000_000])
+    parser.add_argument("--capacity", type = int, default = 64, help = "items per Chunk")
+    parser.add_argument("--lookups", type = int, default = 1000,
+                        help = "random indices read by [] (LinkedList has no [])")
+    args = parser.parse_args()
+
+    print(f"{'container':<22} {'n':>9} {'append ms':>10} {'iterate ms':>11} " +
+          f"{'index ms':>9} {'popLeft ms':>11} {'memory KiB':>11}")
+    for n in args.sizes:
+        lookups = [random.randrange(n) for _ in range(args.lookups)]
+        for name, make, indexable in (("LinkedList", LinkedList, False),
+                                      (f"UnrolledLinkedList({args.capacity})",
+                                       lambda: UnrolledLinkedList(args.capacity), True),
+                                      ("collections.deque", deque, True)):
+            result = benchmark(name, make, n, lookups if indexable else None)
+            print(f"{name:<22} {n:>9} {result['append'] * 1000:>10.1f} " +
+                  f"{result['iterate'] * 1000:>11.1f} {result['index'] * 1000:>9.1f} " +
+                  f"{result['pop'] * 1000:>11.1f} {result['kib']:>11.0f}")
+
+if __name__ == "__main__":
+    main()
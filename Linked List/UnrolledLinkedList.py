@@ -0,0 +1,287 @@
+from __future__ import annotations
+from typing import Iterable, Iterator
+from itertools import chain
+from LinkedList import EmptyError
+
+######################################################################
+class Chunk[T]:
+    ''' class to represent a node in an unrolled linked list: a fixed-capacity
+        array of items, of which only items[start:stop] are in use, so items
+        can be added or removed at either end of the chunk without shifting
+    '''
+    __slots__ = ('items', 'start', 'stop', 'prev', 'next')
+
+    def __init__(self, capacity: int, start: int):
+        self.items: list[T | None] = [None] * capacity
+        self.start: int      = start  # index of the first item in use
+        self.stop:  int      = start  # index just past the last item in use
+        self.prev:  Chunk[T] = None   # pointer to the previous Chunk in the list
+        self.next:  Chunk[T] = None   # pointer to the next Chunk in the list
+
+######################################################################
+class UnrolledLinkedList[T]:
+    ''' class to implement an unrolled doubly-linked list: the same deque-like
+        API as LinkedList, but each node (a Chunk) holds up to capacity items,
+        so the per-item cost is one array slot rather than a whole Node with
+        three pointers, and iterating walks through arrays rather than from
+        node to node
+    '''
+    __slots__ = ('_head', '_tail', '_size', '_capacity')
+
+    def __init__(self, capacity: int = 64) -> None:
+        ''' initializer method for an UnrolledLinkedList object
+        Parameters:
+            capacity: the most items each Chunk holds
+        Raises:
+            ValueError if capacity is less than 1
+        '''
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        self._head:     Chunk[T] = None   # the first Chunk, holding the front item
+        self._tail:     Chunk[T] = None   # the last Chunk, holding the back item
+        self._size:     int      = 0      # number of entries in the list
+        self._capacity: int      = capacity
+
+    def __len__(self) -> int:
+        ''' returns the number of entries in the linked list
+        Returns:
+            integer valued number of list entries
+        '''
+        return self._size
+
+    def front(self) -> T:
+        ''' method to return the data item at the front of the list without
+            removing it
+        Returns:
+            the T-valued item at the front of the list
+        Raises:
+            EmptyError if the list is empty
+        '''
+        if self._head is None:
+            raise EmptyError('Linked List is empty')
+        return self._head.items[self._head.start]
+
+    def back(self) -> T:
+        ''' method to return the data item at the end of the list without
+            removing it
+        Returns:
+            the T-valued item at the end of the list
+        Raises:
+            EmptyError if the list is empty
+        '''
+        if self._tail is None:
+            raise EmptyError('Linked List is empty')
+        return self._tail.items[self._tail.stop - 1]
+
+    def _checkType(self, item: T) -> None:
+        ''' raises TypeError if the list is non-empty and item's type does not
+            match its entries' '''
+        if self._head is not None and not isinstance(item, type(self.front())):
+            raise TypeError('Cannot append a different datatype to what is already in the list')
+
+    def appendLeft(self, item: T) -> None:
+        ''' adds the given T-type data item to the left of the linked list,
+            in the first Chunk if it has room, else in a new one
+        Parameters:
+            item: a type T data item to be inserted
+        Raises:
+            TypeError if non-empty list and item type does not match list entry types
+        '''
+        self._checkType(item)
+        head = self._head
+        if head is None or head.start == 0:
+            # a new Chunk fills from its right end, leaving room for more appendLefts
+            head = Chunk(self._capacity, self._capacity)
+            head.next = self._head
+            if self._head is None:
+                self._tail = head
+            else:
+                self._head.prev = head
+            self._head = head
+        head.start -= 1
+        head.items[head.start] = item
+        self._size += 1
+
+    def appendRight(self, item: T) -> None:
+        ''' adds the given T-type data item to the right of the linked list,
+            in the last Chunk if it has room, else in a new one
+        Parameters:
+            item: a type T data item to be inserted
+        Raises:
+            TypeError if non-empty list and item type does not match list entry types
+        '''
+        self._checkType(item)
+        tail = self._tail
+        if tail is None or tail.stop == self._capacity:
+            tail = self._newTail()
+        tail.items[tail.stop] = item
+        tail.stop += 1
+        self._size += 1
+
+    def _newTail(self) -> Chunk[T]:
+        ''' links a new, empty Chunk to the right of the list and returns it '''
+        tail = Chunk(self._capacity, 0)
+        tail.prev = self._tail
+        if self._tail is None:
+            self._head = tail
+        else:
+            self._tail.next = tail
+        self._tail = tail
+        return tail
+
+    def extend(self, items: Iterable[T]) -> None:
+        ''' adds the given items to the right of the linked list, in order,
+            copying them into the Chunks a slice at a time
+        Parameters:
+            items: an iterable of type T data items
+        Raises:
+            TypeError if any item's type does not match the list entry types
+                (or, for an empty list, the first item's type), in which case
+                none are added
+        '''
+        items = list(items)
+        if not items:
+            return
+        kind = type(self.front()) if self._head is not None else type(items[0])
+        if not all(isinstance(item, kind) for item in items):
+            raise TypeError('Cannot append a different datatype to what is already in the list')
+
+        done = 0
+        while done < len(items):
+            tail = self._tail
+            if tail is None or tail.stop == self._capacity:
+                tail = self._newTail()
+            count = min(self._capacity - tail.stop, len(items) - done)
+            tail.items[tail.stop:tail.stop + count] = items[done:done + count]
+            tail.stop += count
+            done += count
+        self._size += len(items)
+
+    def popLeft(self) -> T:
+        ''' removes the first item in the linked list, unlinking its Chunk if
+            that leaves the Chunk empty
+        Returns:
+            the T type data item removed
+        Raises:
+            EmptyError exception if list is empty
+        '''
+        head = self._head
+        if head is None:
+            raise EmptyError("Can't pop from an empty list")
+
+        pop_data = head.items[head.start]
+        head.items[head.start] = None   # so the Chunk keeps no popped item alive
+        head.start += 1
+        if head.start == head.stop:
+            self._head = head.next
+            if self._head is not None:
+                self._head.prev = None
+            else:
+                self._tail = None
+        self._size -= 1
+        return pop_data
+
+    def popRight(self) -> T:
+        ''' removes the last item in the linked list, unlinking its Chunk if
+            that leaves the Chunk empty
+        Returns:
+            the T type data item removed
+        Raises:
+            EmptyError exception if list is empty
+        '''
+        tail = self._tail
+        if tail is None:
+            raise EmptyError("Can't pop from an empty list")
+
+        tail.stop -= 1
+        pop_data = tail.items[tail.stop]
+        tail.items[tail.stop] = None
+        if tail.start == tail.stop:
+            self._tail = tail.prev
+            if self._tail is not None:
+                self._tail.next = None
+            else:
+                self._head = None
+        self._size -= 1
+        return pop_data
+
+    def __iter__(self) -> Iterator[T]:
+        ''' iterates over the items from front to back; only moving from one
+            Chunk to the next runs Python code, while each Chunk's slice of
+            items is iterated over by chain itself
+        '''
+        return chain.from_iterable(self._chunkSlices())
+
+    def _chunkSlices(self) -> Iterator[list[T]]:
+        ''' yields a copy of each Chunk's items in use, from front to back '''
+        chunk = self._head
+        while chunk is not None:
+            yield chunk.items[chunk.start:chunk.stop]
+            chunk = chunk.next
+
+    def __getitem__(self, index: int) -> T:
+        ''' returns the item at a given position (negative counting from the
+            back), skipping whole Chunks by their lengths from whichever end
+            of the list is nearer
+        Raises:
+            IndexError if index is out of range
+        '''
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('linked list index out of range')
+
+        if index < self._size // 2:
+            chunk = self._head
+            while index >= chunk.stop - chunk.start:
+                index -= chunk.stop - chunk.start
+                chunk = chunk.next
+            return chunk.items[chunk.start + index]
+        index = self._size - 1 - index   # now counting back from the end
+        chunk = self._tail
+        while index >= chunk.stop - chunk.start:
+            index -= chunk.stop - chunk.start
+            chunk = chunk.prev
+        return chunk.items[chunk.stop - 1 - index]
+
+    def __str__(self):
+        ''' a str representation of the linked list data
+        Returns:
+            str representation of the linked list, showing head and tail
+            pointers and list data items (as for LinkedList)
+        '''
+        return "head->" + "<->".join("[" + repr(item) + "]" for item in self) + "<-tail"
+
+###################
+def main() -> None:
+    ul = UnrolledLinkedList[int](capacity = 4)
+    print(f"Empty list: {ul}")
+    print(f"  Expected: head-><-tail\n")
+
+    ul.extend(range(10))
+    ul.appendLeft(-1)
+    ul.appendRight(10)
+    print(f"  Actual: {ul}")
+    print(f"Expected: head->[-1]<->[0]<->[1]<->[2]<->[3]<->[4]<->[5]<->[6]<->[7]<->[8]<->[9]<->[10]<-tail")
+    print(f"  Length: {len(ul)}")
+    print(f"Expected: 12\n")
+
+    print(f"Items 0, 5, -1, -6: {ul[0]}, {ul[5]}, {ul[-1]}, {ul[-6]}")
+    print(f"          Expected: -1, 4, 10, 5\n")
+
+    print(f"popLeft x2: {ul.popLeft()}, {ul.popLeft()} | popRight x2: {ul.popRight()}, {ul.popRight()}")
+    print(f"  Expected: -1, 0 | popRight x2: 10, 9")
+    print(f"front, back: {ul.front()}, {ul.back()}")
+    print(f"   Expected: 1, 8\n")
+
+    try:
+        ul.appendRight("eleven")
+    except TypeError:
+        print("Appending a str to an int list: TypeError (Expected: TypeError)")
+    try:
+        UnrolledLinkedList[int]().popLeft()
+    except EmptyError as error:
+        print(f"popLeft on an empty list: EmptyError (Expected: EmptyError)")
+
+if __name__ == "__main__":
+    main()